@@ -2,6 +2,9 @@
 aurora_ai - A flexible agent framework for LLM-powered applications
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 # Models package - Agent framework components
 from .models import (
     Agent,
@@ -10,6 +13,7 @@ from .models import (
     AgentType,
     ReasoningPattern,
     DocumentType,
+    DocumentChunk,
     MessageType,
     SystemMessage,
     UserMessage,
@@ -24,8 +28,8 @@ from .models import (
 
 from .builder.agent_builder import AgentBuilder
 
-# LLM package - Language model integrations
-from .llm import BaseLLM, Anthropic, OpenAI, OllamaLLM, Gemini, OpenAIVLLM
+# LLM package - Language model integrations (providers are loaded lazily below)
+from .llm import BaseLLM
 
 # Tool package - Tool framework components
 from .tool import Tool, ToolExecutionError, aurora_tool, create_tool_from_function
@@ -57,8 +61,36 @@ from .telemetry import (
     get_tracer,
     get_meter,
     FloTelemetry,
+    TailSamplingPolicy,
 )
 
+if TYPE_CHECKING:
+    from .llm import Anthropic, OpenAI, OllamaLLM, Gemini, OpenAIVLLM
+
+# Attributes imported on first access (PEP 562): each provider pulls in its SDK,
+# which dominates import time, so a service only pays for the ones it uses
+_LAZY_ATTRIBUTES = {
+    'Anthropic': '.llm',
+    'OpenAI': '.llm',
+    'OllamaLLM': '.llm',
+    'Gemini': '.llm',
+    'OpenAIVLLM': '.llm',
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __all__ = [
     # Models
     'Agent',
@@ -89,6 +121,7 @@ __all__ = [
     'OpenAIVLLM',
     # LLM DataClass
     'DocumentType',
+    'DocumentChunk',
     # Tools
     'Tool',
     'ToolExecutionError',
@@ -117,6 +150,7 @@ __all__ = [
     'get_tracer',
     'get_meter',
     'FloTelemetry',
+    'TailSamplingPolicy',
 ]
 
 __version__ = '1.0.0'
@@ -3,7 +3,22 @@ from .base import Baseaurora
 from .builder import auroraBuilder, create_aurora
 from .memory import MessageMemory, BaseMemory, MessageMemoryItem
 from .models import StartNode, EndNode, Edge
-from .events import auroraEventType, auroraEvent, default_event_callback
+from .events import (
+    auroraEventType,
+    auroraEvent,
+    auroraEventBus,
+    OverflowPolicy,
+    default_event_callback,
+)
+from .node_cache import (
+    NodeResultCache,
+    NodeCachePolicy,
+    NodeCacheBackend,
+    InMemoryNodeCache,
+    SQLiteNodeCache,
+)
+from .run_record import RunRecord
+from aurora_ai.utils.usage import NodeUsage, RunReport
 from .llm_router import (
     BaseLLMRouter,
     SmartRouter,
@@ -27,7 +42,19 @@ __all__ = [
     # Event system
     'auroraEventType',
     'auroraEvent',
+    'auroraEventBus',
+    'OverflowPolicy',
     'default_event_callback',
+    # Node result caching
+    'NodeResultCache',
+    'NodeCachePolicy',
+    'NodeCacheBackend',
+    'InMemoryNodeCache',
+    'SQLiteNodeCache',
+    'RunRecord',
+    # Per-node usage accounting
+    'NodeUsage',
+    'RunReport',
     # LLM Router functionality
     'BaseLLMRouter',
     'SmartRouter',
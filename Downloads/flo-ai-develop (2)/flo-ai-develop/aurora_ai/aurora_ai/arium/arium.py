@@ -1,12 +1,16 @@
 from .base import Baseaurora
 from .memory import MessageMemory, BaseMemory, MessageMemoryItem
 from aurora_ai.models import BaseMessage, UserMessage, TextMessageContent
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from aurora_ai.models.agent import Agent
 from .models import StartNode, EndNode
-from .events import auroraEventType, auroraEvent
-from .nodes import auroraNode, ForEachNode, FunctionNode
+from .events import EVENT_BITS, auroraEventBus, auroraEventType, auroraEvent
+from .nodes import auroraNode, ForEachNode, FunctionNode, MapReduceNode
+from .node_cache import NodeResultCache, node_key
+from .run_record import RunRecord
+from aurora_ai.utils.deadline import deadline_scope
 from aurora_ai.utils.logger import logger
+from aurora_ai.utils.usage import NodeUsage, RunReport, usage_scope
 from aurora_ai.utils.variable_extractor import (
     extract_variables_from_inputs,
     extract_agent_variables,
@@ -14,17 +18,50 @@ from aurora_ai.utils.variable_extractor import (
     resolve_variables,
 )
 from aurora_ai.telemetry.instrumentation import workflow_metrics
-from aurora_ai.telemetry import get_tracer
+from aurora_ai.telemetry import get_tracer, record_details
 from opentelemetry.trace import Status, StatusCode
 import asyncio
 import time
 
 
+class _Run:
+    """State of one workflow run, passed down so that overlapping runs stay apart"""
+
+    __slots__ = ('events', 'report', 'record', 'previous')
+
+    def __init__(
+        self,
+        events: Optional[auroraEventBus] = None,
+        record: Optional[RunRecord] = None,
+        previous: Optional[RunRecord] = None,
+    ):
+        # Subscribers of this run only, next to the workflow's lasting `events`
+        self.events = events
+        self.report = RunReport()
+        self.record = record
+        self.previous = previous
+
+
 class aurora(Baseaurora):
-    def __init__(self, memory: BaseMemory):
+    def __init__(
+        self, memory: BaseMemory, node_cache: Optional[NodeResultCache] = None
+    ):
+        """
+        Args:
+            memory: Memory shared by the nodes during a run
+            node_cache: Optional cache for results of deterministic nodes; only
+                nodes with a policy in the cache are memoized
+        """
         super().__init__()
         self.is_compiled = False
         self.memory = memory if memory else MessageMemory()
+        self.node_cache = node_cache
+        # Subscribers to workflow events, kept across runs
+        self.events = auroraEventBus()
+        # Node inputs/outputs of the latest run, when it was recorded
+        self.last_run: Optional[RunRecord] = None
+        # Per-node resource usage of the latest run
+        self.last_report: Optional[RunReport] = None
 
     def compile(self):
         self.validate_graph()
@@ -36,6 +73,10 @@ class aurora(Baseaurora):
         variables: Optional[Dict[str, Any]] = None,
         event_callback: Optional[Callable[[auroraEvent], None]] = None,
         events_filter: Optional[List[auroraEventType]] = None,
+        timeout: Optional[float] = None,
+        previous_run: Optional[RunRecord] = None,
+        record_run: bool = False,
+        return_report: bool = False,
     ):
         """
         Execute the aurora workflow with optional event monitoring.
@@ -43,12 +84,46 @@ class aurora(Baseaurora):
         Args:
             inputs: Input messages for the workflow
             variables: Variable substitutions for templated prompts
-            event_callback: Function to call for each event (if None, no events are emitted)
-            events_filter: List of event types to listen for (defaults to all)
+            event_callback: Function to call for each event of this run; coroutine
+                functions are dispatched off the workflow's path. Subscribe to
+                ``events`` for callbacks that outlive a run.
+            events_filter: Event types passed to ``event_callback`` (defaults to all)
+            timeout: Optional deadline in seconds for the whole run. Tool calls
+                inside the workflow are limited to the time left, and the run is
+                cancelled with a TimeoutError once the deadline passes.
+            previous_run: Record of an earlier run (``last_run``). Nodes whose
+                configuration and filtered inputs are unchanged reuse their
+                recorded output instead of executing again.
+            record_run: Record node inputs/outputs of this run in ``last_run``;
+                implied by ``previous_run``. A failed run keeps the nodes that
+                completed, so re-running from it skips them.
+            return_report: Also return the run's ``RunReport`` with tokens, LLM
+                and tool calls, cache hits and waits per node. The report of
+                the latest run to start is also kept in ``last_report``.
 
         Returns:
-            List of workflow execution results
+            List of workflow execution results, or ``(results, report)`` when
+            ``return_report`` is set
         """
+        # The callback, report and record belong to this run only, even when
+        # runs overlap; `events` holds lasting subscribers
+        run = _Run(
+            record=RunRecord() if record_run or previous_run is not None else None,
+            previous=previous_run,
+        )
+        if event_callback:
+            run.events = auroraEventBus()
+            run.events.subscribe(event_callback, events_filter)
+        result = await self._run_workflow(inputs, variables, timeout, run)
+        return (result, run.report) if return_report else result
+
+    async def _run_workflow(
+        self,
+        inputs: List[BaseMessage] | str,
+        variables: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        run: _Run,
+    ):
         if isinstance(inputs, str):
             inputs = [UserMessage(content=resolve_variables(inputs, variables))]
 
@@ -61,12 +136,12 @@ class aurora(Baseaurora):
         if not self.nodes:
             raise ValueError('aurora has no nodes')
 
-        # Set default event filters to all event types if not specified
-        if events_filter is None:
-            events_filter = list(auroraEventType)
+        # Convenience copies for callers; the run itself uses `run`
+        self.last_run = run.record
+        self.last_report = run.report
 
         # Emit workflow started event
-        self._emit_event(auroraEventType.WORKFLOW_STARTED, event_callback, events_filter)
+        self._emit_event(run, auroraEventType.WORKFLOW_STARTED)
 
         # Get workflow name for telemetry
         workflow_name = getattr(self, 'name', 'unnamed_workflow')
@@ -92,8 +167,8 @@ class aurora(Baseaurora):
                     self._resolve_agent_prompts(variables)
 
                     # Execute the workflow with event support
-                    result = await self._execute_graph(
-                        resolved_inputs, event_callback, events_filter, variables
+                    result = await self._execute_graph_with_deadline(
+                        resolved_inputs, variables, timeout, run
                     )
 
                     # Record successful workflow execution
@@ -104,14 +179,13 @@ class aurora(Baseaurora):
                     )
 
                     workflow_span.set_status(Status(StatusCode.OK))
-                    workflow_span.set_attribute(
-                        'workflow.result.length', len(str(result))
-                    )
+                    if record_details(workflow_span):
+                        workflow_span.set_attribute(
+                            'workflow.result.length', len(str(result))
+                        )
 
                     # Emit workflow completed event
-                    self._emit_event(
-                        auroraEventType.WORKFLOW_COMPLETED, event_callback, events_filter
-                    )
+                    self._emit_event(run, auroraEventType.WORKFLOW_COMPLETED)
 
                     self.memory = MessageMemory()  # cleanup the graph
 
@@ -133,9 +207,8 @@ class aurora(Baseaurora):
 
                     # Emit workflow failed event
                     self._emit_event(
+                        run,
                         auroraEventType.WORKFLOW_FAILED,
-                        event_callback,
-                        events_filter,
                         error=str(e),
                     )
                     raise
@@ -150,14 +223,12 @@ class aurora(Baseaurora):
                 self._resolve_agent_prompts(variables)
 
                 # Execute the workflow with event support
-                result = await self._execute_graph(
-                    resolved_inputs, event_callback, events_filter, variables
+                result = await self._execute_graph_with_deadline(
+                    resolved_inputs, variables, timeout, run
                 )
 
                 # Emit workflow completed event
-                self._emit_event(
-                    auroraEventType.WORKFLOW_COMPLETED, event_callback, events_filter
-                )
+                self._emit_event(run, auroraEventType.WORKFLOW_COMPLETED)
 
                 self.memory = MessageMemory()  # cleanup the graph
 
@@ -166,39 +237,85 @@ class aurora(Baseaurora):
             except Exception as e:
                 # Emit workflow failed event
                 self._emit_event(
+                    run,
                     auroraEventType.WORKFLOW_FAILED,
-                    event_callback,
-                    events_filter,
                     error=str(e),
                 )
                 raise
 
     def _emit_event(
         self,
+        run: _Run,
         event_type: auroraEventType,
-        callback: Optional[Callable[[auroraEvent], None]],
-        events_filter: Optional[List[auroraEventType]],
-        **kwargs,
+        node_name: Optional[str] = None,
+        node_type: Optional[str] = None,
+        execution_time: Optional[float] = None,
+        error: Optional[str] = None,
+        router_choice: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        usage: Optional[NodeUsage] = None,
     ) -> None:
         """
-        Emit an event if callback is provided and event type is in filtered list.
+        Publish an event to the subscribers of its type.
+
+        Event data is passed as explicit arguments rather than ``**kwargs`` so
+        that nothing is allocated when nobody subscribed to the event type.
 
         Args:
+            run: The run the event belongs to
             event_type: The type of event to emit
-            callback: Function to call with the event (if None, no event is emitted)
-            events_filter: List of event types to listen for
-            **kwargs: Additional event data (node_name, error, etc.)
+            node_name, node_type, execution_time, error, router_choice, metadata,
+            usage: Event data, see auroraEvent
         """
-        if callback and event_type in events_filter:
-            event = auroraEvent(event_type=event_type, timestamp=time.time(), **kwargs)
-            callback(event)
+        bit = EVENT_BITS[event_type]
+        for_workflow = self.events.mask & bit
+        for_run = run.events is not None and run.events.mask & bit
+        if not (for_workflow or for_run):
+            return
+        event = auroraEvent(
+            event_type=event_type,
+            timestamp=time.time(),
+            node_name=node_name,
+            node_type=node_type,
+            execution_time=execution_time,
+            error=error,
+            router_choice=router_choice,
+            metadata=metadata,
+            usage=usage,
+        )
+        if for_workflow:
+            self.events.publish(event)
+        if for_run:
+            run.events.publish(event)
+
+    async def _execute_graph_with_deadline(
+        self,
+        inputs: List[BaseMessage],
+        variables: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        run: _Run,
+    ):
+        if timeout is None:
+            return await self._execute_graph(inputs, variables, run)
+        # The deadline is set before the graph task is created so that every node
+        # and tool call inherits it
+        with deadline_scope(timeout):
+            try:
+                return await asyncio.wait_for(
+                    self._execute_graph(inputs, variables, run),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                workflow_name = getattr(self, 'name', 'unnamed_workflow')
+                raise TimeoutError(
+                    f'Workflow {workflow_name} exceeded its {timeout}s deadline'
+                ) from None
 
     async def _execute_graph(
         self,
         inputs: List[BaseMessage],
-        event_callback: Optional[Callable[[auroraEvent], None]] = None,
-        events_filter: Optional[List[auroraEventType]] = None,
-        variables: Optional[Dict[str, Any]] = None,
+        variables: Optional[Dict[str, Any]],
+        run: _Run,
     ):
         [
             self.memory.add(MessageMemoryItem(node='input', occurrence=0, result=msg))
@@ -245,9 +362,12 @@ class aurora(Baseaurora):
                 f'Executing node: {current_node.name} (iteration {iteration_count})'
             )
             # execute current node
-            result = await self._execute_node(
-                current_node, event_callback, events_filter, variables
-            )
+            result = await self._execute_node(current_node, variables, run)
+
+            # Back-pressure from event subscribers that must not drop events
+            for events in (self.events, run.events):
+                if events is not None and events.backlogged:
+                    await events.wait_for_capacity()
 
             if isinstance(result, List):  # for each node will give results array
                 self._add_to_memory(
@@ -286,18 +406,16 @@ class aurora(Baseaurora):
 
             # Emit router decision event
             self._emit_event(
+                run,
                 auroraEventType.ROUTER_DECISION,
-                event_callback,
-                events_filter,
                 node_name=current_node.name,
                 router_choice=next_node_name,
             )
 
             # Emit edge traversed event
             self._emit_event(
+                run,
                 auroraEventType.EDGE_TRAVERSED,
-                event_callback,
-                events_filter,
                 node_name=current_node.name,
             )
 
@@ -400,18 +518,23 @@ class aurora(Baseaurora):
 
     async def _execute_node(
         self,
-        node: Agent | FunctionNode | ForEachNode | auroraNode | StartNode | EndNode,
-        event_callback: Optional[Callable[[auroraEvent], None]] = None,
-        events_filter: Optional[List[auroraEventType]] = None,
-        variables: Optional[Dict[str, Any]] = None,
+        node: Agent
+        | FunctionNode
+        | ForEachNode
+        | MapReduceNode
+        | auroraNode
+        | StartNode
+        | EndNode,
+        variables: Optional[Dict[str, Any]],
+        run: _Run,
     ):
         """
-        Execute a single node with optional event emission.
+        Execute a single node, publishing its events on the event bus.
 
         Args:
             node: The node to execute
-            event_callback: Function to call for events (if None, no events are emitted)
-            events_filter: List of event types to listen for
+            variables: Run variables
+            run: The run executing the node
 
         Returns:
             The result of node execution
@@ -423,6 +546,8 @@ class aurora(Baseaurora):
             node_type = 'function'
         elif isinstance(node, ForEachNode):
             node_type = 'foreach'
+        elif isinstance(node, MapReduceNode):
+            node_type = 'map_reduce'
         elif isinstance(node, auroraNode):
             node_type = 'aurora'
         elif isinstance(node, StartNode):
@@ -434,9 +559,8 @@ class aurora(Baseaurora):
 
         # Emit node started event
         self._emit_event(
+            run,
             auroraEventType.NODE_STARTED,
-            event_callback,
-            events_filter,
             node_name=node.name,
             node_type=node_type,
         )
@@ -452,6 +576,10 @@ class aurora(Baseaurora):
             else self.memory.get()
         )
         inputs = [item.result for item in memory_items]
+        # Start and end nodes do no work and are left out of the run report
+        usage = (
+            None if node_type in ('start', 'end') else NodeUsage(node.name, node_type)
+        )
 
         if tracer and node_type not in ['start', 'end']:
             with tracer.start_as_current_span(
@@ -463,36 +591,16 @@ class aurora(Baseaurora):
                 },
             ) as node_span:
                 try:
-                    # Execute the node based on its type
-
-                    if isinstance(node, Agent):
-                        # Variables are already resolved, pass empty dict to avoid re-processing
-                        result = await node.run(inputs, variables={})
-                    elif isinstance(node, FunctionNode):
-                        result = await node.run(inputs, variables=None)
-                    elif isinstance(node, ForEachNode):
-                        foreach_results: List[
-                            MessageMemoryItem | BaseMessage
-                        ] = await node.run(
-                            inputs,
-                            variables=variables,
-                        )
-                        result = self._flatten_results(foreach_results)
-                    elif isinstance(node, auroraNode):
-                        # auroraNode execution
-                        aurora_result: List[MessageMemoryItem] = await node.run(
-                            inputs, variables=variables
+                    with usage_scope(usage):
+                        result, reused_from = await self._run_node_cached(
+                            node, inputs, variables, run
                         )
-                        result = self._flatten_results(aurora_result)
-                    elif isinstance(node, StartNode):
-                        result = None
-                    elif isinstance(node, EndNode):
-                        result = None
-                    else:
-                        result = None
 
                     # Calculate execution time
                     execution_time = time.time() - start_time
+                    self._report_usage(
+                        run, usage, execution_time, reused_from=reused_from
+                    )
                     execution_time_ms = execution_time * 1000
 
                     # Record node metrics
@@ -505,15 +613,17 @@ class aurora(Baseaurora):
 
                     node_span.set_status(Status(StatusCode.OK))
                     node_span.set_attribute('node.execution_time_ms', execution_time_ms)
+                    node_span.set_attribute('node.reused', reused_from is not None)
 
                     # Emit node completed event
                     self._emit_event(
+                        run,
                         auroraEventType.NODE_COMPLETED,
-                        event_callback,
-                        events_filter,
                         node_name=node.name,
                         node_type=node_type,
                         execution_time=execution_time,
+                        metadata={'reused_from': reused_from} if reused_from else None,
+                        usage=usage,
                     )
 
                     return result
@@ -521,6 +631,7 @@ class aurora(Baseaurora):
                 except Exception as e:
                     # Calculate execution time even on failure
                     execution_time = time.time() - start_time
+                    self._report_usage(run, usage, execution_time, status='error')
                     execution_time_ms = execution_time * 1000
                     error_type = type(e).__name__
 
@@ -538,13 +649,13 @@ class aurora(Baseaurora):
 
                     # Emit node failed event
                     self._emit_event(
+                        run,
                         auroraEventType.NODE_FAILED,
-                        event_callback,
-                        events_filter,
                         node_name=node.name,
                         node_type=node_type,
                         execution_time=execution_time,
                         error=str(e),
+                        usage=usage,
                     )
 
                     # Re-raise the exception
@@ -552,42 +663,24 @@ class aurora(Baseaurora):
         else:
             # No telemetry or start/end node, execute without tracing
             try:
-                # Execute the node based on its type
-                if isinstance(node, Agent):
-                    result = await node.run(inputs, variables={})
-                elif isinstance(node, FunctionNode):
-                    result = await node.run(inputs, variables=None)
-                elif isinstance(node, ForEachNode):
-                    foreach_results: List[
-                        MessageMemoryItem | BaseMessage
-                    ] = await node.run(
-                        inputs,
-                        variables=variables,
-                    )
-                    result = self._flatten_results(foreach_results)
-                elif isinstance(node, auroraNode):
-                    aurora_result: List[MessageMemoryItem] = await node.run(
-                        inputs, variables=variables
+                with usage_scope(usage):
+                    result, reused_from = await self._run_node_cached(
+                        node, inputs, variables, run
                     )
-                    result = self._flatten_results(aurora_result)
-                elif isinstance(node, StartNode):
-                    result = None
-                elif isinstance(node, EndNode):
-                    result = None
-                else:
-                    result = None
 
                 # Calculate execution time
                 execution_time = time.time() - start_time
+                self._report_usage(run, usage, execution_time, reused_from=reused_from)
 
                 # Emit node completed event
                 self._emit_event(
+                    run,
                     auroraEventType.NODE_COMPLETED,
-                    event_callback,
-                    events_filter,
                     node_name=node.name,
                     node_type=node_type,
                     execution_time=execution_time,
+                    metadata={'reused_from': reused_from} if reused_from else None,
+                    usage=usage,
                 )
 
                 return result
@@ -595,21 +688,129 @@ class aurora(Baseaurora):
             except Exception as e:
                 # Calculate execution time even on failure
                 execution_time = time.time() - start_time
+                self._report_usage(run, usage, execution_time, status='error')
 
                 # Emit node failed event
                 self._emit_event(
+                    run,
                     auroraEventType.NODE_FAILED,
-                    event_callback,
-                    events_filter,
                     node_name=node.name,
                     node_type=node_type,
                     execution_time=execution_time,
                     error=str(e),
+                    usage=usage,
                 )
 
                 # Re-raise the exception
                 raise e
 
+    def _report_usage(
+        self,
+        run: _Run,
+        usage: Optional[NodeUsage],
+        execution_time: float,
+        status: str = 'success',
+        reused_from: Optional[str] = None,
+    ) -> None:
+        """Complete a node's usage and add it to the run report"""
+        if usage is None:
+            return
+        usage.execution_time = execution_time
+        usage.status = status
+        if reused_from is not None:
+            usage.reused_from = reused_from
+            usage.cache_hits += 1
+        run.report.add(usage)
+
+    async def _run_node_cached(
+        self,
+        node: Agent
+        | FunctionNode
+        | ForEachNode
+        | MapReduceNode
+        | auroraNode
+        | StartNode
+        | EndNode,
+        inputs: List[BaseMessage],
+        variables: Optional[Dict[str, Any]],
+        run: _Run,
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Run a node, or reuse its output for identical inputs.
+
+        Returns:
+            The node result, and where it was reused from: 'previous_run',
+            'cache', or None when the node executed
+        """
+        if isinstance(node, (StartNode, EndNode)):
+            return None, None
+
+        record = run.record
+        policy = self.node_cache.policy_for(node) if self.node_cache else None
+        if record is None and policy is None:
+            return await self._run_node(node, inputs, variables), None
+
+        found, result, source = False, None, None
+        if record is not None:
+            key = node_key(node, inputs, variables)
+            visit = record.next_visit(node.name)
+            if run.previous is not None:
+                found, result = run.previous.get(node.name, visit, key)
+                source = 'previous_run' if found else None
+        if not found and policy is not None:
+            cache_key = self.node_cache.make_key(node, inputs, variables, policy)
+            found, result = self.node_cache.get(cache_key)
+            source = 'cache' if found else None
+
+        if found:
+            logger.info(f'Reusing result for node {node.name} from {source}')
+        else:
+            result = await self._run_node(node, inputs, variables)
+            # Only what goes into memory is kept: for list results (an agent's
+            # conversation, for-each outputs) that is the last item
+            stored = result[-1:] if isinstance(result, List) else result
+            if policy is not None:
+                self.node_cache.set(cache_key, stored, policy)
+
+        if record is not None:
+            (record.reused if found else record.executed).append(node.name)
+            record.add(node.name, visit, key, result if found else stored)
+        return result, source
+
+    async def _run_node(
+        self,
+        node: Agent
+        | FunctionNode
+        | ForEachNode
+        | MapReduceNode
+        | auroraNode
+        | StartNode
+        | EndNode,
+        inputs: List[BaseMessage],
+        variables: Optional[Dict[str, Any]],
+    ) -> Any:
+        """Execute the node based on its type"""
+        if isinstance(node, Agent):
+            # Variables are already resolved, pass empty dict to avoid re-processing
+            return await node.run(inputs, variables={})
+        elif isinstance(node, FunctionNode):
+            return await node.run(inputs, variables=None)
+        elif isinstance(node, ForEachNode):
+            foreach_results: List[MessageMemoryItem | BaseMessage] = await node.run(
+                inputs,
+                variables=variables,
+            )
+            return self._flatten_results(foreach_results)
+        elif isinstance(node, MapReduceNode):
+            return await node.run(inputs, variables=variables)
+        elif isinstance(node, auroraNode):
+            aurora_result: List[MessageMemoryItem] = await node.run(
+                inputs, variables=variables
+            )
+            return self._flatten_results(aurora_result)
+        # Start and end nodes produce no result
+        return None
+
     def _flatten_results(
         self, sequence: List[MessageMemoryItem | BaseMessage | str]
     ) -> List[BaseMessage | str]:
@@ -1,6 +1,6 @@
 import inspect
 from functools import partial
-from .nodes import auroraNode, ForEachNode
+from .nodes import auroraNode, ForEachNode, MapReduceNode
 from .protocols import ExecutableNode
 from aurora_ai.models.agent import Agent
 from aurora_ai.tool.base_tool import Tool
@@ -397,6 +397,8 @@ class Baseaurora:
             return 'tool'
         elif isinstance(node, ForEachNode):
             return 'foreach'
+        elif isinstance(node, MapReduceNode):
+            return 'map_reduce'
         elif isinstance(node, auroraNode):
             return 'aurora'
         else:
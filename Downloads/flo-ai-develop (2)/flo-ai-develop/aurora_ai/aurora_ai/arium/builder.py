@@ -2,7 +2,7 @@ from typing import List, Optional, Callable, Union, Dict, Any
 from .arium import aurora
 from .memory import MessageMemory, BaseMemory, MessageMemoryItem
 from .protocols import ExecutableNode
-from .nodes import auroraNode, ForEachNode
+from .nodes import auroraNode, ForEachNode, MapReduceNode
 from aurora_ai.models import BaseMessage, UserMessage
 from aurora_ai.models.agent import Agent, resolve_variables
 from aurora_ai.tool.base_tool import Tool
@@ -11,6 +11,8 @@ from aurora_ai.builder.agent_builder import AgentBuilder
 from aurora_ai.llm import BaseLLM
 from .llm_router import create_llm_router
 from .nodes import FunctionNode
+from aurora_ai.utils.executors import ExecutionPolicy
+from .node_cache import NodeResultCache, SQLiteNodeCache
 
 
 class auroraBuilder:
@@ -35,11 +37,13 @@ class auroraBuilder:
             auroraNode
         ] = []  # only those auroras which are part of main workflow
         self._foreach_nodes: List[ForEachNode] = []
+        self._map_reduce_nodes: List[MapReduceNode] = []
         self._start_node: Optional[ExecutableNode] = None
         self._end_nodes: List[ExecutableNode] = []
         self._function_nodes: List[FunctionNode] = []
         self._edges: List[tuple] = []  # (from_node, to_nodes, router)
         self._aurora: Optional[aurora] = None
+        self._node_cache: Optional[NodeResultCache] = None
         self._all_auroras: List[
             auroraNode
         ] = []  # all the auroras either of main workflow or when used as a node in foreachnode or any sub workflow
@@ -49,6 +53,21 @@ class auroraBuilder:
         self._memory = memory
         return self
 
+    def with_node_cache(self, node_cache: NodeResultCache) -> 'auroraBuilder':
+        """Set the cache used for results of deterministic nodes."""
+        self._node_cache = node_cache
+        return self
+
+    def cache_node(
+        self, node: ExecutableNode | str, ttl: Optional[float] = None, version: str = ''
+    ) -> 'auroraBuilder':
+        """Reuse a node's result when it runs again with identical inputs."""
+        if self._node_cache is None:
+            self._node_cache = NodeResultCache()
+        node_name = node if isinstance(node, str) else node.name
+        self._node_cache.enable(node_name, ttl=ttl, version=version)
+        return self
+
     def add_agent(self, agent: Agent) -> 'auroraBuilder':
         """Add an agent to the aurora."""
         self._agents.append(agent)
@@ -113,7 +132,11 @@ class auroraBuilder:
         if isinstance(execute_node, str):
             # Search across all node types
             all_nodes = (
-                self._agents + self._function_nodes + self._auroras + self._foreach_nodes
+                self._agents
+                + self._function_nodes
+                + self._auroras
+                + self._foreach_nodes
+                + self._map_reduce_nodes
             )
             resolved_node = next((n for n in all_nodes if n.name == execute_node), None)
             if not resolved_node:
@@ -128,12 +151,58 @@ class auroraBuilder:
                 self._all_auroras.append(execute_node)
         return self
 
+    def add_map_reduce(
+        self,
+        name: str,
+        map_node: Union[ExecutableNode, str],
+        reduce_node: Optional[Union[ExecutableNode, str]] = None,
+        **kwargs,
+    ) -> 'auroraBuilder':
+        """
+        Add a MapReduce node for documents larger than a model's context.
+
+        Args:
+            name: Name for the MapReduce node
+            map_node: Node run on each chunk (node object or name string)
+            reduce_node: Node combining partial results (node object or name string)
+            **kwargs: Chunking and concurrency options passed to MapReduceNode
+                (chunk_by, max_chunk_tokens, max_concurrency, reduce_fan_in)
+
+        Returns:
+            auroraBuilder: Self for method chaining
+        """
+        all_nodes = (
+            self._agents + self._function_nodes + self._auroras + self._foreach_nodes
+        )
+
+        def resolve(node: Union[ExecutableNode, str, None]):
+            if not isinstance(node, str):
+                return node
+            resolved_node = next((n for n in all_nodes if n.name == node), None)
+            if not resolved_node:
+                raise ValueError(f"Node '{node}' not found")
+            return resolved_node
+
+        self._map_reduce_nodes.append(
+            MapReduceNode(
+                name=name,
+                map_node=resolve(map_node),
+                reduce_node=resolve(reduce_node),
+                **kwargs,
+            )
+        )
+        return self
+
     def start_with(self, node: ExecutableNode | str) -> 'auroraBuilder':
         """Set the starting node for the aurora."""
         if isinstance(node, str):
             # Search across all node types
             all_nodes = (
-                self._agents + self._function_nodes + self._auroras + self._foreach_nodes
+                self._agents
+                + self._function_nodes
+                + self._auroras
+                + self._foreach_nodes
+                + self._map_reduce_nodes
             )
             resolved_node = next((n for n in all_nodes if n.name == node), None)
             if not resolved_node:
@@ -168,7 +237,11 @@ class auroraBuilder:
         if isinstance(from_node, str):
             # Search across all node types
             all_nodes = (
-                self._agents + self._function_nodes + self._auroras + self._foreach_nodes
+                self._agents
+                + self._function_nodes
+                + self._auroras
+                + self._foreach_nodes
+                + self._map_reduce_nodes
             )
             resolved_from_node = next(
                 (n for n in all_nodes if n.name == from_node), None
@@ -180,7 +253,11 @@ class auroraBuilder:
         if isinstance(to_node, str):
             # Search across all node types
             all_nodes = (
-                self._agents + self._function_nodes + self._auroras + self._foreach_nodes
+                self._agents
+                + self._function_nodes
+                + self._auroras
+                + self._foreach_nodes
+                + self._map_reduce_nodes
             )
             resolved_to_node = next((n for n in all_nodes if n.name == to_node), None)
             if not resolved_to_node:
@@ -196,7 +273,7 @@ class auroraBuilder:
             self._memory = MessageMemory()
 
         # Create aurora instance
-        aurora = aurora(self._memory)
+        aurora = aurora(self._memory, node_cache=self._node_cache)
 
         # Add all nodes
         all_nodes = []
@@ -204,6 +281,7 @@ class auroraBuilder:
         all_nodes.extend(self._function_nodes)
         all_nodes.extend(self._auroras)
         all_nodes.extend(self._foreach_nodes)
+        all_nodes.extend(self._map_reduce_nodes)
 
         if not all_nodes:
             raise ValueError('No agents or function nodes added to the aurora')
@@ -244,8 +322,12 @@ class auroraBuilder:
         self,
         inputs: List[BaseMessage] | str,
         variables: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> List[MessageMemoryItem]:
-        """Build the aurora and run it with the given inputs and optional runtime variables."""
+        """Build the aurora and run it with the given inputs and optional runtime variables.
+
+        ``timeout`` is an optional deadline in seconds for the whole run.
+        """
         aurora = self.build()
         new_inputs = []
         for input in inputs:
@@ -255,7 +337,7 @@ class auroraBuilder:
                 new_inputs.append(input)
             else:
                 raise ValueError(f'Invalid input type: {type(input)}')
-        return await aurora.run(new_inputs, variables=variables)
+        return await aurora.run(new_inputs, variables=variables, timeout=timeout)
 
     def visualize(
         self, output_path: str = 'aurora_graph.png', title: str = 'aurora Workflow'
@@ -274,10 +356,12 @@ class auroraBuilder:
         self._function_nodes = []
         self._auroras = []
         self._foreach_nodes = []
+        self._map_reduce_nodes = []
         self._start_node = None
         self._end_nodes = []
         self._edges = []
         self._aurora = None
+        self._node_cache = None
         return self
 
     @classmethod
@@ -353,6 +437,17 @@ class auroraBuilder:
                   prefilled_params:
                     param1: "value1"
                     param2: "value2"
+                  execution:  # Optional, for blocking functions
+                    pool: process  # thread (default), process or a registered pool
+                    max_concurrency: 2
+                    timeout: 60
+                  cache:  # Optional, reuse results for identical inputs
+                    ttl: 86400  # seconds, omit to keep until evicted
+                    version: "2"  # bump to invalidate after code changes
+
+              # Optional, store cached node results on disk (in memory by default)
+              node_cache:
+                path: ".aurora_cache.db"
               # LLM Router definitions (NEW)
               routers:
                 - name: content_router
@@ -524,6 +619,13 @@ class auroraBuilder:
             agents_dict[agent_name] = agent
             builder.add_agent(agent)
 
+        # Configure the node result cache, kept on disk if a path is given
+        node_cache_config = aurora_config.get('node_cache', None)
+        if node_cache_config and 'path' in node_cache_config:
+            builder.with_node_cache(
+                NodeResultCache(SQLiteNodeCache(node_cache_config['path']))
+            )
+
         # Process function nodes
         function_nodes_config = aurora_config.get('function_nodes', [])
         function_nodes_dict = {}
@@ -534,6 +636,7 @@ class auroraBuilder:
             prefilled_params = function_node_config.get('prefilled_params', None)
             description = function_node_config.get('description', None)
             input_filter = function_node_config.get('input_filter', None)
+            execution_config = function_node_config.get('execution', None)
             function = function_registry.get(function_name)
 
             if function is None:
@@ -549,11 +652,21 @@ class auroraBuilder:
                 function=function,
                 input_filter=input_filter,
                 prefilled_params=prefilled_params,
+                execution=ExecutionPolicy(**execution_config)
+                if execution_config
+                else None,
             )
 
             function_nodes_dict[function_node_name] = function_node
             builder.add_function_node(function_node)
 
+            # `cache: true` caches without expiry
+            cache_config = function_node_config.get('cache', None)
+            if cache_config is True:
+                cache_config = {}
+            if isinstance(cache_config, dict):
+                builder.cache_node(function_node, **cache_config)
+
         # Process LLM routers (if defined in YAML)
         routers_config = aurora_config.get('routers', [])
         yaml_routers = {}  # Store routers created from YAML config
@@ -952,7 +1065,7 @@ class auroraBuilder:
             # Convert agent_config to the format expected by FloYamlParser
             parser_config = {'agent': {'parser': agent_config['parser']}}
             parser = FloYamlParser.create(yaml_dict=parser_config)
-            output_schema = parser.get_format()
+            output_schema = parser.get_json_schema()
 
         agent = (
             AgentBuilder()
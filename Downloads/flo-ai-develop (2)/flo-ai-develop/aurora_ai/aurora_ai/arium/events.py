@@ -3,13 +3,22 @@ Event system for aurora workflow execution monitoring.
 
 This module provides event types and data structures for tracking workflow execution,
 including node starts/completions, router decisions, and workflow lifecycle events.
+
+Events are dispatched by an ``auroraEventBus``. Subscriptions are matched with
+a bitmask, so a workflow nobody listens to creates no events at all. Plain
+callbacks run inline; async callbacks get a bounded queue drained by their own
+task, so a slow subscriber (e.g. a websocket push) does not hold up the
+workflow unless its queue fills up under the ``block`` overflow policy.
 """
 
 from enum import Enum
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+import asyncio
 import time
 from aurora_ai.utils.logger import logger
+from aurora_ai.utils.usage import NodeUsage
 
 
 class auroraEventType(Enum):
@@ -39,6 +48,8 @@ class auroraEvent:
         error: Error message if the event represents a failure
         router_choice: The node chosen by a router decision
         metadata: Additional event-specific data
+        usage: Tokens, LLM and tool calls, cache hits and waits of the node,
+            on node completed and failed events
     """
 
     event_type: auroraEventType
@@ -49,6 +60,241 @@ class auroraEvent:
     error: Optional[str] = None
     router_choice: Optional[str] = None
     metadata: Optional[dict] = None
+    usage: Optional[NodeUsage] = None
+
+
+# One bit per event type, so subscriptions are matched with a single AND
+EVENT_BITS: Dict[auroraEventType, int] = {
+    event_type: 1 << index for index, event_type in enumerate(auroraEventType)
+}
+ALL_EVENTS = sum(EVENT_BITS.values())
+
+
+def event_mask(events: Optional[Iterable[auroraEventType]]) -> int:
+    """Bitmask for a collection of event types, all events for None"""
+    if events is None:
+        return ALL_EVENTS
+    mask = 0
+    for event_type in events:
+        mask |= EVENT_BITS[event_type]
+    return mask
+
+
+class OverflowPolicy(str, Enum):
+    """What happens when an async subscriber's queue is full"""
+
+    BLOCK = 'block'  # keep the event, the workflow waits at the next node
+    DROP_OLDEST = 'drop_oldest'
+    DROP_NEWEST = 'drop_newest'
+
+
+class Subscription:
+    """
+    A callback registered on an ``auroraEventBus``.
+
+    Attributes:
+        dropped: Events discarded by the overflow policy
+    """
+
+    def __init__(
+        self,
+        bus: 'auroraEventBus',
+        callback: Callable[[auroraEvent], None],
+        mask: int,
+        max_queue: int,
+        overflow: OverflowPolicy,
+    ):
+        self.bus = bus
+        self.callback = callback
+        self.mask = mask
+        self.is_async = asyncio.iscoroutinefunction(callback)
+        self.max_queue = max_queue
+        self.overflow = OverflowPolicy(overflow)
+        self.dropped = 0
+        self._queue: Deque[auroraEvent] = deque()
+        self._worker: Optional[asyncio.Task] = None
+        # Publishers waiting for room in a full ``block`` queue
+        self._space_waiters: List[asyncio.Future] = []
+
+    @property
+    def backlog(self) -> int:
+        """Events queued for an async subscriber"""
+        return len(self._queue)
+
+    @property
+    def pending(self) -> bool:
+        """Whether an async subscriber is still handling queued events"""
+        return self._worker is not None and not self._worker.done()
+
+    @property
+    def saturated(self) -> bool:
+        return (
+            self.overflow is OverflowPolicy.BLOCK and len(self._queue) >= self.max_queue
+        )
+
+    def deliver(self, event: auroraEvent) -> None:
+        if not self.is_async:
+            try:
+                self.callback(event)
+            except Exception as e:
+                logger.error(
+                    f'Event subscriber failed on {event.event_type.value}: {e}',
+                    exc_info=True,
+                )
+            return
+
+        if len(self._queue) >= self.max_queue:
+            if self.overflow is OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return
+            if self.overflow is OverflowPolicy.DROP_OLDEST:
+                self._queue.popleft()
+                self.dropped += 1
+        self._queue.append(event)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._queue:
+            event = self._queue.popleft()
+            self._notify_space()
+            try:
+                await self.callback(event)
+            except Exception as e:
+                logger.error(
+                    f'Event subscriber failed on {event.event_type.value}: {e}',
+                    exc_info=True,
+                )
+        self._notify_space()
+
+    def _notify_space(self) -> None:
+        if not self._space_waiters or self.saturated:
+            return
+        # Every waiter rechecks for room, so none is left waiting for a wake-up
+        waiters, self._space_waiters = self._space_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait_for_space(self) -> None:
+        """Wait until a ``block`` subscriber has room in its queue"""
+        while self.saturated:
+            waiter = asyncio.get_running_loop().create_future()
+            self._space_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._space_waiters:
+                    self._space_waiters.remove(waiter)
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled"""
+        while self.pending:
+            await asyncio.shield(self._worker)
+
+    def unsubscribe(self) -> None:
+        """Stop receiving events; events already queued are still delivered"""
+        self.bus.unsubscribe(self)
+
+
+class auroraEventBus:
+    """
+    Dispatches workflow events to any number of subscribers.
+
+    Example:
+        async def push(event):
+            await websocket.send_json({'type': event.event_type.value})
+
+        workflow.events.subscribe(
+            push, events=[auroraEventType.NODE_COMPLETED], max_queue=100
+        )
+
+    Attributes:
+        mask: Union of the subscribed event types; zero when nobody listens
+    """
+
+    def __init__(self):
+        self.mask = 0
+        # Tuples are replaced, never mutated, so publishing can iterate safely
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._blocking: Tuple[Subscription, ...] = ()
+        # Unsubscribed async subscribers that may still be handling events
+        self._retired: List[Subscription] = []
+
+    def subscribe(
+        self,
+        callback: Callable[[auroraEvent], None],
+        events: Optional[Iterable[auroraEventType]] = None,
+        max_queue: int = 1000,
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+    ) -> Subscription:
+        """
+        Register a callback for some or all event types.
+
+        Args:
+            callback: Function or coroutine function called with each event.
+                Coroutine functions are dispatched off the workflow's path.
+            events: Event types to receive, all of them by default
+            max_queue: Queue size for async callbacks
+            overflow: Policy when an async callback's queue is full
+        """
+        if max_queue < 1:
+            raise ValueError('max_queue must be at least 1')
+        subscription = Subscription(
+            self, callback, event_mask(events), max_queue, overflow
+        )
+        self._subscriptions = (*self._subscriptions, subscription)
+        self._refresh()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions = tuple(
+            s for s in self._subscriptions if s is not subscription
+        )
+        self._retired = [s for s in self._retired if s.pending]
+        if subscription.pending:
+            self._retired.append(subscription)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        mask = 0
+        for subscription in self._subscriptions:
+            mask |= subscription.mask
+        self.mask = mask
+        self._blocking = tuple(
+            s
+            for s in self._subscriptions
+            if s.is_async and s.overflow is OverflowPolicy.BLOCK
+        )
+
+    @property
+    def subscriptions(self) -> List[Subscription]:
+        return list(self._subscriptions)
+
+    def wants(self, event_type: auroraEventType) -> bool:
+        return bool(self.mask & EVENT_BITS[event_type])
+
+    def publish(self, event: auroraEvent) -> None:
+        bit = EVENT_BITS[event.event_type]
+        for subscription in self._subscriptions:
+            if subscription.mask & bit:
+                subscription.deliver(event)
+
+    @property
+    def backlogged(self) -> bool:
+        """Whether a ``block`` subscriber's queue is full"""
+        return any(s.saturated for s in self._blocking)
+
+    async def wait_for_capacity(self) -> None:
+        """Apply back-pressure: wait until ``block`` subscribers have room"""
+        for subscription in self._blocking:
+            await subscription.wait_for_space()
+
+    async def drain(self) -> None:
+        """Wait until all async subscribers have handled their queued events"""
+        retired, self._retired = self._retired, []
+        for subscription in (*retired, *self._subscriptions):
+            await subscription.drain()
 
 
 def default_event_callback(event: auroraEvent) -> None:
@@ -82,7 +328,12 @@ def default_event_callback(event: auroraEvent) -> None:
 
     elif event.event_type == auroraEventType.NODE_COMPLETED:
         duration = f' ({event.execution_time:.2f}s)' if event.execution_time else ''
-        logger.info(f'✅ [{timestamp}] Completed {event.node_name}{duration}')
+        tokens = (
+            f' [{event.usage.total_tokens} tokens]'
+            if event.usage and event.usage.total_tokens
+            else ''
+        )
+        logger.info(f'✅ [{timestamp}] Completed {event.node_name}{duration}{tokens}')
 
     elif event.event_type == auroraEventType.NODE_FAILED:
         logger.error(f'❌ [{timestamp}] Failed {event.node_name}: {event.error}')
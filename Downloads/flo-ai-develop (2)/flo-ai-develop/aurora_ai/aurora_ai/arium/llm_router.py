@@ -15,7 +15,6 @@ from .memory import (
     MessageMemoryItem,
 )
 from aurora_ai.llm.base_llm import BaseLLM
-from aurora_ai.llm import OpenAI
 from aurora_ai.utils.logger import logger
 
 
@@ -41,7 +40,11 @@ class BaseLLMRouter(ABC):
             max_retries: Maximum number of retries for LLM calls
             fallback_strategy: Strategy when LLM fails ("first", "last", "random")
         """
-        self.llm = llm or OpenAI(model='gpt-4o-mini', temperature=temperature)
+        if llm is None:
+            from aurora_ai.llm import OpenAI
+
+            llm = OpenAI(model='gpt-4o-mini', temperature=temperature)
+        self.llm = llm
         self.temperature = temperature
         self.max_retries = max_retries
         self.fallback_strategy = fallback_strategy
@@ -0,0 +1,309 @@
+"""
+Result caching for deterministic nodes of an aurora workflow.
+
+Nodes are cached opt-in, by name, through a ``NodeResultCache`` given to the
+workflow. A node's result is keyed by a fingerprint of the node's
+configuration (prompt, model and tools for agents; function code and prefilled
+parameters for function nodes; the wrapped nodes for composite nodes) together
+with the exact inputs it reads from memory and the run variables. When a later
+run reaches the node with the same key, the stored result is used and the node
+is not executed.
+
+Only the part of a result that goes into memory is stored, i.e. the last item
+of list results such as an agent's conversation. Results are pickled, so they
+are stored as copies and can be kept on disk with ``SQLiteNodeCache``; results
+that cannot be pickled are simply not cached.
+"""
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from aurora_ai.models.agent import Agent
+from aurora_ai.utils.logger import logger
+from .nodes import ForEachNode, FunctionNode, MapReduceNode, auroraNode
+
+
+@dataclass
+class NodeCachePolicy:
+    """
+    How the results of one node are cached.
+
+    Attributes:
+        ttl: Seconds a result stays valid, None to keep it until evicted
+        version: Bump to invalidate results after changes the fingerprint
+            cannot see, e.g. in code called by a function node
+    """
+
+    ttl: Optional[float] = None
+    version: str = ''
+
+    def __post_init__(self):
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError('Node cache ttl must be positive')
+
+
+class NodeCacheBackend(ABC):
+    """Storage for pickled node results"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value, or None if missing or expired"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryNodeCache(NodeCacheBackend):
+    """Process-local LRU backend"""
+
+    def __init__(self, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[Optional[float], bytes]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteNodeCache(NodeCacheBackend):
+    """
+    Backend persisting results in a SQLite file, so they survive restarts.
+
+    Expiry uses wall-clock time since entries outlive the process.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS node_cache ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)'
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, expires_at FROM node_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                with self._conn:
+                    self._conn.execute('DELETE FROM node_cache WHERE key = ?', (key,))
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO node_cache (key, value, expires_at) '
+                'VALUES (?, ?, ?)',
+                (key, value, expires_at),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM node_cache')
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class NodeResultCache:
+    """
+    Caches results of the nodes it has a policy for.
+
+    Args:
+        backend: Where results are stored, an ``InMemoryNodeCache`` by default
+        policies: Cache policy per node name; other nodes always execute
+
+    Attributes:
+        hits: Node executions skipped thanks to a cached result
+        misses: Executions of cached nodes that found no result
+    """
+
+    def __init__(
+        self,
+        backend: Optional[NodeCacheBackend] = None,
+        policies: Optional[Dict[str, NodeCachePolicy]] = None,
+    ):
+        self.backend = backend or InMemoryNodeCache()
+        self.policies: Dict[str, NodeCachePolicy] = dict(policies or {})
+        self.hits = 0
+        self.misses = 0
+
+    def enable(
+        self, node_name: str, ttl: Optional[float] = None, version: str = ''
+    ) -> 'NodeResultCache':
+        """Cache results of the node called ``node_name``"""
+        self.policies[node_name] = NodeCachePolicy(ttl=ttl, version=version)
+        return self
+
+    def policy_for(self, node: Any) -> Optional[NodeCachePolicy]:
+        return self.policies.get(node.name)
+
+    def make_key(
+        self,
+        node: Any,
+        inputs: List[Any],
+        variables: Optional[Dict[str, Any]],
+        policy: NodeCachePolicy,
+    ) -> str:
+        return node_key(node, inputs, variables, policy.version)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(found, result)`` for a key from ``make_key``"""
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return False, None
+        try:
+            result = pickle.loads(value)
+        except Exception as e:
+            logger.warning(f'Discarding unreadable node cache entry: {e}')
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, result
+
+    def set(self, key: str, result: Any, policy: NodeCachePolicy) -> None:
+        try:
+            value = pickle.dumps(result)
+        except Exception as e:
+            logger.warning(f'Node result not cached, it cannot be pickled: {e}')
+            return
+        self.backend.set(key, value, policy.ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+def node_key(
+    node: Any,
+    inputs: List[Any],
+    variables: Optional[Dict[str, Any]],
+    version: str = '',
+) -> str:
+    """Hash identifying a node execution: node configuration, inputs and variables"""
+    payload = _stable_json(
+        {
+            'node': node_fingerprint(node),
+            'version': version,
+            'inputs': inputs,
+            'variables': variables or {},
+        }
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def node_fingerprint(node: Any) -> Dict[str, Any]:
+    """Configuration of a node that determines its result"""
+    fingerprint: Dict[str, Any] = {'type': type(node).__name__, 'name': node.name}
+    if isinstance(node, Agent):
+        fingerprint.update(
+            system_prompt=node.system_prompt,
+            llm=type(node.llm).__name__,
+            model=node.llm.model,
+            temperature=node.llm.temperature,
+            tools=sorted(node.tools_dict),
+            output_schema=node.output_schema,
+            reasoning_pattern=node.reasoning_pattern,
+            input_filter=node.input_filter,
+        )
+    elif isinstance(node, FunctionNode):
+        fingerprint.update(
+            function=_function_fingerprint(node.function),
+            prefilled_params=node.prefilled_params,
+            input_filter=node.input_filter,
+        )
+    elif isinstance(node, ForEachNode):
+        fingerprint['execute_node'] = node_fingerprint(node.execute_node)
+    elif isinstance(node, MapReduceNode):
+        fingerprint.update(
+            map_node=node_fingerprint(node.map_node),
+            reduce_node=node_fingerprint(node.reduce_node),
+            chunk_by=node.chunk_by,
+            max_chunk_tokens=node.max_chunk_tokens,
+            reduce_fan_in=node.reduce_fan_in,
+        )
+    elif isinstance(node, auroraNode):
+        workflow = node.aurora
+        fingerprint.update(
+            nodes=[node_fingerprint(n) for _, n in sorted(workflow.nodes.items())],
+            start=workflow.start_node_name,
+            inherit_variables=node.inherit_variables,
+        )
+    return fingerprint
+
+
+def _function_fingerprint(function: Any) -> str:
+    name = getattr(function, '__qualname__', type(function).__qualname__)
+    try:
+        source = inspect.getsource(function)
+    except (OSError, TypeError):
+        code = getattr(function, '__code__', None)
+        source = repr((code.co_code, code.co_consts)) if code else repr(function)
+    digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+    return f'{getattr(function, "__module__", "")}.{name}:{digest}'
+
+
+def _stable_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=_encode)
+
+
+def _encode(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {'__type__': type(value).__name__, **dataclasses.asdict(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    return repr(value)
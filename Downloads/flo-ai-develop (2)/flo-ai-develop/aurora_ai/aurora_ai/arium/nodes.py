@@ -1,9 +1,27 @@
 from .protocols import ExecutableNode
-from typing import List, Any, Dict, Optional, TYPE_CHECKING, Callable
+from typing import List, Any, Dict, Literal, Optional, TYPE_CHECKING, Callable
 from aurora_ai.utils.logger import logger
-from .memory import MessageMemory
-from aurora_ai.models import BaseMessage, UserMessage
+from aurora_ai.utils.document_chunker import (
+    chunk_by_headings,
+    chunk_by_tokens,
+    pack_chunks,
+)
+from aurora_ai.utils.document_processor import get_default_processor
+from aurora_ai.utils.executors import ExecutionPolicy, is_blocking, run_callable
+from aurora_ai.utils.usage import add_queue_wait
+from aurora_ai.utils.variable_extractor import resolve_variables
+from .memory import MessageMemory, MessageMemoryItem
+from aurora_ai.models import (
+    Agent,
+    AssistantMessage,
+    BaseMessage,
+    DocumentMessageContent,
+    TextMessageContent,
+    UserMessage,
+)
 import asyncio
+import copy
+import time
 
 if TYPE_CHECKING:  # need to have an optional import else will get circular dependency error as aurora also has auroraNode reference
     from .arium import aurora
@@ -162,6 +180,8 @@ class FunctionNode:
     Lightweight function-as-node wrapper that conforms to ExecutableNode.
 
     Forwards inputs and variables to the provided function along with any kwargs.
+    Plain (non-async) functions run on a worker pool chosen by ``execution``
+    (the shared thread pool by default) so they don't block the event loop.
     """
 
     def __init__(
@@ -171,12 +191,14 @@ class FunctionNode:
         function: Callable[..., Any],
         prefilled_params: Optional[Dict[str, Any]] = None,
         input_filter: Optional[List[str]] = None,
+        execution: Optional[ExecutionPolicy] = None,
     ) -> None:
         self.name = name
         self.description = description
         self.function = function
         self.prefilled_params = prefilled_params or {}
         self.input_filter: Optional[List[str]] = input_filter
+        self.execution = execution
 
     async def run(
         self,
@@ -184,25 +206,215 @@ class FunctionNode:
         variables: Optional[Dict[str, Any]] = None,
         **kwargs,
     ) -> Any:
+        # Lazy formatting: inputs can be large and are only rendered if logged
         logger.info(
-            f"Executing FunctionNode '{self.name}' with inputs: {inputs} variables: {variables} kwargs: {kwargs}"
+            "Executing FunctionNode '%s' with inputs: %s variables: %s kwargs: %s",
+            self.name,
+            inputs,
+            variables,
+            kwargs,
         )
 
-        if asyncio.iscoroutinefunction(self.function):
+        if is_blocking(self.function):
+            pool = self.execution.pool if self.execution else 'thread'
+            logger.info(
+                f"Executing FunctionNode '{self.name}' as a regular function on the '{pool}' pool"
+            )
+        else:
             logger.info(f"Executing FunctionNode '{self.name}' as a coroutine function")
-            result = await self.function(
-                inputs=inputs, variables=variables, **self.prefilled_params, **kwargs
+
+        result = await run_callable(
+            self.function,
+            {
+                'inputs': inputs,
+                'variables': variables,
+                **self.prefilled_params,
+                **kwargs,
+            },
+            self.execution,
+        )
+        return UserMessage(content=result)
+
+
+class MapReduceNode:
+    """
+    Summarize documents larger than a model's context with map-reduce.
+
+    The first document found in the inputs is split into chunks (by estimated
+    tokens, by pages, or by markdown headings), ``map_node`` runs on every chunk
+    concurrently, and ``reduce_node`` combines the partial results in groups of
+    ``reduce_fan_in`` until a single result remains. Every LLM call therefore
+    sees a bounded amount of text, however large the document is.
+
+    Inputs without a document are treated as plain text and chunked by tokens
+    (or headings).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        map_node: ExecutableNode,
+        reduce_node: Optional[ExecutableNode] = None,
+        chunk_by: Literal['tokens', 'pages', 'headings'] = 'pages',
+        max_chunk_tokens: int = 4000,
+        max_concurrency: int = 4,
+        reduce_fan_in: int = 5,
+        input_filter: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            name: Node name
+            map_node: Node run on each chunk
+            reduce_node: Node run on groups of partial results. When not set,
+                partial results are joined in document order.
+            chunk_by: How to split the document: 'tokens', 'pages' or 'headings'.
+                With 'pages', consecutive pages are packed into one chunk while
+                they fit in ``max_chunk_tokens``.
+            max_chunk_tokens: Maximum estimated tokens per chunk
+            max_concurrency: Maximum number of map/reduce calls in flight
+            reduce_fan_in: Number of partial results combined per reduce call
+        """
+        if chunk_by not in ('tokens', 'pages', 'headings'):
+            raise ValueError(
+                f"chunk_by must be 'tokens', 'pages' or 'headings', got '{chunk_by}'"
             )
-            return UserMessage(content=result)
+        if max_chunk_tokens < 1:
+            raise ValueError('max_chunk_tokens must be at least 1')
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        if reduce_fan_in < 2:
+            raise ValueError('reduce_fan_in must be at least 2')
+
+        self.name = name
+        self.map_node = map_node
+        self.reduce_node = reduce_node
+        self.chunk_by = chunk_by
+        self.max_chunk_tokens = max_chunk_tokens
+        self.max_concurrency = max_concurrency
+        self.reduce_fan_in = reduce_fan_in
+        self.input_filter: Optional[List[str]] = input_filter
 
-        logger.info(f"Executing FunctionNode '{self.name}' as a regular function")
-        result = self.function(
-            inputs=inputs, variables=variables, **self.prefilled_params, **kwargs
+    async def run(
+        self, inputs: List[Any], variables: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AssistantMessage:
+        """Chunk the input document, map over the chunks and reduce the results"""
+        chunks = await self._chunk_inputs(inputs)
+        logger.info(f"MapReduce '{self.name}': Mapping over {len(chunks)} chunks")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(
+                self._run_bounded(semaphore, self.map_node, chunk, variables)
+                for chunk in chunks
+            )
         )
 
-        if asyncio.iscoroutine(result):
-            logger.info(f"Executing FunctionNode '{self.name}' as a coroutine")
-            content = await result
-            return UserMessage(content=content)
+        if self.reduce_node is None:
+            return AssistantMessage(content='\n\n'.join(results))
+
+        # Reduce hierarchically until a single result remains
+        level = 0
+        while len(results) > 1 or level == 0:
+            groups = [
+                results[i : i + self.reduce_fan_in]
+                for i in range(0, len(results), self.reduce_fan_in)
+            ]
+            logger.info(
+                f"MapReduce '{self.name}': Reducing {len(results)} results "
+                f'in {len(groups)} groups (level {level})'
+            )
+            results = await asyncio.gather(
+                *(
+                    self._run_bounded(
+                        semaphore, self.reduce_node, '\n\n'.join(group), variables
+                    )
+                    for group in groups
+                )
+            )
+            level += 1
+
+        return AssistantMessage(content=results[0] if results else '')
+
+    async def _chunk_inputs(self, inputs: List[Any]) -> List[str]:
+        """Split the first document in the inputs (or the input text) into chunks"""
+        document = self._find_document(inputs)
+
+        if document is None:
+            texts = [_result_text(item) for item in inputs]
+            text = '\n\n'.join(text for text in texts if text)
+            if self.chunk_by == 'headings':
+                return chunk_by_headings(text, self.max_chunk_tokens)
+            return chunk_by_tokens(text, self.max_chunk_tokens)
+
+        processor = get_default_processor()
+        if self.chunk_by == 'pages':
+            pages = [
+                chunk.text async for chunk in processor.stream_document(document)
+            ]
+            return pack_chunks(pages, self.max_chunk_tokens)
+
+        result = await processor.process_document(document)
+        text = result.get('extracted_text', '')
+        if self.chunk_by == 'headings':
+            return chunk_by_headings(text, self.max_chunk_tokens)
+        return chunk_by_tokens(text, self.max_chunk_tokens)
+
+    def _find_document(self, inputs: List[Any]) -> Optional[DocumentMessageContent]:
+        for item in inputs:
+            if isinstance(item, MessageMemoryItem):
+                item = item.result
+            if isinstance(item, BaseMessage):
+                item = item.content
+            if isinstance(item, DocumentMessageContent):
+                return item
+        return None
+
+    async def _run_bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        node: ExecutableNode,
+        text: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        queued_at = time.monotonic()
+        async with semaphore:
+            add_queue_wait(time.monotonic() - queued_at)
+            node = self._isolate(node, variables)
+            result = await node.run(
+                [UserMessage(TextMessageContent(text=text))],
+                variables={} if isinstance(node, Agent) else variables,
+            )
+            return _result_text(result)
+
+    def _isolate(
+        self, node: ExecutableNode, variables: Optional[Dict[str, Any]] = None
+    ) -> ExecutableNode:
+        """
+        Give agents a private conversation history so concurrent calls don't mix.
 
-        return UserMessage(content=result)
+        The copy's prompt is resolved up front so that document text is never
+        treated as a variable template.
+        """
+        if not isinstance(node, Agent):
+            return node
+        agent = copy.copy(node)
+        agent.conversation_history = []
+        if not agent.resolved_variables:
+            agent.system_prompt = resolve_variables(agent.system_prompt, variables)
+            agent.resolved_variables = True
+        return agent
+
+
+def _result_text(result: Any) -> str:
+    """Extract the text of a node result (conversation, message or memory item)"""
+    if isinstance(result, list):
+        result = result[-1] if result else ''
+    if isinstance(result, MessageMemoryItem):
+        result = result.result
+    if isinstance(result, BaseMessage):
+        result = result.content
+    if isinstance(result, TextMessageContent):
+        result = result.text
+    if isinstance(result, DocumentMessageContent):
+        return ''
+    return str(result) if result is not None else ''
@@ -0,0 +1,70 @@
+"""
+Recorded node inputs and outputs of a workflow run, for incremental re-runs.
+
+A run started with ``record_run=True`` (or from a previous record) stores, for
+every node execution, a key identifying the node configuration and the exact
+inputs it read from memory, together with the node's output as it goes into
+memory (the last item of list outputs, not e.g. an agent's whole conversation).
+Passing that record as ``previous_run`` to the next run makes the workflow
+reuse the recorded output of every node whose key is unchanged and execute
+only the nodes whose (filtered) inputs differ, plus whatever depends on them.
+"""
+
+import pickle
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from aurora_ai.utils.logger import logger
+
+
+class RunRecord:
+    """
+    Node executions of one workflow run.
+
+    Entries are keyed by node name and visit number, so nodes visited several
+    times in a run (loops, retries through routers) are matched visit by visit.
+
+    Attributes:
+        executed: Names of the nodes executed in this run, in order
+        reused: Names of the nodes whose output was reused, from the previous
+            run or the node cache
+    """
+
+    def __init__(self):
+        self.entries: Dict[Tuple[str, int], Tuple[str, bytes]] = {}
+        self.executed: List[str] = []
+        self.reused: List[str] = []
+        self._visits: Counter = Counter()
+
+    def next_visit(self, node_name: str) -> int:
+        """Number the next execution of ``node_name`` in this run"""
+        visit = self._visits[node_name]
+        self._visits[node_name] += 1
+        return visit
+
+    def get(self, node_name: str, visit: int, key: str) -> Tuple[bool, Any]:
+        """Return ``(found, output)`` if the node ran with the same key"""
+        entry = self.entries.get((node_name, visit))
+        if entry is None or entry[0] != key:
+            return False, None
+        return True, pickle.loads(entry[1])
+
+    def add(self, node_name: str, visit: int, key: str, output: Any) -> None:
+        """Record a node execution; outputs that cannot be pickled are skipped"""
+        try:
+            value = pickle.dumps(output)
+        except Exception as e:
+            logger.warning(f'Output of node {node_name} not recorded: {e}')
+            return
+        self.entries[(node_name, visit)] = (key, value)
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            pickle.dump(self.entries, f)
+
+    @classmethod
+    def load(cls, path: str) -> 'RunRecord':
+        record = cls()
+        with open(path, 'rb') as f:
+            record.entries = pickle.load(f)
+        return record
@@ -6,7 +6,10 @@ from aurora_ai.models.base_agent import ReasoningPattern
 from aurora_ai.llm import BaseLLM
 from aurora_ai.tool.base_tool import Tool
 from aurora_ai.tool.tool_config import ToolConfig, create_tool_config
-from aurora_ai.formatter.yaml_format_parser import FloYamlParser
+from aurora_ai.tool.result_formatter import ToolResultFormatter
+from aurora_ai.models.final_answer import FinalAnswerDetector
+from aurora_ai.models.tool_prefetch import ToolPrefetcher
+from aurora_ai.formatter.yaml_format_parser import FloYamlParser, get_json_schema
 from pydantic import BaseModel
 
 
@@ -27,6 +30,10 @@ class AgentBuilder:
         self._act_as: Optional[str] = (
             'assistant'  # Default to 'assistant' instead of None
         )
+        self._result_formatter: Optional[ToolResultFormatter] = None
+        self._final_answer_detector: Optional[FinalAnswerDetector] = None
+        self._finish_tool = False
+        self._tool_prefetcher: Optional[ToolPrefetcher] = None
 
     def with_name(self, name: str) -> 'AgentBuilder':
         """Set the agent's name"""
@@ -64,6 +71,9 @@ class AgentBuilder:
                    - 'prefilled_params': Optional dict of pre-filled parameters
                    - 'name_override': Optional custom name
                    - 'description_override': Optional custom description
+                   - 'timeout': Optional per-call timeout in seconds
+                   - 'circuit_breaker': Optional CircuitBreaker, dict of its
+                     arguments, or consecutive failures that open the circuit
 
         Examples:
             # Regular tools
@@ -102,6 +112,8 @@ class AgentBuilder:
                     prefilled_params=prefilled_params,
                     name_override=name_override,
                     description_override=description_override,
+                    timeout=tool_item.get('timeout'),
+                    circuit_breaker=tool_item.get('circuit_breaker'),
                 )
                 processed_tools.append(tool_config.to_tool())
             else:
@@ -151,7 +163,7 @@ class AgentBuilder:
             schema: Either a JSON schema dictionary or a Pydantic model class
         """
         if isinstance(schema, type) and issubclass(schema, BaseModel):
-            self._output_schema = schema.model_json_schema()
+            self._output_schema = get_json_schema(schema)
         else:
             self._output_schema = schema
         return self
@@ -166,6 +178,47 @@ class AgentBuilder:
         self._act_as = act_as
         return self
 
+    def with_result_formatter(
+        self, result_formatter: ToolResultFormatter
+    ) -> 'AgentBuilder':
+        """Set how tool results are formatted for the LLM
+
+        Args:
+            result_formatter: Formatter for tabular tool results (sampling,
+                statistics and optional spill-to-file paging)
+        """
+        self._result_formatter = result_formatter
+        return self
+
+    def with_final_answer_detector(
+        self, detector: FinalAnswerDetector
+    ) -> 'AgentBuilder':
+        """Configure how text responses are classified as final answers
+
+        Args:
+            detector: Detector to use, e.g. ``FinalAnswerDetector(llm_classifier=False)``
+                to never spend an extra LLM call on the decision
+        """
+        self._final_answer_detector = detector
+        return self
+
+    def with_finish_tool(self, enabled: bool = True) -> 'AgentBuilder':
+        """Give the agent a ``final_answer`` tool to end its run explicitly"""
+        self._finish_tool = enabled
+        return self
+
+    def with_tool_prefetching(
+        self, prefetcher: Optional[ToolPrefetcher] = None
+    ) -> 'AgentBuilder':
+        """Start the likely first tool call while the first LLM request runs
+
+        Args:
+            prefetcher: Prefetcher holding the call statistics; pass the same one
+                to every agent built from this configuration to share them
+        """
+        self._tool_prefetcher = prefetcher or ToolPrefetcher()
+        return self
+
     def build(self) -> Agent:
         """Build and return the configured agent"""
         if not self._llm:
@@ -181,6 +234,10 @@ class AgentBuilder:
             output_schema=self._output_schema,
             role=self._role,
             act_as=self._act_as,
+            result_formatter=self._result_formatter,
+            final_answer_detector=self._final_answer_detector,
+            finish_tool=self._finish_tool,
+            tool_prefetcher=self._tool_prefetcher,
         )
 
     @classmethod
@@ -248,7 +305,7 @@ class AgentBuilder:
         # Set parser if present
         if 'parser' in agent_config:
             parser = FloYamlParser.create(yaml_dict=config)
-            builder.with_output_schema(parser.get_format())
+            builder.with_output_schema(parser.get_json_schema())
 
         # Apply settings if present
         if 'settings' in agent_config:
@@ -309,18 +366,12 @@ class AgentBuilder:
                     prefilled_params=prefilled_params,
                     name_override=name_override,
                     description_override=description_override,
+                    timeout=tool_config.get('timeout'),
+                    circuit_breaker=tool_config.get('circuit_breaker'),
                 )
 
-                # If there are pre-filled parameters or custom name/description, convert to tool
-                if (
-                    prefilled_params
-                    or name_override is not None
-                    or description_override is not None
-                ):
-                    processed_tools.append(tool_config_obj.to_tool())
-                else:
-                    # No pre-filled params and no custom name/description, use original tool
-                    processed_tools.append(base_tool)
+                # Returns the original tool when nothing is customized
+                processed_tools.append(tool_config_obj.to_tool())
             else:
                 raise ValueError(
                     f'Invalid tool configuration type: {type(tool_config)}'
@@ -1,10 +1,33 @@
 import json
 import csv
+import hashlib
+import re
 import yaml
+from collections import OrderedDict
+from functools import lru_cache
 from io import StringIO
-from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field, create_model
+from typing import (
+    List,
+    Dict,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Optional,
+    Literal,
+    Tuple,
+    Type,
+    Union,
+)
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
 from dataclasses import dataclass
+from aurora_ai.utils.logger import logger
+
+# Characters that matter while scanning the top-level object of a response
+_STRUCTURE_TOKENS = re.compile(r'[{}\[\]",:\\]')
+
+# Generated contract models, keyed by contract hash and shared by all parsers
+_MAX_CACHED_CONTRACTS = 256
+_contract_models: 'OrderedDict[str, Type[BaseModel]]' = OrderedDict()
 
 
 @dataclass
@@ -12,6 +35,29 @@ class ParseContract:
     name: str
     fields: List[Dict[str, Any]]
 
+    def schema_hash(self) -> str:
+        """Stable hash of the contract, identical for identical definitions"""
+        payload = json.dumps(
+            {'name': self.name, 'fields': self.fields}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@lru_cache(maxsize=_MAX_CACHED_CONTRACTS)
+def get_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    JSON schema of a pydantic model, generated once per model class.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    return model.model_json_schema()
+
+
+def clear_contract_cache():
+    """Drop all cached contract models and JSON schemas"""
+    _contract_models.clear()
+    get_json_schema.cache_clear()
+
 
 class FloJsonParser:
     def __init__(self, parse_contract: ParseContract):
@@ -95,7 +141,31 @@ class FloJsonParser:
         return Literal[tuple(literals)]
 
     def get_format(self) -> BaseModel:
-        return self.__create_contract_from_json()
+        """
+        Pydantic model for the contract.
+
+        Models are cached by contract hash, so parsers built from identical
+        contracts (e.g. the same agent YAML loaded repeatedly) share one model.
+        """
+        key = self.contract.schema_hash()
+        model = _contract_models.get(key)
+        if model is not None:
+            _contract_models.move_to_end(key)
+            return model
+
+        model = self.__create_contract_from_json()
+        _contract_models[key] = model
+        if len(_contract_models) > _MAX_CACHED_CONTRACTS:
+            _contract_models.popitem(last=False)
+        return model
+
+    def get_json_schema(self) -> Dict[str, Any]:
+        """Cached JSON schema of the contract model (shared, do not modify)"""
+        return get_json_schema(self.get_format())
+
+    def stream_parser(self) -> 'FloStreamParser':
+        """Create a parser that validates the contract's fields while a response streams"""
+        return FloStreamParser(self.get_format())
 
     def __create_contract_from_json(self) -> BaseModel:
         pydantic_fields = {}
@@ -153,6 +223,159 @@ class FloJsonParser:
             return FloJsonParser(ParseContract(name=name, fields=fields))
 
 
+class FloStreamParser:
+    """
+    Incrementally parse a streamed JSON response against a contract model.
+
+    The response is scanned as it arrives and each top-level field is validated
+    against its annotation on the model as soon as its value is complete, so
+    early fields are available before the rest of the response is generated.
+    Any text before the opening brace (e.g. a code fence) is ignored.
+
+    Example:
+        >>> parser = FloJsonParser.create(json_dict=contract).stream_parser()
+        >>> async for name, value in parser.parse_stream(llm.stream(messages)):
+        ...     print(name, value)
+        >>> report = parser.close()
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self._adapters = {
+            name: TypeAdapter(field.annotation)
+            for name, field in model.model_fields.items()
+        }
+        self._values: Dict[str, Any] = {}
+        self._fields: Dict[str, Any] = {}
+
+        self._buffer = ''
+        self._offset = 0  # absolute position of self._buffer[0]
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped_position = -1
+        # 'start' -> ('key' -> 'colon' -> 'value')* -> 'done'
+        self._state = 'start'
+        self._mark = 0  # absolute start of the current key or value
+        self._key: Optional[str] = None
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """Fields validated so far"""
+        return dict(self._fields)
+
+    @property
+    def done(self) -> bool:
+        """Whether the top-level object has been closed"""
+        return self._state == 'done'
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Add response text and return the (name, value) fields completed by it"""
+        if self._state == 'done':
+            return []
+        self._buffer += chunk
+        completed: List[Tuple[str, Any]] = []
+
+        for match in _STRUCTURE_TOKENS.finditer(
+            self._buffer, self._scanned - self._offset
+        ):
+            position = match.start() + self._offset
+            char = match.group()
+            if position == self._escaped_position:
+                continue
+            if self._in_string:
+                if char == '\\':
+                    self._escaped_position = position + 1
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._state == 'key':
+                        self._key = json.loads(self._slice(self._mark, position + 1))
+                        self._state = 'colon'
+            elif self._depth == 0:
+                if char == '{':
+                    self._depth = 1
+                    self._state = 'key'
+                    self._mark = position + 1
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._state == 'key':
+                    self._mark = position
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    if self._state == 'value':
+                        completed.extend(self._complete(position))
+                    self._state = 'done'
+                    break
+            elif self._depth == 1:
+                if char == ':' and self._state == 'colon':
+                    self._state = 'value'
+                    self._mark = position + 1
+                elif char == ',' and self._state == 'value':
+                    completed.extend(self._complete(position))
+                    self._state = 'key'
+                    self._mark = position + 1
+
+        self._scanned = self._offset + len(self._buffer)
+
+        # Only the current key or value can still be needed
+        keep_from = self._mark if self._state in ('key', 'value') else self._scanned
+        if keep_from > self._offset:
+            self._buffer = self._buffer[keep_from - self._offset :]
+            self._offset = keep_from
+
+        return completed
+
+    async def parse_stream(
+        self, chunks: AsyncIterable[Union[str, Dict[str, Any]]]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yield (name, value) fields from a stream of text chunks as they complete.
+
+        Chunks may be strings or the ``{'content': ...}`` dicts yielded by
+        ``BaseLLM.stream``.
+        """
+        async for chunk in chunks:
+            text = (chunk.get('content') or '') if isinstance(chunk, dict) else chunk
+            for field in self.feed(text):
+                yield field
+
+    def close(self) -> BaseModel:
+        """
+        Validate the complete response against the model.
+
+        Raises:
+            pydantic.ValidationError: If fields are missing or invalid
+        """
+        return self.model.model_validate(self._values)
+
+    def _slice(self, start: int, end: int) -> str:
+        return self._buffer[start - self._offset : end - self._offset]
+
+    def _complete(self, end: int) -> List[Tuple[str, Any]]:
+        key = self._key
+        try:
+            value = json.loads(self._slice(self._mark, end))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Could not decode streamed field '{key}': {e}")
+            return []
+        self._values[key] = value
+
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            return []
+        try:
+            validated = adapter.validate_python(value)
+        except ValidationError as e:
+            # Reported with the other errors by close()
+            logger.debug(f"Streamed field '{key}' failed validation: {e}")
+            return []
+        self._fields[key] = validated
+        return [(key, validated)]
+
+
 class FloYamlParser(FloJsonParser):
     """
     A parser class that handles YAML-based parser definitions for Flo agents.
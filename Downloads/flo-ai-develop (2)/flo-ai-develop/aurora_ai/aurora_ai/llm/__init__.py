@@ -1,11 +1,42 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .base_llm import BaseLLM
-from .anthropic_llm import Anthropic
-from .openai_llm import OpenAI
-from .ollama_llm import OllamaLLM
-from .gemini_llm import Gemini
-from .openai_vllm import OpenAIVLLM
-from .vertexai_llm import VertexAI
-from .rootaurora_llm import RootFloLLM
+
+if TYPE_CHECKING:
+    from .anthropic_llm import Anthropic
+    from .openai_llm import OpenAI
+    from .ollama_llm import OllamaLLM
+    from .gemini_llm import Gemini
+    from .openai_vllm import OpenAIVLLM
+    from .vertexai_llm import VertexAI
+    from .rootaurora_llm import RootFloLLM
+
+# Providers are imported on first access (PEP 562), so only the SDKs that are
+# actually used (openai, anthropic, google-genai, aiohttp) are loaded
+_PROVIDERS = {
+    'Anthropic': '.anthropic_llm',
+    'OpenAI': '.openai_llm',
+    'OllamaLLM': '.ollama_llm',
+    'Gemini': '.gemini_llm',
+    'OpenAIVLLM': '.openai_vllm',
+    'VertexAI': '.vertexai_llm',
+    'RootFloLLM': '.rootaurora_llm',
+}
+
+
+def __getattr__(name: str):
+    module = _PROVIDERS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PROVIDERS))
+
 
 __all__ = [
     'BaseLLM',
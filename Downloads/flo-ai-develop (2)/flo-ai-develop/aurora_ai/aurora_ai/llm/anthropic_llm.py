@@ -3,7 +3,7 @@ from anthropic import AsyncAnthropic
 import json
 
 from aurora_ai.models.chat_message import ImageMessageContent
-from .base_llm import BaseLLM
+from .base_llm import BaseLLM, normalize_finish_reason
 from aurora_ai.tool.base_tool import Tool
 from aurora_ai.telemetry.instrumentation import (
     trace_llm_call,
@@ -146,7 +146,13 @@ class Anthropic(BaseLLM):
                     }
 
             # Handle regular text response
-            return {'content': text_content}
+            result = {'content': text_content}
+            finish_reason = normalize_finish_reason(
+                getattr(response, 'stop_reason', None)
+            )
+            if finish_reason:
+                result['finish_reason'] = finish_reason
+            return result
 
         except Exception as e:
             raise Exception(f'Error in Claude API call: {str(e)}')
@@ -5,6 +5,30 @@ from aurora_ai.utils.document_processor import get_default_processor
 from aurora_ai.utils.logger import logger
 from aurora_ai.models.chat_message import DocumentMessageContent, ImageMessageContent
 
+# Provider stop reasons mapped to 'stop' (model ended its turn), 'length'
+# (output cut by the token limit) or 'tool_call'
+_FINISH_REASONS = {
+    'stop': 'stop',
+    'end_turn': 'stop',
+    'stop_sequence': 'stop',
+    'length': 'length',
+    'max_tokens': 'length',
+    'tool_use': 'tool_call',
+    'tool_calls': 'tool_call',
+    'function_call': 'tool_call',
+}
+
+
+def normalize_finish_reason(reason: Any) -> Optional[str]:
+    """Map a provider stop reason to 'stop', 'length' or 'tool_call' (None if unknown)"""
+    if isinstance(reason, str):
+        return _FINISH_REASONS.get(reason.lower())
+    # Enum values such as Gemini's FinishReason.STOP
+    name = getattr(reason, 'name', None)
+    if isinstance(name, str):
+        return _FINISH_REASONS.get(name.lower())
+    return None
+
 
 class BaseLLM(ABC):
     def __init__(
@@ -59,6 +83,16 @@ class BaseLLM(ABC):
             return result
         return None
 
+    def get_finish_reason(self, response: Any) -> Optional[str]:
+        """
+        Why generation stopped: 'stop', 'length', 'tool_call', or None if the
+        provider did not report it. Providers add a normalised 'finish_reason'
+        to dict responses.
+        """
+        if isinstance(response, dict):
+            return response.get('finish_reason')
+        return None
+
     def get_assistant_message_for_tool_call(
         self, response: Dict[str, Any]
     ) -> Optional[Any]:
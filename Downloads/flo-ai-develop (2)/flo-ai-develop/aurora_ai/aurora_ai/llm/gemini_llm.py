@@ -1,7 +1,6 @@
 import base64
-import asyncio
 from typing import Dict, Any, List, Optional, AsyncIterator
-from .base_llm import BaseLLM
+from .base_llm import BaseLLM, normalize_finish_reason
 from aurora_ai.models.chat_message import ImageMessageContent
 from google import genai
 from google.genai import types
@@ -85,9 +84,9 @@ class Gemini(BaseLLM):
                 generation_config.response_mime_type = 'application/json'
                 generation_config.response_schema = output_schema
 
-            # Make the API call (run in thread pool to avoid blocking event loop)
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
+            # Native async client: no thread pool hop, concurrency is not
+            # capped by the default executor
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=contents,
                 config=generation_config,
@@ -142,7 +141,15 @@ class Gemini(BaseLLM):
             response_text = (
                 response.text if hasattr(response, 'text') else str(response)
             )
-            return {'content': response_text}
+            result = {'content': response_text}
+            candidates = getattr(response, 'candidates', None)
+            if isinstance(candidates, list) and candidates:
+                finish_reason = normalize_finish_reason(
+                    getattr(candidates[0], 'finish_reason', None)
+                )
+                if finish_reason:
+                    result['finish_reason'] = finish_reason
+            return result
 
         except Exception as e:
             raise Exception(f'Error in Gemini API call: {str(e)}')
@@ -182,26 +189,13 @@ class Gemini(BaseLLM):
             tools = types.Tool(function_declarations=functions)
             generation_config.tools = [tools]
 
-        # Get stream in thread to avoid blocking the initial call
-        stream = await asyncio.to_thread(
-            self.client.models.generate_content_stream,
+        # Chunks are read from the native async stream on the event loop
+        stream = await self.client.aio.models.generate_content_stream(
             model=self.model,
             contents=contents,
             config=generation_config,
         )
-
-        # Helper to get next chunk in thread pool
-        def get_next_chunk():
-            try:
-                return next(stream)
-            except StopIteration:
-                return None
-
-        # Iterate over synchronous stream without blocking event loop
-        while True:
-            chunk = await asyncio.to_thread(get_next_chunk)
-            if chunk is None:
-                break
+        async for chunk in stream:
             if hasattr(chunk, 'text') and chunk.text:
                 yield {'content': chunk.text}
 
@@ -5,7 +5,7 @@ Models package for aurora_ai - Agent framework components
 from .agent import Agent, MessageType
 from .agent_error import AgentError
 from .base_agent import BaseAgent, AgentType, ReasoningPattern
-from .document import DocumentType
+from .document import DocumentType, DocumentChunk
 from .chat_message import (
     SystemMessage,
     UserMessage,
@@ -25,6 +25,7 @@ __all__ = [
     'AgentType',
     'ReasoningPattern',
     'DocumentType',
+    'DocumentChunk',
     'MessageType',
     'SystemMessage',
     'UserMessage',
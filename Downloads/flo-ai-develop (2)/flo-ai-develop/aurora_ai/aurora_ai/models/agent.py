@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 from aurora_ai.models.base_agent import BaseAgent, AgentType, ReasoningPattern
 from aurora_ai.llm.base_llm import BaseLLM
 from aurora_ai.models.chat_message import (
@@ -10,10 +10,21 @@ from aurora_ai.models.chat_message import (
     TextMessageContent,
     FunctionMessage,
     SystemMessage,
+    DocumentMessageContent,
 )
+from aurora_ai.models.document import DocumentChunk
 from aurora_ai.tool.base_tool import Tool, ToolExecutionError
+from aurora_ai.tool.result_formatter import ToolResultFormatter
 from aurora_ai.models.agent_error import AgentError
+from aurora_ai.models.final_answer import (
+    FINISH_TOOL_NAME,
+    FinalAnswerDetector,
+    create_finish_tool,
+)
+from aurora_ai.models.tool_prefetch import Prefetch, ToolPrefetcher
 from aurora_ai.utils.logger import logger
+from aurora_ai.utils.document_processor import get_default_processor
+from aurora_ai.utils.usage import add_cache_hit, add_tool_call
 from aurora_ai.utils.variable_extractor import (
     extract_variables_from_inputs,
     extract_agent_variables,
@@ -26,6 +37,9 @@ from aurora_ai.telemetry.instrumentation import (
 )
 from aurora_ai.telemetry import get_tracer
 
+# Text responses in a row classed as intermediate before asking for a final answer
+MAX_INTERMEDIATE_TURNS = 3
+
 
 class Agent(BaseAgent):
     def __init__(
@@ -41,7 +55,20 @@ class Agent(BaseAgent):
         role: Optional[str] = None,
         act_as: Optional[str] = MessageType.ASSISTANT,
         input_filter: Optional[List[str]] = None,
+        result_formatter: Optional[ToolResultFormatter] = None,
+        final_answer_detector: Optional[FinalAnswerDetector] = None,
+        finish_tool: bool = False,
+        tool_prefetcher: Optional[ToolPrefetcher] = None,
     ):
+        # By default only database-style (rows, column_names) results are
+        # reformatted; large ones can be paged through when the formatter spills
+        result_formatter = result_formatter or ToolResultFormatter()
+        if tools and result_formatter.spill_dir:
+            tools = [*tools, result_formatter.pager_tool()]
+        # A dedicated tool lets the LLM signal its final answer explicitly
+        if tools and finish_tool:
+            tools = [*tools, create_finish_tool()]
+
         # Determine agent type based on tools
         agent_type = AgentType.TOOL_USING if tools else AgentType.CONVERSATIONAL
 
@@ -68,6 +95,12 @@ class Agent(BaseAgent):
         self.role = role
         self.act_as = act_as
         self.input_filter: Optional[List[str]] = input_filter
+        self.result_formatter = result_formatter
+        self.final_answer_detector = final_answer_detector or FinalAnswerDetector()
+        self.finish_tool = finish_tool
+        self.tool_prefetcher = tool_prefetcher
+        # Formatted tool schemas and descriptions, keyed by _tool_set_key()
+        self._tool_schema_cache: Dict[str, Tuple[Any, Any]] = {}
 
     @trace_agent_execution()
     async def run(
@@ -208,6 +241,15 @@ class Agent(BaseAgent):
         variables = variables or {}
         print('running with tools')
 
+        # Only the first LLM request of a run is overlapped with a prefetch
+        first_hop = self.tool_prefetcher is not None
+        prefetch_pattern = (
+            self.tool_prefetcher.pattern(self._latest_user_text())
+            if first_hop
+            else None
+        )
+        prefetch: Optional[Prefetch] = None
+
         while retry_count <= self.max_retries:
             try:
                 # Resolve variables in system prompt based on reasoning pattern
@@ -224,16 +266,38 @@ class Agent(BaseAgent):
 
                 # Keep executing tools until we get a final answer
                 tool_call_count = 0
+                intermediate_turns = 0
                 while tool_call_count < self.max_tool_calls:
-                    formatted_tools = self.llm.format_tools_for_llm(self.tools)
-                    response = await self.llm.generate(
-                        messages,
-                        functions=formatted_tools,
-                        output_schema=self.output_schema,
-                    )
+                    formatted_tools = self._get_formatted_tools()
+                    if first_hop:
+                        prefetch = self.tool_prefetcher.start(
+                            prefetch_pattern, self.tools_dict
+                        )
+                    try:
+                        response = await self.llm.generate(
+                            messages,
+                            functions=formatted_tools,
+                            output_schema=self.output_schema,
+                        )
+                    except BaseException:
+                        if prefetch is not None:
+                            prefetch.cancel()
+                        raise
 
                     # Handle ReACT and CoT patterns
                     function_call = await self.llm.get_function_call(response)
+                    if first_hop:
+                        first_hop = False
+                        prefetch = self.tool_prefetcher.settle(
+                            prefetch_pattern, prefetch, function_call
+                        )
+
+                    if (
+                        function_call
+                        and self.finish_tool
+                        and function_call['name'] == FINISH_TOOL_NAME
+                    ):
+                        return self._finish_with_tool_call(function_call)
 
                     # If no function call, check if this is truly a final answer
                     if not function_call:
@@ -241,7 +305,10 @@ class Agent(BaseAgent):
                         if assistant_message:
                             # Check if this is a final answer or just intermediate reasoning
                             is_final = await self._is_final_answer(
-                                assistant_message, tool_call_count, messages
+                                assistant_message,
+                                tool_call_count,
+                                messages,
+                                response=response,
                             )
                             if is_final:
                                 # Ensure act_as is not None (default to 'assistant' if missing)
@@ -258,6 +325,7 @@ class Agent(BaseAgent):
                                 return self.conversation_history
                             else:
                                 # This is intermediate reasoning, add to context and continue
+                                intermediate_turns += 1
                                 msg_preview = (
                                     assistant_message[:100]
                                     if len(assistant_message) > 100
@@ -277,6 +345,10 @@ class Agent(BaseAgent):
                                         role=role, content=assistant_message
                                     )
                                 )
+                                # Only tool calls count towards max_tool_calls,
+                                # text turns without one are bounded here
+                                if intermediate_turns >= MAX_INTERMEDIATE_TURNS:
+                                    break
                                 self.add_to_history(
                                     UserMessage(
                                         content='Based on your reasoning, please proceed with the necessary tool calls to complete the task.',
@@ -311,6 +383,8 @@ class Agent(BaseAgent):
 
                     # Execute the tool
                     try:
+                        # A prefetch only ever answers the first tool call
+                        prefetch, claimed = None, prefetch
                         function_name = function_call['name']
                         # Get tool_use_id if available (LLM-specific, e.g., Claude)
                         tool_use_id = self.llm.get_tool_use_id(function_call)
@@ -332,15 +406,21 @@ class Agent(BaseAgent):
                                     'agent.name': self.name,
                                 },
                             ) as tool_span:
-                                function_response = await tool.run(
-                                    inputs=[], variables=None, **function_args
+                                function_response = await self._call_tool(
+                                    tool, function_args, claimed
+                                )
+                                result_text = self.result_formatter.format(
+                                    function_response
                                 )
                                 tool_span.set_attribute(
-                                    'tool.result.length', len(str(function_response))
+                                    'tool.result.length', len(result_text)
                                 )
                         else:
-                            function_response = await tool.run(
-                                inputs=[], variables=None, **function_args
+                            function_response = await self._call_tool(
+                                tool, function_args, claimed
+                            )
+                            result_text = self.result_formatter.format(
+                                function_response
                             )
 
                         agent_metrics.record_tool_call(
@@ -348,6 +428,7 @@ class Agent(BaseAgent):
                         )
 
                         tool_call_count += 1
+                        intermediate_turns = 0
 
                         # Add function call result to history using OpenAI's "function" role format
                         # According to OpenAI API: {"role": "function", "name": "<function-name>", "content": "<result>"}
@@ -355,7 +436,7 @@ class Agent(BaseAgent):
                             FunctionMessage(
                                 content=str(
                                     'Here is the result of the tool call: \n'
-                                    + str(function_response)
+                                    + result_text
                                 ),
                                 name=function_name,
                             )
@@ -364,7 +445,7 @@ class Agent(BaseAgent):
                         # Add the function response to messages for context
                         # LLM-specific implementations format the message appropriately
                         function_result_msg = self.llm.format_function_result_message(
-                            function_name, str(function_response), tool_use_id
+                            function_name, result_text, tool_use_id
                         )
                         messages.append(function_result_msg)
 
@@ -447,13 +528,81 @@ class Agent(BaseAgent):
 
         raise AgentError(f'Failed after maximum {self.max_retries} attempts.')
 
+    async def stream_document(
+        self,
+        document: DocumentMessageContent,
+        instruction: str = 'Process the following part of a document.',
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[DocumentChunk, str]]:
+        """
+        Run the agent on a document chunk by chunk, as pages are extracted.
+
+        Each chunk is sent to the LLM on its own, together with the agent's system
+        prompt and the given instruction, so the first response is available
+        before the rest of the document has been extracted. The conversation
+        history is left untouched.
+
+        Args:
+            document: Document to stream (PDF or TXT)
+            instruction: Instruction placed before every chunk's text
+            variables: Variables used to resolve the system prompt and instruction
+
+        Yields:
+            Tuples of (chunk, response text) in document order
+        """
+        variables = variables or {}
+        system_content = resolve_variables(self.system_prompt, variables)
+        resolved_instruction = resolve_variables(instruction, variables)
+
+        async for chunk in get_default_processor().stream_document(document):
+            messages = [
+                {'role': MessageType.SYSTEM, 'content': system_content},
+                {
+                    'role': MessageType.USER,
+                    'content': f'{resolved_instruction}\n\n{chunk.text}',
+                },
+            ]
+            response = await self.llm.generate(
+                messages, output_schema=self.output_schema
+            )
+            yield chunk, self.llm.get_message_content(response)
+
+    def _tool_set_key(self) -> Tuple[Any, ...]:
+        # Holding the tools themselves (not ids) keeps the key from matching a
+        # different tool set after the old tools are garbage collected
+        return tuple((tool, tool.schema_version) for tool in self.tools)
+
+    def _cached_for_tools(self, name: str, key: Any, build) -> Any:
+        cached = self._tool_schema_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = build()
+        self._tool_schema_cache[name] = (key, value)
+        return value
+
+    def _get_formatted_tools(self) -> List[Dict[str, Any]]:
+        """Tool schemas in the LLM's format, rebuilt only when the LLM or tools change"""
+        return self._cached_for_tools(
+            'schemas',
+            (self.llm, self._tool_set_key()),
+            lambda: self.llm.format_tools_for_llm(self.tools),
+        )
+
+    def _get_tools_description(self) -> str:
+        """Tool list for the ReACT and CoT prompts"""
+        return self._cached_for_tools(
+            'description',
+            self._tool_set_key(),
+            lambda: '\n'.join(
+                f'- {tool.name}: {tool.description}' for tool in self.tools
+            ),
+        )
+
     def _get_react_prompt(self, variables: Optional[Dict[str, Any]] = None) -> str:
         """Get system prompt modified for ReACT pattern"""
         variables = variables or {}
 
-        tools_desc = '\n'.join(
-            [f'- {tool.name}: {tool.description}' for tool in self.tools]
-        )
+        tools_desc = self._get_tools_description()
 
         # Resolve variables in the base system prompt
         resolved_system_prompt = resolve_variables(self.system_prompt, variables)
@@ -484,9 +633,7 @@ class Agent(BaseAgent):
         """Get system prompt modified for Chain of Thought pattern"""
         variables = variables or {}
 
-        tools_desc = '\n'.join(
-            [f'- {tool.name}: {tool.description}' for tool in self.tools]
-        )
+        tools_desc = self._get_tools_description()
 
         # Resolve variables in the base system prompt
         resolved_system_prompt = resolve_variables(self.system_prompt, variables)
@@ -515,103 +662,71 @@ class Agent(BaseAgent):
         return cot_prompt
 
     async def _is_final_answer(
-        self, message: str, tool_call_count: int, messages: List[Dict[str, Any]]
+        self,
+        message: str,
+        tool_call_count: int,
+        messages: List[Dict[str, Any]],
+        response: Any = None,
     ) -> bool:
         """
         Determine if a message is a final answer or intermediate reasoning.
-        Uses structured token detection (like LangChain's ReAct) with LLM fallback.
 
-        Approach inspired by LangChain/CrewAI:
-        1. Primary: Check for explicit "Final Answer:" token
-        2. Fallback: Use LLM-based classification for robustness
+        Cheap signals (the "Final Answer:" token, output schema, provider finish
+        reason, local heuristics) are tried before an optional LLM classifier;
+        see FinalAnswerDetector.
         """
-        message_stripped = message.strip()
-        message_lower = message_stripped.lower()
-
-        # Primary Detection: Explicit "Final Answer:" token (ReAct pattern)
-        # This is the most reliable method used by LangChain and similar frameworks
-        if message_stripped.startswith('Final Answer:') or message_lower.startswith(
-            'final answer:'
-        ):
-            logger.debug('Explicit "Final Answer:" token detected - this is final')
-            return True
-
-        # Check if "Final Answer:" appears anywhere in the response
-        # (agent might add context before the token)
-        if 'final answer:' in message_lower:
-            logger.debug('"Final Answer:" token found in response - treating as final')
-            return True
-
-        # Secondary Detection: Use LLM-based analysis for cases without explicit tokens
-        # This handles:
-        # - Agents not following the format perfectly
-        # - Direct mode (without ReAct/CoT patterns)
-        # - Edge cases where the agent provides answer without token
-
-        analysis_prompt = f"""You are a classifier that determines if an AI agent's response is a FINAL ANSWER or INTERMEDIATE REASONING.
-
-Agent's Response:
-"{message_stripped}"
-
-Context:
-- Tool calls executed so far: {tool_call_count}
-- Total conversation turns: {len(messages)}
-
-Classification Criteria:
-
-FINAL ANSWER - The response is final if it:
-✓ Directly answers the user's original question with concrete information
-✓ Provides specific data, results, or conclusions
-✓ Does not suggest or request additional actions
-✓ Reads like a complete, standalone answer
-✓ Contains synthesis of information already gathered
-
-INTERMEDIATE REASONING - The response is intermediate if it:
-✗ Describes plans or intentions for what to do next
-✗ Expresses need to gather more information
-✗ Contains thinking/reasoning WITHOUT providing the actual answer
-✗ Poses questions or expresses uncertainty about next steps
-✗ Mentions specific tools it wants to use
-
-Examples of INTERMEDIATE:
-- "I need to query the database schema first"
-- "Let me check the table structure"
-- "First, I should examine..."
-
-Examples of FINAL:
-- "Based on the query results, the table contains 1,245 records..."
-- "The analysis shows that revenue increased by 23%..."
-- "After examining the data, the answer is..."
-
-Respond with EXACTLY one word: "FINAL" or "INTERMEDIATE"
-"""
-
-        try:
-            analysis_messages = [
-                {
-                    'role': MessageType.SYSTEM,
-                    'content': 'You are a precise classification system. Respond with only FINAL or INTERMEDIATE.',
-                },
-                {'role': MessageType.USER, 'content': analysis_prompt},
-            ]
-            analysis_response = await self.llm.generate(analysis_messages)
-            analysis = self.llm.get_message_content(analysis_response).strip().upper()
-
-            is_final = 'FINAL' in analysis
-            msg_preview = (
-                message_stripped[:80]
-                if len(message_stripped) > 80
-                else message_stripped
-            )
-            logger.debug(
-                f'LLM classifier: "{analysis}" -> is_final={is_final} (message preview: "{msg_preview}...")'
-            )
-            return is_final
+        is_final, method = await self.final_answer_detector.decide(
+            self.llm,
+            message,
+            reasoning_pattern=self.reasoning_pattern,
+            response=response,
+            output_schema=self.output_schema,
+            tool_call_count=tool_call_count,
+            messages=messages,
+        )
+        agent_metrics.record_final_answer_decision(self.name, method, is_final)
+        logger.debug(f'Final answer decision by {method}: is_final={is_final}')
+        return is_final
 
-        except Exception as e:
-            logger.warning(
-                f'LLM classification failed: {e}. Defaulting to final=False to allow continuation.'
-            )
-            # Conservative default: treat as intermediate to avoid premature exit
-            # This is safer as it allows the agent to continue rather than stopping too early
-            return False
+    async def _call_tool(
+        self,
+        tool: Tool,
+        function_args: Dict[str, Any],
+        prefetch: Optional[Prefetch] = None,
+    ) -> Any:
+        """Run a tool call, reusing the prefetched result when it is the same call"""
+        add_tool_call()
+        if prefetch is not None and prefetch.matches(tool.name, function_args):
+            add_cache_hit()
+            return await prefetch.result()
+        return await tool.run(inputs=[], variables=None, **function_args)
+
+    def _latest_user_text(self) -> str:
+        """Text of the most recent user message, used to pick prefetch statistics"""
+        for message in reversed(self.conversation_history):
+            if isinstance(message, UserMessage):
+                content = message.content
+                if isinstance(content, TextMessageContent):
+                    return content.text
+                if isinstance(content, str):
+                    return content
+        return ''
+
+    def _finish_with_tool_call(
+        self, function_call: Dict[str, Any]
+    ) -> List[BaseMessage]:
+        """End the run with the answer passed to the finish tool"""
+        arguments = function_call['arguments']
+        if isinstance(arguments, str):
+            try:
+                arguments = json.loads(arguments)
+            except json.JSONDecodeError:
+                arguments = {'answer': arguments}
+        answer = str(arguments.get('answer', ''))
+
+        self.final_answer_detector.record('finish_tool', True)
+        agent_metrics.record_final_answer_decision(self.name, 'finish_tool', True)
+
+        role = self.act_as if self.act_as is not None else MessageType.ASSISTANT
+        self.add_to_history(AssistantMessage(role=role, content=answer))
+        return self.conversation_history
@@ -4,7 +4,9 @@ Document-related data models for Flo AI framework.
 This module contains document types and message classes to avoid circular imports.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any, Dict, Optional
 
 
 class DocumentType(Enum):
@@ -12,3 +14,20 @@ class DocumentType(Enum):
 
     PDF = 'application/pdf'
     TXT = 'text/plain'
+
+
+@dataclass
+class DocumentChunk:
+    """A piece of a document yielded by streaming extraction.
+
+    Attributes:
+        text: Extracted text of the chunk
+        chunk_index: Zero-based position of the chunk in the document
+        page_number: One-based page number (None for documents without pages)
+        metadata: Additional chunk-level metadata
+    """
+
+    text: str
+    chunk_index: int
+    page_number: Optional[int] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,225 @@
+"""
+Deciding whether a tool-using agent's text response ends the run.
+
+When the LLM answers without calling a tool, the agent has to tell a final
+answer from intermediate reasoning. Signals are tried cheapest first, and an
+extra LLM call is only made when none of them decides:
+
+1. ``token``: an explicit "Final Answer:" marker
+2. ``schema``: a JSON object answering an agent with an output schema
+3. ``finish_reason``: output cut by the token limit is never final; in direct
+   mode a model that ended its turn without calling a tool has answered
+4. ``heuristic``: short text made only of plans ("I need to...", "Let me...")
+   and ReAct ``Action:`` lines are intermediate; in direct mode anything else
+   is final
+5. ``llm``: an optional classifier call, for ReAct/CoT text without a marker
+6. ``default``: the configured answer when the classifier is disabled or fails
+
+Calls to the agent's dedicated finish tool are decided before any of these and
+counted as ``finish_tool``.
+"""
+
+import json
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from aurora_ai.models.base_agent import ReasoningPattern
+from aurora_ai.models.chat_message import MessageType
+from aurora_ai.tool.base_tool import Tool
+from aurora_ai.utils.logger import logger
+
+FINISH_TOOL_NAME = 'final_answer'
+
+_FINAL_TOKEN = 'final answer:'
+
+_PLANNING = re.compile(
+    r'^\s*(?:thought:\s*)?(?:ok(?:ay)?[,.]?\s*|now[,]?\s*|next[,]?\s*|first[,]?\s*)?'
+    r"(?:i need to|i will|i'll|i should|i must|i am going to|i'm going to|"
+    r"let me(?! know)|let's|we need to|to answer this|to do this)\b",
+    re.IGNORECASE,
+)
+
+# Plans are short; longer text likely carries an answer
+_MAX_PLAN_LENGTH = 300
+
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?:])\s+')
+
+_REACT_ACTION = re.compile(r'^\s*action\s*:', re.IGNORECASE | re.MULTILINE)
+
+_CLASSIFIER_PROMPT = """You are a classifier that determines if an AI agent's response is a FINAL ANSWER or INTERMEDIATE REASONING.
+
+Agent's Response:
+"{message}"
+
+Context:
+- Tool calls executed so far: {tool_call_count}
+- Total conversation turns: {turns}
+
+Classification Criteria:
+
+FINAL ANSWER - The response is final if it:
+✓ Directly answers the user's original question with concrete information
+✓ Provides specific data, results, or conclusions
+✓ Does not suggest or request additional actions
+✓ Reads like a complete, standalone answer
+✓ Contains synthesis of information already gathered
+
+INTERMEDIATE REASONING - The response is intermediate if it:
+✗ Describes plans or intentions for what to do next
+✗ Expresses need to gather more information
+✗ Contains thinking/reasoning WITHOUT providing the actual answer
+✗ Poses questions or expresses uncertainty about next steps
+✗ Mentions specific tools it wants to use
+
+Examples of INTERMEDIATE:
+- "I need to query the database schema first"
+- "Let me check the table structure"
+- "First, I should examine..."
+
+Examples of FINAL:
+- "Based on the query results, the table contains 1,245 records..."
+- "The analysis shows that revenue increased by 23%..."
+- "After examining the data, the answer is..."
+
+Respond with EXACTLY one word: "FINAL" or "INTERMEDIATE"
+"""
+
+
+def create_finish_tool() -> Tool:
+    """Tool the LLM calls with its complete answer to end the run"""
+
+    async def final_answer(answer: str) -> str:
+        return answer
+
+    return Tool(
+        name=FINISH_TOOL_NAME,
+        description=(
+            'Call this once you have everything needed, with your complete '
+            'final answer to the user. Do not call other tools afterwards.'
+        ),
+        function=final_answer,
+        parameters={
+            'answer': {
+                'type': 'string',
+                'description': 'The complete final answer for the user',
+            }
+        },
+    )
+
+
+class FinalAnswerDetector:
+    """
+    Decide whether a text response without a tool call is final.
+
+    Args:
+        llm_classifier: Ask the LLM when no cheaper signal decides. When False,
+            undecided responses get ``default``.
+        default: Decision when the classifier is disabled or fails. False keeps
+            the agent going, which is safer than stopping too early.
+
+    Attributes:
+        counts: Number of decisions per ``(method, is_final)``
+    """
+
+    def __init__(self, llm_classifier: bool = True, default: bool = False):
+        self.llm_classifier = llm_classifier
+        self.default = default
+        self.counts: Counter = Counter()
+
+    def record(self, method: str, is_final: bool) -> Tuple[bool, str]:
+        self.counts[(method, is_final)] += 1
+        return is_final, method
+
+    async def decide(
+        self,
+        llm: Any,
+        message: str,
+        reasoning_pattern: ReasoningPattern = ReasoningPattern.DIRECT,
+        response: Any = None,
+        output_schema: Optional[Dict[str, Any]] = None,
+        tool_call_count: int = 0,
+        messages: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[bool, str]:
+        """Return ``(is_final, method)`` for the response text ``message``"""
+        text = message.strip()
+
+        if _FINAL_TOKEN in text.lower():
+            return self.record('token', True)
+
+        if output_schema and _is_json_object(text):
+            return self.record('schema', True)
+
+        finish_reason = (
+            llm.get_finish_reason(response) if response is not None else None
+        )
+        if finish_reason == 'length':
+            return self.record('finish_reason', False)
+
+        direct = reasoning_pattern == ReasoningPattern.DIRECT
+        # Native tool calling: not calling a tool means the model is done
+        if direct and finish_reason == 'stop':
+            return self.record('finish_reason', True)
+
+        if _is_plan(text) or _REACT_ACTION.search(text):
+            return self.record('heuristic', False)
+
+        if direct:
+            return self.record('heuristic', True)
+
+        if self.llm_classifier:
+            is_final = await self._classify(llm, text, tool_call_count, messages or [])
+            if is_final is not None:
+                return self.record('llm', is_final)
+
+        return self.record('default', self.default)
+
+    async def _classify(
+        self,
+        llm: Any,
+        message: str,
+        tool_call_count: int,
+        messages: List[Dict[str, Any]],
+    ) -> Optional[bool]:
+        analysis_messages = [
+            {
+                'role': MessageType.SYSTEM,
+                'content': 'You are a precise classification system. Respond with only FINAL or INTERMEDIATE.',
+            },
+            {
+                'role': MessageType.USER,
+                'content': _CLASSIFIER_PROMPT.format(
+                    message=message,
+                    tool_call_count=tool_call_count,
+                    turns=len(messages),
+                ),
+            },
+        ]
+        try:
+            analysis_response = await llm.generate(analysis_messages)
+            analysis = llm.get_message_content(analysis_response).strip().upper()
+        except Exception as e:
+            logger.warning(f'LLM classification failed: {e}')
+            return None
+
+        is_final = 'FINAL' in analysis
+        logger.debug(
+            f'LLM classifier: "{analysis}" -> is_final={is_final} (message preview: "{message[:80]}...")'
+        )
+        return is_final
+
+
+def _is_plan(text: str) -> bool:
+    """Whether ``text`` is short and every sentence of it is a plan"""
+    if len(text) > _MAX_PLAN_LENGTH:
+        return False
+    return all(_PLANNING.match(sentence) for sentence in _SENTENCE_BREAK.split(text))
+
+
+def _is_json_object(text: str) -> bool:
+    if not text.startswith('{'):
+        return False
+    try:
+        return isinstance(json.loads(text), dict)
+    except ValueError:
+        return False
@@ -0,0 +1,169 @@
+"""
+Speculative prefetching of an agent's first tool call.
+
+Many runs of an agent start with the same tool call (a schema lookup, a
+profile fetch) whatever the exact question. ``ToolPrefetcher`` keeps a window
+of the first calls seen per input pattern, and once one call clearly dominates
+it starts that call concurrently with the first LLM request. If the LLM asks
+for exactly that call the prefetched result is used, overlapping tool latency
+with LLM latency; otherwise the call is cancelled and its result discarded.
+
+Only idempotent tools are prefetched, since a discarded call must have no
+side effects.
+"""
+
+import asyncio
+import json
+from collections import Counter, defaultdict, deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from aurora_ai.tool.base_tool import Tool
+from aurora_ai.utils.logger import logger
+
+# Tool name and canonical JSON arguments of a call
+_Signature = Tuple[str, str]
+
+# Marks runs whose first response was not a tool call
+_NO_TOOL = None
+
+
+def _signature(name: str, arguments: Dict[str, Any]) -> _Signature:
+    return name, json.dumps(arguments, sort_keys=True, default=repr)
+
+
+class Prefetch:
+    """A tool call started before the LLM asked for it"""
+
+    def __init__(self, tool: Tool, arguments: Dict[str, Any]):
+        self.name = tool.name
+        self.arguments = arguments
+        self.signature = _signature(tool.name, arguments)
+        self.task = asyncio.ensure_future(tool.execute(**arguments))
+        # Failures surface when the result is used; unused ones are dropped
+        self.task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    def matches(self, name: str, arguments: Dict[str, Any]) -> bool:
+        return self.signature == _signature(name, arguments)
+
+    async def result(self) -> Any:
+        return await self.task
+
+    def cancel(self):
+        self.task.cancel()
+
+
+class ToolPrefetcher:
+    """
+    Predicts an agent's first tool call and starts it ahead of the LLM.
+
+    Share one prefetcher between agents built from the same configuration to
+    pool their statistics.
+
+    Args:
+        pattern: Maps the user's input text to a pattern; runs with the same
+            pattern share statistics. By default all inputs share one pattern.
+        min_observations: Runs to observe for a pattern before prefetching
+        min_probability: Share of the observed runs that must have started with
+            the same call
+        window: Most recent runs remembered per pattern
+
+    Attributes:
+        started: Prefetched calls started
+        used: Prefetched calls whose result was used
+        discarded: Prefetched calls cancelled because the LLM asked for
+            something else
+    """
+
+    def __init__(
+        self,
+        pattern: Optional[Callable[[str], str]] = None,
+        min_observations: int = 3,
+        min_probability: float = 0.8,
+        window: int = 50,
+    ):
+        if min_observations < 1:
+            raise ValueError('min_observations must be at least 1')
+        if not 0 < min_probability <= 1:
+            raise ValueError('min_probability must be in (0, 1]')
+        if window < min_observations:
+            raise ValueError('window must be at least min_observations')
+        self.pattern = pattern or (lambda text: '')
+        self.min_observations = min_observations
+        self.min_probability = min_probability
+        self.window = window
+        # (signature, arguments) of recent first calls; arguments leave with
+        # their entry, so memory stays bounded by the windows
+        self._history: Dict[str, Deque[Tuple[Optional[_Signature], Dict[str, Any]]]] = (
+            defaultdict(lambda: deque(maxlen=self.window))
+        )
+        self.started = 0
+        self.used = 0
+        self.discarded = 0
+
+    def observe(self, pattern: str, name: Optional[str], arguments: Dict[str, Any]):
+        """Record the first tool call of a run (``name`` None for no tool call)"""
+        if name is None:
+            self._history[pattern].append((_NO_TOOL, {}))
+            return
+        self._history[pattern].append((_signature(name, arguments), arguments))
+
+    def predict(self, pattern: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """The ``(tool name, arguments)`` likely to be called first, if any"""
+        history = self._history.get(pattern)
+        if not history or len(history) < self.min_observations:
+            return None
+        counts = Counter(signature for signature, _ in history)
+        signature, count = counts.most_common(1)[0]
+        if signature is _NO_TOOL or count / len(history) < self.min_probability:
+            return None
+        arguments = next(a for s, a in reversed(history) if s == signature)
+        return signature[0], arguments
+
+    def start(self, pattern: str, tools: Dict[str, Tool]) -> Optional[Prefetch]:
+        """Start the predicted call for ``pattern`` if its tool is idempotent"""
+        prediction = self.predict(pattern)
+        if prediction is None:
+            return None
+        name, arguments = prediction
+        tool = tools.get(name)
+        if tool is None or not tool.idempotent:
+            return None
+        logger.debug(f'Prefetching tool {name} with {arguments}')
+        self.started += 1
+        return Prefetch(tool, dict(arguments))
+
+    def settle(
+        self,
+        pattern: str,
+        prefetch: Optional[Prefetch],
+        function_call: Optional[Dict[str, Any]],
+    ) -> Optional[Prefetch]:
+        """
+        Record the first LLM response of a run and resolve the prefetch.
+
+        Returns the prefetch if the LLM asked for the same call, otherwise
+        cancels it and returns None.
+        """
+        name, arguments = None, {}
+        if function_call:
+            arguments = function_call['arguments']
+            if isinstance(arguments, str):
+                try:
+                    arguments = json.loads(arguments)
+                except json.JSONDecodeError:
+                    arguments = None
+            if isinstance(arguments, dict):
+                name = function_call['name']
+                self.observe(pattern, name, arguments)
+        else:
+            self.observe(pattern, None, {})
+
+        if prefetch is None:
+            return None
+        if name is not None and prefetch.matches(name, arguments):
+            self.used += 1
+            return prefetch
+        logger.debug(f'Discarding prefetched call to {prefetch.name}')
+        self.discarded += 1
+        prefetch.cancel()
+        return None
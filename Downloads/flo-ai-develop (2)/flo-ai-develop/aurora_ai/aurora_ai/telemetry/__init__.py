@@ -4,16 +4,20 @@ OpenTelemetry integration for aurora_ai
 
 from .telemetry import (
     FloTelemetry,
+    TailSamplingPolicy,
     get_tracer,
     get_meter,
     configure_telemetry,
     shutdown_telemetry,
+    record_details,
 )
 
 __all__ = [
     'FloTelemetry',
+    'TailSamplingPolicy',
     'get_tracer',
     'get_meter',
     'configure_telemetry',
     'shutdown_telemetry',
+    'record_details',
 ]
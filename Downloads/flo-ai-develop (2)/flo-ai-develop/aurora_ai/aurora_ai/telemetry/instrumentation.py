@@ -5,74 +5,141 @@ Instrumentation utilities for aurora_ai components
 from typing import Optional, Dict, Any, Callable
 from functools import wraps
 from opentelemetry.trace import Status, StatusCode, Span
-from .telemetry import get_tracer, get_meter
+from .telemetry import get_tracer, get_meter, record_details
+from aurora_ai.utils.usage import add_llm_call, add_tokens, mark_first_token
 import time
 import asyncio
 
 
-class LLMMetrics:
-    """Metrics for LLM operations"""
+class MetricsRegistry:
+    """
+    Instruments created on first use, on the meter configured at that time.
+
+    The metric classes below are instantiated when this module is imported,
+    which is usually before ``configure_telemetry`` runs, so they cannot create
+    their instruments up front. The registry creates each instrument the first
+    time it is recorded to after a meter exists, and creates them again if
+    telemetry is reconfigured with a new meter.
+    """
 
     def __init__(self):
-        self.meter = get_meter()
-        if self.meter:
-            # Token counters
-            self.token_counter = self.meter.create_counter(
-                name='llm.tokens.total',
-                description='Total number of tokens used',
-                unit='tokens',
+        self._meter = None
+        self._instruments: Dict[str, Any] = {}
+
+    def instrument(
+        self, kind: str, name: str, description: str, unit: str
+    ) -> Optional[Any]:
+        """Return the 'counter' or 'histogram' called ``name``, None without a meter"""
+        meter = get_meter()
+        if meter is None:
+            return None
+        if meter is not self._meter:
+            self._meter = meter
+            self._instruments = {}
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            create = (
+                meter.create_counter if kind == 'counter' else meter.create_histogram
             )
+            instrument = create(name=name, description=description, unit=unit)
+            self._instruments[name] = instrument
+        return instrument
 
-            self.prompt_tokens_counter = self.meter.create_counter(
-                name='llm.tokens.prompt',
-                description='Number of prompt tokens',
-                unit='tokens',
-            )
 
-            self.completion_tokens_counter = self.meter.create_counter(
-                name='llm.tokens.completion',
-                description='Number of completion tokens',
-                unit='tokens',
-            )
+metrics_registry = MetricsRegistry()
 
-            # Request counters
-            self.request_counter = self.meter.create_counter(
-                name='llm.requests.total',
-                description='Total number of LLM requests',
-                unit='requests',
-            )
 
-            self.error_counter = self.meter.create_counter(
-                name='llm.errors.total',
-                description='Total number of LLM errors',
-                unit='errors',
-            )
+class _Instrument:
+    """Metric class attribute resolving to its instrument, or None before configuration"""
 
-            # Latency histogram
-            self.latency_histogram = self.meter.create_histogram(
-                name='llm.request.duration',
-                description='Duration of LLM requests',
-                unit='ms',
-            )
+    def __init__(self, kind: str, name: str, description: str, unit: str):
+        self.spec = (kind, name, description, unit)
 
-            # Streaming metrics
-            self.stream_counter = self.meter.create_counter(
-                name='llm.streams.total',
-                description='Total number of LLM stream requests',
-                unit='streams',
-            )
+    def __get__(self, obj, owner=None) -> Optional[Any]:
+        if obj is None:
+            return self
+        return metrics_registry.instrument(*self.spec)
 
-            self.stream_chunks_counter = self.meter.create_counter(
-                name='llm.stream.chunks.total',
-                description='Total number of stream chunks received',
-                unit='chunks',
-            )
 
-            self.stream_duration_histogram = self.meter.create_histogram(
-                name='llm.stream.duration',
-                description='Duration of LLM streaming requests',
-                unit='ms',
-            )
+class AttributeSets:
+    """
+    Attribute dicts for a fixed list of attribute names, built once per values.
+
+    Recording with ``attributes.get(model, provider)`` reuses the same dict for
+    the same values instead of building one on every call. At most
+    ``max_sets`` combinations are kept; further ones are built per call.
+    The returned dicts are shared and must not be modified.
+    """
+
+    def __init__(self, *names: str, max_sets: int = 1024):
+        self.names = names
+        self.max_sets = max_sets
+        self._sets: Dict[tuple, Dict[str, Any]] = {}
+
+    def get(self, *values: Any) -> Dict[str, Any]:
+        attributes = self._sets.get(values)
+        if attributes is None:
+            attributes = dict(zip(self.names, values))
+            if len(self._sets) < self.max_sets:
+                self._sets[values] = attributes
+        return attributes
+
+
+class LLMMetrics:
+    """Metrics for LLM operations"""
+
+    # Token counters
+    token_counter = _Instrument(
+        'counter', 'llm.tokens.total', 'Total number of tokens used', 'tokens'
+    )
+    prompt_tokens_counter = _Instrument(
+        'counter', 'llm.tokens.prompt', 'Number of prompt tokens', 'tokens'
+    )
+    completion_tokens_counter = _Instrument(
+        'counter', 'llm.tokens.completion', 'Number of completion tokens', 'tokens'
+    )
+
+    # Request counters
+    request_counter = _Instrument(
+        'counter', 'llm.requests.total', 'Total number of LLM requests', 'requests'
+    )
+    error_counter = _Instrument(
+        'counter', 'llm.errors.total', 'Total number of LLM errors', 'errors'
+    )
+
+    # Latency histogram
+    latency_histogram = _Instrument(
+        'histogram', 'llm.request.duration', 'Duration of LLM requests', 'ms'
+    )
+
+    # Streaming metrics
+    stream_counter = _Instrument(
+        'counter',
+        'llm.streams.total',
+        'Total number of LLM stream requests',
+        'streams',
+    )
+    stream_chunks_counter = _Instrument(
+        'counter',
+        'llm.stream.chunks.total',
+        'Total number of stream chunks received',
+        'chunks',
+    )
+    stream_duration_histogram = _Instrument(
+        'histogram',
+        'llm.stream.duration',
+        'Duration of LLM streaming requests',
+        'ms',
+    )
+
+    def __init__(self):
+        self._model_attributes = AttributeSets('model', 'provider')
+        self._status_attributes = AttributeSets('model', 'provider', 'status')
+        self._error_attributes = AttributeSets('model', 'provider', 'error_type')
+
+    @property
+    def meter(self):
+        return get_meter()
 
     def record_tokens(
         self,
@@ -82,11 +149,12 @@ class LLMMetrics:
         model: str = '',
         provider: str = '',
     ):
-        """Record token usage"""
+        """Record token usage, also on the usage of the running workflow node"""
+        add_tokens(prompt_tokens, completion_tokens)
         if not self.meter:
             return
 
-        attributes = {'model': model, 'provider': provider}
+        attributes = self._model_attributes.get(model, provider)
 
         if total_tokens > 0:
             self.token_counter.add(total_tokens, attributes)
@@ -99,197 +167,204 @@ class LLMMetrics:
         self, model: str = '', provider: str = '', status: str = 'success'
     ):
         """Record LLM request"""
-        if not self.meter:
+        counter = self.request_counter
+        if counter is None:
             return
-
-        attributes = {'model': model, 'provider': provider, 'status': status}
-        self.request_counter.add(1, attributes)
+        counter.add(1, self._status_attributes.get(model, provider, status))
 
     def record_error(self, model: str = '', provider: str = '', error_type: str = ''):
         """Record LLM error"""
-        if not self.meter:
+        counter = self.error_counter
+        if counter is None:
             return
-
-        attributes = {'model': model, 'provider': provider, 'error_type': error_type}
-        self.error_counter.add(1, attributes)
+        counter.add(1, self._error_attributes.get(model, provider, error_type))
 
     def record_latency(self, duration_ms: float, model: str = '', provider: str = ''):
         """Record request latency"""
-        if not self.meter:
+        histogram = self.latency_histogram
+        if histogram is None:
             return
-
-        attributes = {'model': model, 'provider': provider}
-        self.latency_histogram.record(duration_ms, attributes)
+        histogram.record(duration_ms, self._model_attributes.get(model, provider))
 
     def record_stream(
         self, model: str = '', provider: str = '', status: str = 'success'
     ):
         """Record LLM stream request"""
-        if not self.meter:
+        counter = self.stream_counter
+        if counter is None:
             return
-
-        attributes = {'model': model, 'provider': provider, 'status': status}
-        self.stream_counter.add(1, attributes)
+        counter.add(1, self._status_attributes.get(model, provider, status))
 
     def record_stream_chunks(
         self, chunk_count: int, model: str = '', provider: str = ''
     ):
         """Record stream chunks received"""
-        if not self.meter:
+        counter = self.stream_chunks_counter
+        if counter is None:
             return
-
-        attributes = {'model': model, 'provider': provider}
-        self.stream_chunks_counter.add(chunk_count, attributes)
+        counter.add(chunk_count, self._model_attributes.get(model, provider))
 
     def record_stream_latency(
         self, duration_ms: float, model: str = '', provider: str = ''
     ):
         """Record stream request latency"""
-        if not self.meter:
+        histogram = self.stream_duration_histogram
+        if histogram is None:
             return
-
-        attributes = {'model': model, 'provider': provider}
-        self.stream_duration_histogram.record(duration_ms, attributes)
+        histogram.record(duration_ms, self._model_attributes.get(model, provider))
 
 
 class AgentMetrics:
     """Metrics for Agent operations"""
 
-    def __init__(self):
-        self.meter = get_meter()
-        if self.meter:
-            # Execution counters
-            self.execution_counter = self.meter.create_counter(
-                name='agent.executions.total',
-                description='Total number of agent executions',
-                unit='executions',
-            )
-
-            self.tool_call_counter = self.meter.create_counter(
-                name='agent.tool_calls.total',
-                description='Total number of tool calls',
-                unit='calls',
-            )
+    # Execution counters
+    execution_counter = _Instrument(
+        'counter',
+        'agent.executions.total',
+        'Total number of agent executions',
+        'executions',
+    )
+    tool_call_counter = _Instrument(
+        'counter', 'agent.tool_calls.total', 'Total number of tool calls', 'calls'
+    )
+    retry_counter = _Instrument(
+        'counter', 'agent.retries.total', 'Total number of retries', 'retries'
+    )
+    error_counter = _Instrument(
+        'counter', 'agent.errors.total', 'Total number of agent errors', 'errors'
+    )
+    final_answer_counter = _Instrument(
+        'counter',
+        'agent.final_answer_decisions.total',
+        'Final answer decisions by detection method',
+        'decisions',
+    )
+
+    # Latency histogram
+    latency_histogram = _Instrument(
+        'histogram',
+        'agent.execution.duration',
+        'Duration of agent executions',
+        'ms',
+    )
 
-            self.retry_counter = self.meter.create_counter(
-                name='agent.retries.total',
-                description='Total number of retries',
-                unit='retries',
-            )
-
-            self.error_counter = self.meter.create_counter(
-                name='agent.errors.total',
-                description='Total number of agent errors',
-                unit='errors',
-            )
+    def __init__(self):
+        self._execution_attributes = AttributeSets('agent_name', 'agent_type', 'status')
+        self._tool_attributes = AttributeSets('agent_name', 'tool_name', 'status')
+        self._retry_attributes = AttributeSets('agent_name', 'reason')
+        self._error_attributes = AttributeSets('agent_name', 'error_type')
+        self._decision_attributes = AttributeSets('agent_name', 'method', 'is_final')
+        self._latency_attributes = AttributeSets('agent_name', 'agent_type')
 
-            # Latency histogram
-            self.latency_histogram = self.meter.create_histogram(
-                name='agent.execution.duration',
-                description='Duration of agent executions',
-                unit='ms',
-            )
+    @property
+    def meter(self):
+        return get_meter()
 
     def record_execution(
         self, agent_name: str = '', agent_type: str = '', status: str = 'success'
     ):
         """Record agent execution"""
-        if not self.meter:
+        counter = self.execution_counter
+        if counter is None:
             return
-
-        attributes = {
-            'agent_name': agent_name,
-            'agent_type': agent_type,
-            'status': status,
-        }
-        self.execution_counter.add(1, attributes)
+        counter.add(1, self._execution_attributes.get(agent_name, agent_type, status))
 
     def record_tool_call(
         self, agent_name: str = '', tool_name: str = '', status: str = 'success'
     ):
         """Record tool call"""
-        if not self.meter:
+        counter = self.tool_call_counter
+        if counter is None:
             return
-
-        attributes = {
-            'agent_name': agent_name,
-            'tool_name': tool_name,
-            'status': status,
-        }
-        self.tool_call_counter.add(1, attributes)
+        counter.add(1, self._tool_attributes.get(agent_name, tool_name, status))
 
     def record_retry(self, agent_name: str = '', reason: str = ''):
         """Record retry attempt"""
-        if not self.meter:
+        counter = self.retry_counter
+        if counter is None:
             return
-
-        attributes = {'agent_name': agent_name, 'reason': reason}
-        self.retry_counter.add(1, attributes)
+        counter.add(1, self._retry_attributes.get(agent_name, reason))
 
     def record_error(self, agent_name: str = '', error_type: str = ''):
         """Record agent error"""
-        if not self.meter:
+        counter = self.error_counter
+        if counter is None:
             return
+        counter.add(1, self._error_attributes.get(agent_name, error_type))
 
-        attributes = {'agent_name': agent_name, 'error_type': error_type}
-        self.error_counter.add(1, attributes)
+    def record_final_answer_decision(
+        self, agent_name: str = '', method: str = '', is_final: bool = False
+    ):
+        """Record how a final answer decision was made"""
+        counter = self.final_answer_counter
+        if counter is None:
+            return
+        counter.add(1, self._decision_attributes.get(agent_name, method, is_final))
 
     def record_latency(
         self, duration_ms: float, agent_name: str = '', agent_type: str = ''
     ):
         """Record execution latency"""
-        if not self.meter:
+        histogram = self.latency_histogram
+        if histogram is None:
             return
-
-        attributes = {'agent_name': agent_name, 'agent_type': agent_type}
-        self.latency_histogram.record(duration_ms, attributes)
+        histogram.record(
+            duration_ms, self._latency_attributes.get(agent_name, agent_type)
+        )
 
 
 class WorkflowMetrics:
     """Metrics for aurora workflow operations"""
 
-    def __init__(self):
-        self.meter = get_meter()
-        if self.meter:
-            # Workflow counters
-            self.workflow_counter = self.meter.create_counter(
-                name='workflow.executions.total',
-                description='Total number of workflow executions',
-                unit='executions',
-            )
-
-            self.node_counter = self.meter.create_counter(
-                name='workflow.nodes.executed',
-                description='Total number of nodes executed',
-                unit='nodes',
-            )
-
-            self.error_counter = self.meter.create_counter(
-                name='workflow.errors.total',
-                description='Total number of workflow errors',
-                unit='errors',
-            )
-
-            # Latency histograms
-            self.workflow_latency = self.meter.create_histogram(
-                name='workflow.execution.duration',
-                description='Duration of workflow executions',
-                unit='ms',
-            )
+    # Workflow counters
+    workflow_counter = _Instrument(
+        'counter',
+        'workflow.executions.total',
+        'Total number of workflow executions',
+        'executions',
+    )
+    node_counter = _Instrument(
+        'counter',
+        'workflow.nodes.executed',
+        'Total number of nodes executed',
+        'nodes',
+    )
+    error_counter = _Instrument(
+        'counter', 'workflow.errors.total', 'Total number of workflow errors', 'errors'
+    )
+
+    # Latency histograms
+    workflow_latency = _Instrument(
+        'histogram',
+        'workflow.execution.duration',
+        'Duration of workflow executions',
+        'ms',
+    )
+    node_latency = _Instrument(
+        'histogram', 'workflow.node.duration', 'Duration of node executions', 'ms'
+    )
 
-            self.node_latency = self.meter.create_histogram(
-                name='workflow.node.duration',
-                description='Duration of node executions',
-                unit='ms',
-            )
+    def __init__(self):
+        self._workflow_attributes = AttributeSets('workflow_name', 'status')
+        self._node_attributes = AttributeSets(
+            'workflow_name', 'node_name', 'node_type', 'status'
+        )
+        self._error_attributes = AttributeSets('workflow_name', 'error_type')
+        self._latency_attributes = AttributeSets('workflow_name')
+        self._node_latency_attributes = AttributeSets(
+            'workflow_name', 'node_name', 'node_type'
+        )
+
+    @property
+    def meter(self):
+        return get_meter()
 
     def record_workflow(self, workflow_name: str = '', status: str = 'success'):
         """Record workflow execution"""
-        if not self.meter:
+        counter = self.workflow_counter
+        if counter is None:
             return
-
-        attributes = {'workflow_name': workflow_name, 'status': status}
-        self.workflow_counter.add(1, attributes)
+        counter.add(1, self._workflow_attributes.get(workflow_name, status))
 
     def record_node(
         self,
@@ -299,32 +374,27 @@ class WorkflowMetrics:
         status: str = 'success',
     ):
         """Record node execution"""
-        if not self.meter:
+        counter = self.node_counter
+        if counter is None:
             return
-
-        attributes = {
-            'workflow_name': workflow_name,
-            'node_name': node_name,
-            'node_type': node_type,
-            'status': status,
-        }
-        self.node_counter.add(1, attributes)
+        counter.add(
+            1,
+            self._node_attributes.get(workflow_name, node_name, node_type, status),
+        )
 
     def record_error(self, workflow_name: str = '', error_type: str = ''):
         """Record workflow error"""
-        if not self.meter:
+        counter = self.error_counter
+        if counter is None:
             return
-
-        attributes = {'workflow_name': workflow_name, 'error_type': error_type}
-        self.error_counter.add(1, attributes)
+        counter.add(1, self._error_attributes.get(workflow_name, error_type))
 
     def record_workflow_latency(self, duration_ms: float, workflow_name: str = ''):
         """Record workflow latency"""
-        if not self.meter:
+        histogram = self.workflow_latency
+        if histogram is None:
             return
-
-        attributes = {'workflow_name': workflow_name}
-        self.workflow_latency.record(duration_ms, attributes)
+        histogram.record(duration_ms, self._latency_attributes.get(workflow_name))
 
     def record_node_latency(
         self,
@@ -334,18 +404,16 @@ class WorkflowMetrics:
         node_type: str = '',
     ):
         """Record node latency"""
-        if not self.meter:
+        histogram = self.node_latency
+        if histogram is None:
             return
-
-        attributes = {
-            'workflow_name': workflow_name,
-            'node_name': node_name,
-            'node_type': node_type,
-        }
-        self.node_latency.record(duration_ms, attributes)
+        histogram.record(
+            duration_ms,
+            self._node_latency_attributes.get(workflow_name, node_name, node_type),
+        )
 
 
-# Global metric instances
+# Global metric instances; their instruments are bound on first use
 llm_metrics = LLMMetrics()
 agent_metrics = AgentMetrics()
 workflow_metrics = WorkflowMetrics()
@@ -368,9 +436,12 @@ def trace_llm_call(provider: str = '', model: str = ''):
     def decorator(func: Callable):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
+            add_llm_call()
             tracer = get_tracer()
             if not tracer:
-                return await func(*args, **kwargs)
+                result = await func(*args, **kwargs)
+                mark_first_token()
+                return result
 
             # Extract self to get instance attributes
             self_arg = args[0] if args else None
@@ -392,6 +463,7 @@ def trace_llm_call(provider: str = '', model: str = ''):
                 start_time = time.time()
                 try:
                     result = await func(*args, **kwargs)
+                    mark_first_token()
 
                     # Record success
                     duration_ms = (time.time() - start_time) * 1000
@@ -424,9 +496,12 @@ def trace_llm_call(provider: str = '', model: str = ''):
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
+            add_llm_call()
             tracer = get_tracer()
             if not tracer:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                mark_first_token()
+                return result
 
             self_arg = args[0] if args else None
             actual_model = model or (getattr(self_arg, 'model', '') if self_arg else '')
@@ -444,6 +519,7 @@ def trace_llm_call(provider: str = '', model: str = ''):
                 start_time = time.time()
                 try:
                     result = func(*args, **kwargs)
+                    mark_first_token()
 
                     duration_ms = (time.time() - start_time) * 1000
                     llm_metrics.record_request(actual_model, actual_provider, 'success')
@@ -495,9 +571,14 @@ def trace_llm_stream(provider: str = '', model: str = ''):
     def decorator(func: Callable):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
+            add_llm_call()
             tracer = get_tracer()
             if not tracer:
+                first = True
                 async for chunk in func(*args, **kwargs):
+                    if first:
+                        first = False
+                        mark_first_token()
                     yield chunk
                 return
 
@@ -528,6 +609,8 @@ def trace_llm_stream(provider: str = '', model: str = ''):
                     # Track the streaming response
                     async for chunk in func(*args, **kwargs):
                         chunk_count += 1
+                        if chunk_count == 1:
+                            mark_first_token()
                         yield chunk
 
                     # Record success
@@ -615,9 +698,10 @@ def trace_agent_execution(agent_name: str = ''):
                     )
 
                     span.set_status(Status(StatusCode.OK))
-                    span.set_attribute(
-                        'agent.result.length', len(str(result)) if result else 0
-                    )
+                    if record_details(span):
+                        span.set_attribute(
+                            'agent.result.length', len(str(result)) if result else 0
+                        )
 
                     return result
 
@@ -651,7 +735,7 @@ def add_span_attributes(span: Optional[Span], attributes: Dict[str, Any]) -> Non
         span: OpenTelemetry span
         attributes: Dictionary of attributes to add
     """
-    if span and attributes:
+    if span and attributes and span.is_recording():
         for key, value in attributes.items():
             # OpenTelemetry only supports certain types
             if isinstance(value, (str, bool, int, float)):
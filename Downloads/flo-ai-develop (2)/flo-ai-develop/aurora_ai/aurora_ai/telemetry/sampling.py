@@ -0,0 +1,126 @@
+"""
+Tail sampling of finished traces.
+
+Head sampling (``sample_rate``) decides when a trace starts, so it drops slow
+and failed traces as often as fast ones. ``TailSamplingSpanProcessor`` buffers
+the spans of each trace until its root span ends and then decides, with the
+whole trace known, whether to pass the spans on to the exporting processors.
+
+This module imports the OpenTelemetry SDK and is only imported by
+``FloTelemetry.configure``.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.trace import StatusCode
+
+if TYPE_CHECKING:
+    from .telemetry import TailSamplingPolicy
+
+_TRACE_ID_MASK = (1 << 64) - 1
+
+
+class _PendingTrace:
+    __slots__ = ('spans', 'error')
+
+    def __init__(self):
+        self.spans: List[ReadableSpan] = []
+        self.error = False
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    Forwards the spans of a trace to ``processors`` only if the trace is kept.
+
+    A trace is kept when one of its spans failed (``keep_errors``), when its
+    root span took at least ``latency_threshold_ms``, or otherwise with
+    probability ``sample_rate``, decided from the trace id so that every
+    process makes the same decision for a distributed trace.
+
+    At most ``max_traces`` traces are buffered; beyond that the oldest trace is
+    decided with the spans that have ended so far.
+    """
+
+    def __init__(
+        self,
+        policy: 'TailSamplingPolicy',
+        processors: Sequence[SpanProcessor],
+    ):
+        self.policy = policy
+        self.processors = list(processors)
+        self._threshold = int(policy.sample_rate * (1 << 64))
+        self._pending: 'OrderedDict[int, _PendingTrace]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.kept = 0
+        self.dropped = 0
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        for processor in self.processors:
+            processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        decided = None
+        with self._lock:
+            pending = self._pending.get(trace_id)
+            if pending is None:
+                pending = self._pending[trace_id] = _PendingTrace()
+            pending.spans.append(span)
+            if span.status.status_code is StatusCode.ERROR:
+                pending.error = True
+
+            if span.parent is None or span.parent.is_remote:
+                del self._pending[trace_id]
+                decided = (trace_id, pending, self._duration_ms(span))
+            elif len(self._pending) > self.policy.max_traces:
+                oldest, trace = self._pending.popitem(last=False)
+                decided = (oldest, trace, None)
+        if decided is not None:
+            self._decide(*decided)
+
+    def _duration_ms(self, span: ReadableSpan) -> Optional[float]:
+        if span.start_time is None or span.end_time is None:
+            return None
+        return (span.end_time - span.start_time) / 1e6
+
+    def _keep(self, trace_id: int, trace: _PendingTrace, duration_ms) -> bool:
+        policy = self.policy
+        if policy.keep_errors and trace.error:
+            return True
+        if (
+            policy.latency_threshold_ms is not None
+            and duration_ms is not None
+            and duration_ms >= policy.latency_threshold_ms
+        ):
+            return True
+        return (trace_id & _TRACE_ID_MASK) < self._threshold
+
+    def _decide(self, trace_id: int, trace: _PendingTrace, duration_ms) -> None:
+        if not self._keep(trace_id, trace, duration_ms):
+            self.dropped += 1
+            return
+        self.kept += 1
+        for span in trace.spans:
+            for processor in self.processors:
+                processor.on_end(span)
+
+    def _flush_pending(self) -> None:
+        with self._lock:
+            pending: Dict[int, _PendingTrace] = dict(self._pending)
+            self._pending.clear()
+        for trace_id, trace in pending.items():
+            self._decide(trace_id, trace, None)
+
+    def shutdown(self) -> None:
+        self._flush_pending()
+        for processor in self.processors:
+            processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return all(
+            processor.force_flush(timeout_millis) for processor in self.processors
+        )
@@ -2,20 +2,40 @@
 OpenTelemetry telemetry implementation for aurora_ai framework
 """
 
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
+from dataclasses import dataclass
 from opentelemetry import trace, metrics
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import (
-    PeriodicExportingMetricReader,
-    ConsoleMetricExporter,
-)
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 import os
 
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.metrics import MeterProvider
+
+
+@dataclass
+class TailSamplingPolicy:
+    """
+    Which finished traces are exported when tail sampling is enabled.
+
+    Attributes:
+        keep_errors: Keep every trace in which a span failed
+        latency_threshold_ms: Keep every trace whose root span took at least
+            this long; None to not keep traces for being slow
+        sample_rate: Fraction of the other traces that is kept
+        max_traces: Traces buffered while waiting for their root span to end
+    """
+
+    keep_errors: bool = True
+    latency_threshold_ms: Optional[float] = None
+    sample_rate: float = 0.0
+    max_traces: int = 1000
+
+    def __post_init__(self):
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError('sample_rate must be between 0 and 1')
+        if self.max_traces < 1:
+            raise ValueError('max_traces must be at least 1')
+
 
 class FloTelemetry:
     """
@@ -34,10 +54,11 @@ class FloTelemetry:
 
     def __init__(self):
         if not FloTelemetry._initialized:
-            self.tracer_provider: Optional[TracerProvider] = None
-            self.meter_provider: Optional[MeterProvider] = None
+            self.tracer_provider: Optional['TracerProvider'] = None
+            self.meter_provider: Optional['MeterProvider'] = None
             self.tracer: Optional[trace.Tracer] = None
             self.meter: Optional[metrics.Meter] = None
+            self.detailed_attributes = True
             FloTelemetry._initialized = True
 
     def configure(
@@ -48,6 +69,9 @@ class FloTelemetry:
         otlp_endpoint: Optional[str] = None,
         console_export: bool = False,
         additional_attributes: Optional[Dict[str, Any]] = None,
+        sample_rate: float = 1.0,
+        tail_sampling: Optional[TailSamplingPolicy] = None,
+        detailed_attributes: bool = True,
     ) -> None:
         """
         Configure OpenTelemetry for the aurora_ai framework.
@@ -59,7 +83,31 @@ class FloTelemetry:
             otlp_endpoint: OTLP endpoint for exporting telemetry (e.g., http://localhost:4317)
             console_export: Whether to export to console for debugging
             additional_attributes: Additional resource attributes
+            sample_rate: Fraction of traces recorded (head sampling). Spans of
+                other traces are not recorded and skip attribute computation.
+            tail_sampling: Export only the recorded traces this policy keeps,
+                decided once each trace has finished
+            detailed_attributes: Compute attributes that are expensive on large
+                values, such as result lengths; False for a low-overhead mode
         """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError('sample_rate must be between 0 and 1')
+
+        # The SDK and the gRPC exporters are only imported once telemetry is
+        # configured; the API used by the instrumentation is lightweight
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+        )
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import (
+            PeriodicExportingMetricReader,
+            ConsoleMetricExporter,
+        )
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
         # Create resource with service information
         resource_attrs = {
             'service.name': service_name,
@@ -72,23 +120,38 @@ class FloTelemetry:
 
         resource = Resource.create(resource_attrs)
 
-        # Configure tracing
-        self.tracer_provider = TracerProvider(resource=resource)
+        # Configure tracing; children follow the sampling decision of their parent
+        sampler = ParentBased(TraceIdRatioBased(sample_rate))
+        self.tracer_provider = TracerProvider(resource=resource, sampler=sampler)
+        self.detailed_attributes = detailed_attributes
 
         # Add span processors
+        span_processors = []
         if console_export:
-            console_processor = BatchSpanProcessor(ConsoleSpanExporter())
-            self.tracer_provider.add_span_processor(console_processor)
+            span_processors.append(BatchSpanProcessor(ConsoleSpanExporter()))
 
         # Add OTLP exporter if endpoint is provided
         if otlp_endpoint:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter,
+            )
+
             otlp_exporter = OTLPSpanExporter(endpoint=otlp_endpoint, insecure=True)
-            otlp_processor = BatchSpanProcessor(otlp_exporter)
-            self.tracer_provider.add_span_processor(otlp_processor)
+            span_processors.append(BatchSpanProcessor(otlp_exporter))
+
+        if tail_sampling is not None and span_processors:
+            from .sampling import TailSamplingSpanProcessor
 
-        # Set the tracer provider
+            span_processors = [
+                TailSamplingSpanProcessor(tail_sampling, span_processors)
+            ]
+        for span_processor in span_processors:
+            self.tracer_provider.add_span_processor(span_processor)
+
+        # Set the tracer provider. The global provider can only be set once, so
+        # the tracer comes from this provider to honour reconfiguration
         trace.set_tracer_provider(self.tracer_provider)
-        self.tracer = trace.get_tracer(__name__)
+        self.tracer = self.tracer_provider.get_tracer(__name__)
 
         # Configure metrics
         metric_readers = []
@@ -100,6 +163,10 @@ class FloTelemetry:
             metric_readers.append(console_reader)
 
         if otlp_endpoint:
+            from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+                OTLPMetricExporter,
+            )
+
             otlp_metric_exporter = OTLPMetricExporter(
                 endpoint=otlp_endpoint, insecure=True
             )
@@ -143,6 +210,9 @@ def configure_telemetry(
     otlp_endpoint: str = None,
     console_export: bool = False,
     additional_attributes: Optional[Dict[str, Any]] = None,
+    sample_rate: Optional[float] = None,
+    tail_sampling: Optional[TailSamplingPolicy] = None,
+    detailed_attributes: bool = True,
 ) -> None:
     """
     Configure OpenTelemetry for aurora_ai.
@@ -154,6 +224,12 @@ def configure_telemetry(
         otlp_endpoint: OTLP endpoint (defaults to FLO_OTLP_ENDPOINT or None)
         console_export: Export to console for debugging
         additional_attributes: Additional resource attributes
+        sample_rate: Fraction of traces recorded (defaults to
+            FLO_TRACE_SAMPLE_RATE or 1.0)
+        tail_sampling: Policy choosing which finished traces are exported,
+            e.g. all failed or slow ones plus a sample of the rest
+        detailed_attributes: False skips span attributes that are expensive to
+            compute on large results
 
     Example:
         >>> from aurora_ai.telemetry import configure_telemetry
@@ -170,6 +246,9 @@ def configure_telemetry(
     if otlp_endpoint is None:
         otlp_endpoint = os.getenv('FLO_OTLP_ENDPOINT')
 
+    if sample_rate is None:
+        sample_rate = float(os.getenv('FLO_TRACE_SAMPLE_RATE', '1.0'))
+
     _global_telemetry.configure(
         service_name=service_name,
         service_version=service_version,
@@ -177,6 +256,9 @@ def configure_telemetry(
         otlp_endpoint=otlp_endpoint,
         console_export=console_export,
         additional_attributes=additional_attributes,
+        sample_rate=sample_rate,
+        tail_sampling=tail_sampling,
+        detailed_attributes=detailed_attributes,
     )
 
 
@@ -215,6 +297,20 @@ def get_meter() -> Optional[metrics.Meter]:
     return _global_telemetry.get_meter()
 
 
+def record_details(span: Optional[trace.Span]) -> bool:
+    """
+    Whether to compute expensive attributes for ``span``.
+
+    False for spans that are not recorded (sampled out) and in low-overhead
+    mode, so that e.g. ``len(str(result))`` on a large result is skipped.
+    """
+    return (
+        span is not None
+        and _global_telemetry.detailed_attributes
+        and span.is_recording()
+    )
+
+
 def shutdown_telemetry() -> None:
     """
     Shutdown telemetry and flush all data.
@@ -1,15 +1,25 @@
-from .base_tool import Tool, ToolExecutionError
+from .base_tool import Tool, ToolExecutionError, ToolTimeoutError, CircuitOpenError
 from .aurora_tool import aurora_tool, create_tool_from_function
 from .partial_tool import PartialTool, create_partial_tool
 from .tool_config import ToolConfig, create_tool_config
+from .result_formatter import ToolResultFormatter
+from .tool_cache import CachePolicy
+from .circuit_breaker import CircuitBreaker
+from aurora_ai.utils.executors import ExecutionPolicy
 
 __all__ = [
     'Tool',
     'ToolExecutionError',
+    'ToolTimeoutError',
+    'CircuitOpenError',
     'aurora_tool',
     'create_tool_from_function',
     'PartialTool',
     'create_partial_tool',
     'ToolConfig',
     'create_tool_config',
+    'ToolResultFormatter',
+    'CachePolicy',
+    'ExecutionPolicy',
+    'CircuitBreaker',
 ]
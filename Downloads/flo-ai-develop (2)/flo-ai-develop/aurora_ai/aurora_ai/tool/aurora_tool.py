@@ -3,12 +3,20 @@ import asyncio
 from typing import Dict, Any, Callable, Optional, Union
 from functools import wraps
 from .base_tool import Tool
+from .circuit_breaker import CircuitBreaker
+from .tool_cache import CachePolicy
+from aurora_ai.utils.executors import ExecutionPolicy
 
 
 def aurora_tool(
     name: Optional[str] = None,
     description: Optional[str] = None,
     parameter_descriptions: Optional[Dict[str, str]] = None,
+    idempotent: bool = False,
+    cache: Optional[CachePolicy] = None,
+    execution: Optional[ExecutionPolicy] = None,
+    timeout: Optional[float] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
 ):
     """
     Decorator to automatically convert a function into a Tool object.
@@ -18,6 +26,16 @@ def aurora_tool(
         description: Optional description for the tool. If not provided, uses function docstring.
         parameter_descriptions: Optional dict mapping parameter names to their descriptions.
                                If not provided, will try to extract from docstring or use defaults.
+        idempotent: Whether calls with the same arguments return the same result
+                    without side effects. Required for caching.
+        cache: Optional CachePolicy; results of identical calls are reused until
+               they expire and concurrent identical calls run only once.
+        execution: Optional ExecutionPolicy. Non-async functions run on the shared
+                   thread pool by default; use pool='process' for CPU-heavy work
+                   and max_concurrency/timeout to bound calls.
+        timeout: Optional seconds after which a call fails with ToolTimeoutError.
+        circuit_breaker: Optional CircuitBreaker; after repeated failures calls
+                         fail fast with CircuitOpenError until it resets.
 
     Example:
         @aurora_tool(
@@ -37,12 +55,35 @@ def aurora_tool(
 
         # And you can get the Tool object
         tool = calculate.tool
+
+        # Cache results of a read-only lookup for five minutes
+        @aurora_tool(idempotent=True, cache=CachePolicy(ttl=300))
+        async def get_exchange_rate(currency: str) -> float:
+            pass
+
+        # Blocking function, run in a process pool at most two at a time
+        @aurora_tool(execution=ExecutionPolicy(pool='process', max_concurrency=2))
+        def render_report(data: dict) -> str:
+            pass
+
+        # Fail after 10s, and fail fast after 3 failures in a row
+        @aurora_tool(timeout=10, circuit_breaker=CircuitBreaker(failure_threshold=3))
+        async def search_inventory(query: str) -> list:
+            pass
     """
 
     def decorator(func: Callable) -> Callable:
         # Create the Tool object
         tool = _create_tool_from_function(
-            func, name, description, parameter_descriptions
+            func,
+            name,
+            description,
+            parameter_descriptions,
+            idempotent,
+            cache,
+            execution,
+            timeout,
+            circuit_breaker,
         )
 
         # Attach the tool to the function
@@ -63,6 +104,9 @@ def aurora_tool(
             return async_wrapper
         else:
             sync_wrapper.tool = tool
+            # The wrapper replaces func under its module-level name, so only the
+            # wrapper can be pickled by reference for process pools
+            tool.function = sync_wrapper
             return sync_wrapper
 
     return decorator
@@ -73,6 +117,11 @@ def _create_tool_from_function(
     name: Optional[str] = None,
     description: Optional[str] = None,
     parameter_descriptions: Optional[Dict[str, str]] = None,
+    idempotent: bool = False,
+    cache: Optional[CachePolicy] = None,
+    execution: Optional[ExecutionPolicy] = None,
+    timeout: Optional[float] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
 ) -> Tool:
     """Create a Tool object from a function."""
     # Get function signature
@@ -128,6 +177,11 @@ def _create_tool_from_function(
         description=tool_description,
         function=func,
         parameters=parameters,
+        idempotent=idempotent,
+        cache=cache,
+        execution=execution,
+        timeout=timeout,
+        circuit_breaker=circuit_breaker,
     )
 
 
@@ -197,6 +251,11 @@ def create_tool_from_function(
     name: Optional[str] = None,
     description: Optional[str] = None,
     parameter_descriptions: Optional[Dict[str, str]] = None,
+    idempotent: bool = False,
+    cache: Optional[CachePolicy] = None,
+    execution: Optional[ExecutionPolicy] = None,
+    timeout: Optional[float] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
 ) -> Tool:
     """
     Create a Tool from an existing function without using the decorator.
@@ -206,8 +265,23 @@ def create_tool_from_function(
         name: Optional custom name for the tool
         description: Optional description for the tool
         parameter_descriptions: Optional parameter descriptions
+        idempotent: Whether the function is free of side effects
+        cache: Optional result cache policy (requires idempotent=True)
+        execution: Optional pool, concurrency limit and timeout for calls
+        timeout: Optional per-call timeout in seconds
+        circuit_breaker: Optional circuit breaker for repeated failures
 
     Returns:
         Tool: The created tool object
     """
-    return _create_tool_from_function(func, name, description, parameter_descriptions)
+    return _create_tool_from_function(
+        func,
+        name,
+        description,
+        parameter_descriptions,
+        idempotent,
+        cache,
+        execution,
+        timeout,
+        circuit_breaker,
+    )
@@ -1,5 +1,14 @@
+import asyncio
 from typing import Dict, Any, Callable, List, Optional
 from aurora_ai.models.agent_error import AgentError
+from aurora_ai.tool.circuit_breaker import CircuitBreaker
+from aurora_ai.tool.tool_cache import CachePolicy, ToolResultCache
+from aurora_ai.utils.deadline import remaining_time
+from aurora_ai.utils.executors import (
+    ExecutionPolicy,
+    ExecutionTimeoutError,
+    run_callable,
+)
 from aurora_ai.utils.logger import logger
 
 
@@ -9,17 +18,68 @@ class ToolExecutionError(AgentError):
     pass
 
 
+class ToolTimeoutError(ToolExecutionError):
+    """Tool call exceeded its timeout or the workflow deadline"""
+
+    pass
+
+
+class CircuitOpenError(ToolExecutionError):
+    """Tool call rejected because the tool's circuit breaker is open"""
+
+    pass
+
+
 class Tool:
+    """
+    A function the LLM can call.
+
+    Args:
+        name: Tool name shown to the LLM
+        description: What the tool does
+        function: Function implementing the tool. Plain (non-async) functions
+            run on a worker pool so they don't block the event loop.
+        parameters: Parameter schemas, keyed by parameter name
+        idempotent: Whether calls with the same arguments return the same result
+            and have no side effects, which makes their results cacheable
+        cache: Cache policy for results; only allowed for idempotent tools
+        execution: Pool, concurrency limit and timeout for calls; by default
+            plain functions run on the shared thread pool without limits
+        timeout: Seconds a call may take in total, shortened to the time left
+            before the workflow deadline if there is one
+        circuit_breaker: Breaker that makes calls fail fast after repeated
+            failures; may be shared by tools using the same backend
+    """
+
     def __init__(
         self,
         name: str,
         description: str,
         function: Callable,
         parameters: Dict[str, Dict[str, Any]],
+        idempotent: bool = False,
+        cache: Optional[CachePolicy] = None,
+        execution: Optional[ExecutionPolicy] = None,
+        timeout: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f'Tool {name} timeout must be positive')
+        if cache is not None and not idempotent:
+            raise ValueError(
+                f'Tool {name} has a cache policy but is not declared idempotent'
+            )
         self.name = name
         self.description = description
         self.function = function
+        self.idempotent = idempotent
+        self.execution = execution
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        # Bumped whenever name, description or parameters change, so callers
+        # caching formatted schemas know when to rebuild them
+        self.schema_version = 0
+        self.result_cache = ToolResultCache(cache) if cache is not None else None
 
         # Ensure parameters have required field
         self.parameters = {}
@@ -29,19 +89,91 @@ class Tool:
                 'required': param_info.get('required', True),
             }
 
+    def invalidate_schema(self):
+        """Mark the LLM-facing schema as changed after editing the tool in place"""
+        self.schema_version += 1
+
     async def execute(self, **kwargs) -> Any:
         """Execute the tool with error handling"""
         try:
             logger.info(f'Executing tool {self.name} with kwargs: {kwargs}')
-            tool_result = await self.function(**kwargs)
+            tool_result = await self._guarded_call(kwargs)
             logger.info(f'Tool {self.name} returned: {tool_result}')
             return tool_result
+        except (ToolTimeoutError, CircuitOpenError) as e:
+            logger.error(f'Error executing tool {self.name}: {str(e)}')
+            raise
         except Exception as e:
             logger.error(f'Error executing tool {self.name}: {str(e)}', exc_info=True)
             raise ToolExecutionError(
                 f'Error executing tool {self.name}: {str(e)}', original_error=e
             )
 
+    async def _guarded_call(self, kwargs: Dict[str, Any]) -> Any:
+        """Invoke under the circuit breaker, the tool timeout and the deadline"""
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(
+                f'Tool {self.name} is unavailable after {breaker.failures} '
+                f'consecutive failures; retry in {breaker.retry_after():.0f}s'
+            )
+
+        timeout = self.timeout
+        remaining = remaining_time()
+        limited_by_deadline = remaining is not None and (
+            timeout is None or remaining < timeout
+        )
+        if limited_by_deadline:
+            timeout = remaining
+
+        succeeded = failed = False
+        try:
+            if timeout is None:
+                result = await self._invoke(kwargs)
+            elif timeout <= 0:
+                raise asyncio.TimeoutError()
+            else:
+                result = await asyncio.wait_for(self._invoke(kwargs), timeout)
+            succeeded = True
+            return result
+        except ExecutionTimeoutError as e:
+            # The execution policy's own timeout, not a subclass of
+            # asyncio.TimeoutError before Python 3.11
+            failed = True
+            raise ToolTimeoutError(
+                f'Tool {self.name} timed out after {e.timeout}s', original_error=e
+            )
+        except asyncio.TimeoutError as e:
+            if limited_by_deadline:
+                raise ToolTimeoutError(
+                    f'Tool {self.name} stopped: workflow deadline exceeded',
+                    original_error=e,
+                )
+            failed = True
+            raise ToolTimeoutError(
+                f'Tool {self.name} timed out after {timeout}s', original_error=e
+            )
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if breaker is not None:
+                if succeeded:
+                    breaker.record_success()
+                elif failed:
+                    breaker.record_failure()
+                else:
+                    # Cancelled or out of workflow time: says nothing about the tool
+                    breaker.release()
+
+    async def _invoke(self, kwargs: Dict[str, Any]) -> Any:
+        """Call the function, going through the result cache if there is one"""
+        if self.result_cache is None:
+            return await run_callable(self.function, kwargs, self.execution)
+        return await self.result_cache.get_or_call(
+            kwargs, lambda: run_callable(self.function, kwargs, self.execution)
+        )
+
     async def run(
         self, inputs: List[Any], variables: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Any:
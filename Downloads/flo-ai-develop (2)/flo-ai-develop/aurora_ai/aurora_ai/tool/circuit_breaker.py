@@ -0,0 +1,101 @@
+"""
+Circuit breaker for tools backed by systems that can degrade.
+
+After ``failure_threshold`` consecutive failures the circuit opens and calls
+fail immediately instead of waiting on the failing system. Once
+``reset_timeout`` seconds have passed a single trial call is let through
+(half-open): success closes the circuit, failure opens it again.
+"""
+
+import time
+from enum import Enum
+from typing import Any, Dict, Optional, Union
+
+
+class CircuitState(str, Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures of one tool (or of tools sharing a backend).
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a trial call
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold must be at least 1')
+        if reset_timeout <= 0:
+            raise ValueError('reset_timeout must be positive')
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead; in half-open state only one trial at a time"""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until the next trial call is allowed"""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def record_success(self):
+        self.failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_running or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_running = False
+
+    def release(self):
+        """End a call without a verdict, e.g. when it was cancelled"""
+        self._trial_running = False
+
+    def reset(self):
+        self.record_success()
+
+    @classmethod
+    def from_config(
+        cls, config: Union['CircuitBreaker', Dict[str, Any], int, None]
+    ) -> Optional['CircuitBreaker']:
+        """
+        Build a breaker from a YAML/dict config.
+
+        Accepts an existing breaker, a dict of constructor arguments, or an int
+        used as ``failure_threshold``.
+        """
+        if config is None or isinstance(config, CircuitBreaker):
+            return config
+        if isinstance(config, bool):
+            raise ValueError('circuit_breaker must be a mapping or a failure count')
+        if isinstance(config, int):
+            return cls(failure_threshold=config)
+        if isinstance(config, dict):
+            return cls(**config)
+        raise ValueError(f'Invalid circuit_breaker configuration: {config!r}')
@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional
-from .base_tool import Tool, ToolExecutionError
+from .base_tool import CircuitOpenError, Tool, ToolExecutionError, ToolTimeoutError
+from .circuit_breaker import CircuitBreaker
 from aurora_ai.utils.logger import logger
 
 
@@ -15,6 +16,8 @@ class PartialTool(Tool):
         prefilled_params: Dict[str, Any],
         name_override: Optional[str] = None,
         description_override: Optional[str] = None,
+        timeout: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         """
         Create a partial tool with pre-filled parameters.
@@ -24,6 +27,8 @@ class PartialTool(Tool):
             prefilled_params: Parameters to pre-fill (datasource_id, etc.)
             name_override: Optional custom name for the partial tool
             description_override: Optional custom description
+            timeout: Optional timeout replacing the base tool's
+            circuit_breaker: Optional breaker replacing the base tool's
         """
         self.base_tool = base_tool
         self.prefilled_params = prefilled_params.copy()
@@ -40,6 +45,10 @@ class PartialTool(Tool):
             or f'{base_tool.description} (with pre-configured parameters)',
             function=base_tool.function,
             parameters=filtered_parameters,
+            idempotent=base_tool.idempotent,
+            execution=base_tool.execution,
+            timeout=timeout if timeout is not None else base_tool.timeout,
+            circuit_breaker=circuit_breaker or base_tool.circuit_breaker,
         )
 
     async def execute(self, **kwargs) -> Any:
@@ -52,14 +61,20 @@ class PartialTool(Tool):
             logger.info(
                 f'Executing partial tool {self.name} with merged params: {merged_params}'
             )
-            tool_result = await self.base_tool.function(**merged_params)
+            tool_result = await self._guarded_call(merged_params)
             logger.info(f'Partial tool {self.name} returned: {tool_result}')
             return tool_result
+        except (ToolTimeoutError, CircuitOpenError):
+            raise
         except Exception as e:
             raise ToolExecutionError(
                 f'Error executing partial tool {self.name}: {str(e)}', original_error=e
             )
 
+    async def _invoke(self, kwargs: Dict[str, Any]) -> Any:
+        # Share the base tool's result cache
+        return await self.base_tool._invoke(kwargs)
+
     def get_original_tool(self) -> Tool:
         """Get the original tool without pre-filled parameters."""
         return self.base_tool
@@ -69,14 +84,19 @@ class PartialTool(Tool):
         return self.prefilled_params.copy()
 
     def add_prefilled_param(self, key: str, value: Any) -> 'PartialTool':
-        """Add or update a pre-filled parameter."""
+        """Add or update a pre-filled parameter, hiding it from the AI."""
         self.prefilled_params[key] = value
+        if self.parameters.pop(key, None) is not None:
+            self.invalidate_schema()
         return self
 
     def remove_prefilled_param(self, key: str) -> 'PartialTool':
-        """Remove a pre-filled parameter."""
+        """Remove a pre-filled parameter, exposing it to the AI again."""
         if key in self.prefilled_params:
             del self.prefilled_params[key]
+            if key in self.base_tool.parameters:
+                self.parameters[key] = self.base_tool.parameters[key].copy()
+                self.invalidate_schema()
         return self
 
 
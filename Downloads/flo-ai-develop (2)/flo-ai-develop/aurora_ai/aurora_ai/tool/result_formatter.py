@@ -0,0 +1,303 @@
+"""
+Compact formatting of tool results before they are sent back to the LLM.
+
+Tabular results (the ``(rows, column_names)`` tuples returned by database
+tools and, when enabled, lists of dicts or dicts of columns) are encoded
+column-first as CSV, TSV or markdown instead of their Python repr. Large tables
+are replaced by a sample of rows plus per-column statistics and can be spilled
+to a local file that the agent pages through with the ``read_tool_result`` tool.
+"""
+
+import csv
+import os
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import StringIO
+from itertools import islice
+from numbers import Number
+from typing import Any, List, Literal, Optional, Sequence, Tuple
+
+from aurora_ai.tool.base_tool import Tool, ToolExecutionError
+
+Table = Tuple[List[str], List[Sequence[Any]]]
+
+TableFormat = Literal['csv', 'tsv', 'markdown']
+
+
+def as_table(result: Any, records: bool = False) -> Optional[Table]:
+    """
+    Return ``(column_names, rows)`` if the result is tabular, otherwise None.
+
+    Recognised shapes:
+        - ``(rows, column_names)`` tuples, as returned by RedshiftConnector
+        - objects with ``rows`` and ``column_names`` attributes (QueryResult)
+
+    With ``records``, also:
+        - non-empty lists of dicts (one dict per row)
+        - dicts of equally long lists (one list per column)
+
+    Records are off by default: search hits and API payloads have these shapes
+    too, and their nested values would be flattened to strings.
+    """
+    if hasattr(result, 'rows') and hasattr(result, 'column_names'):
+        return list(result.column_names), list(result.rows)
+
+    if isinstance(result, (tuple, list)) and len(result) == 2:
+        rows, columns = result
+        if (
+            isinstance(rows, (list, tuple))
+            and isinstance(columns, (list, tuple))
+            and columns
+            and all(isinstance(column, str) for column in columns)
+            and all(
+                isinstance(row, (list, tuple)) and len(row) == len(columns)
+                for row in rows
+            )
+        ):
+            return list(columns), list(rows)
+
+    if not records:
+        return None
+
+    if (
+        isinstance(result, list)
+        and result
+        and all(isinstance(row, dict) for row in result)
+    ):
+        columns = list(dict.fromkeys(key for row in result for key in row))
+        return columns, [[row.get(column) for column in columns] for row in result]
+
+    if (
+        isinstance(result, dict)
+        and result
+        and all(isinstance(values, (list, tuple)) for values in result.values())
+        and len({len(values) for values in result.values()}) == 1
+    ):
+        columns = [str(column) for column in result]
+        return columns, [list(row) for row in zip(*result.values())]
+
+    return None
+
+
+@dataclass
+class _SpilledResult:
+    path: str
+    columns: List[str]
+    row_count: int
+
+
+class ToolResultFormatter:
+    """
+    Turn tool results into compact text for the LLM.
+
+    Args:
+        table_format: Encoding for tabular results: 'csv', 'tsv' or 'markdown'
+        max_rows: Largest table sent in full; bigger tables are sampled
+        head_rows: Rows from the start of a sampled table
+        tail_rows: Rows from the end of a sampled table
+        max_cell_length: Longer cell values of sampled tables are cut and end
+            with '...'; tables sent in full are never cut
+        spill_dir: If set, sampled tables are also written there as CSV and can
+            be paged through with the tool returned by ``pager_tool()``
+        max_spilled: Spilled files kept; older ones are deleted
+        detect_records: Also treat lists of dicts and dicts of columns as tables
+
+    Example:
+        >>> formatter = ToolResultFormatter(max_rows=2, head_rows=1, tail_rows=1)
+        >>> formatter.format(([(1, 'a'), (2, 'b'), (3, 'c')], ['id', 'name']))
+    """
+
+    def __init__(
+        self,
+        table_format: TableFormat = 'csv',
+        max_rows: int = 50,
+        head_rows: int = 20,
+        tail_rows: int = 5,
+        max_cell_length: int = 200,
+        spill_dir: Optional[str] = None,
+        max_spilled: int = 20,
+        detect_records: bool = False,
+    ):
+        if table_format not in ('csv', 'tsv', 'markdown'):
+            raise ValueError(f'Unsupported table format: {table_format}')
+        self.table_format = table_format
+        self.max_rows = max_rows
+        self.head_rows = head_rows
+        self.tail_rows = tail_rows
+        self.max_cell_length = max_cell_length
+        self.spill_dir = spill_dir
+        self.max_spilled = max_spilled
+        self.detect_records = detect_records
+        self._spilled: 'OrderedDict[str, _SpilledResult]' = OrderedDict()
+
+    def format(self, result: Any) -> str:
+        """Format a tool result; non-tabular results are returned as ``str(result)``"""
+        table = as_table(result, records=self.detect_records)
+        if table is None:
+            return str(result)
+
+        columns, rows = table
+        if len(rows) <= self.max_rows:
+            return f'{len(rows)} rows x {len(columns)} columns\n' + self.encode(
+                columns, rows, truncate=False
+            )
+
+        head = rows[: self.head_rows]
+        tail = rows[len(rows) - self.tail_rows :] if self.tail_rows else []
+        parts = [
+            f'{len(rows)} rows x {len(columns)} columns '
+            f'(showing the first {len(head)} and last {len(tail)} rows)',
+            self.encode(columns, head),
+        ]
+        if tail:
+            parts.append('...')
+            parts.append(self.encode(columns, tail, header=False))
+        parts.append('Column summary:')
+        parts.extend(_column_summary(columns, rows))
+
+        if self.spill_dir:
+            handle = self._spill(columns, rows)
+            parts.append(
+                f"Full result saved as handle '{handle}'. Use the read_tool_result "
+                'tool with this handle and an offset/limit to read more rows.'
+            )
+        return '\n'.join(parts)
+
+    def encode(
+        self,
+        columns: List[str],
+        rows: Sequence[Sequence[Any]],
+        header: bool = True,
+        truncate: bool = True,
+    ) -> str:
+        """Encode rows in the configured table format"""
+        cells = [[self._cell(value, truncate) for value in row] for row in rows]
+        if self.table_format == 'markdown':
+            lines = []
+            if header:
+                lines.append('| ' + ' | '.join(_markdown(c) for c in columns) + ' |')
+                lines.append('|' + '---|' * len(columns))
+            lines.extend(
+                '| ' + ' | '.join(_markdown(c) for c in row) + ' |' for row in cells
+            )
+            return '\n'.join(lines)
+
+        output = StringIO()
+        writer = csv.writer(
+            output,
+            delimiter='\t' if self.table_format == 'tsv' else ',',
+            lineterminator='\n',
+        )
+        if header:
+            writer.writerow(columns)
+        writer.writerows(cells)
+        return output.getvalue().rstrip('\n')
+
+    def read(self, handle: str, offset: int = 0, limit: int = 50) -> str:
+        """Return ``limit`` rows of a spilled result starting at row ``offset``"""
+        spilled = self._spilled.get(handle)
+        if spilled is None:
+            raise KeyError(f'Unknown result handle: {handle}')
+        offset = max(offset, 0)
+        with open(spilled.path, newline='') as f:
+            reader = csv.reader(f)
+            next(reader)  # header
+            rows = list(islice(reader, offset, offset + max(limit, 0)))
+        end = offset + len(rows)
+        return f'Rows {offset}-{end} of {spilled.row_count}\n' + self.encode(
+            spilled.columns, rows, truncate=False
+        )
+
+    def pager_tool(self) -> Tool:
+        """Tool that lets the agent page through results spilled by this formatter"""
+
+        async def read_tool_result(handle: str, offset: int = 0, limit: int = 50):
+            try:
+                return self.read(handle, int(offset), int(limit))
+            except KeyError as e:
+                raise ToolExecutionError(str(e))
+
+        return Tool(
+            name='read_tool_result',
+            description='Read rows of a large tool result that was saved with a handle',
+            function=read_tool_result,
+            parameters={
+                'handle': {
+                    'type': 'string',
+                    'description': 'Handle of the saved result',
+                },
+                'offset': {
+                    'type': 'integer',
+                    'description': 'Index of the first row to read (default 0)',
+                    'required': False,
+                },
+                'limit': {
+                    'type': 'integer',
+                    'description': 'Number of rows to read (default 50)',
+                    'required': False,
+                },
+            },
+        )
+
+    def _spill(self, columns: List[str], rows: Sequence[Sequence[Any]]) -> str:
+        os.makedirs(self.spill_dir, exist_ok=True)
+        handle = f'result-{uuid.uuid4().hex[:12]}'
+        path = os.path.join(self.spill_dir, f'{handle}.csv')
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(rows)
+        self._spilled[handle] = _SpilledResult(path, columns, len(rows))
+        while len(self._spilled) > self.max_spilled:
+            _, oldest = self._spilled.popitem(last=False)
+            _remove(oldest.path)
+        return handle
+
+    def clear_spilled(self) -> None:
+        """Delete all files spilled by this formatter"""
+        while self._spilled:
+            _, spilled = self._spilled.popitem()
+            _remove(spilled.path)
+
+    def _cell(self, value: Any, truncate: bool = True) -> str:
+        text = '' if value is None else str(value)
+        if truncate and len(text) > self.max_cell_length:
+            return text[: self.max_cell_length] + '...'
+        return text
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _markdown(text: str) -> str:
+    return text.replace('|', '\\|').replace('\n', ' ')
+
+
+def _column_summary(columns: List[str], rows: Sequence[Sequence[Any]]) -> List[str]:
+    """One line of statistics per column"""
+    lines = []
+    for index, column in enumerate(columns):
+        values = [row[index] for row in rows if row[index] is not None]
+        nulls = len(rows) - len(values)
+        numbers = [
+            v for v in values if isinstance(v, Number) and not isinstance(v, bool)
+        ]
+        if values and len(numbers) == len(values):
+            try:
+                mean = sum(numbers) / len(numbers)
+                lines.append(
+                    f'- {column}: min={min(numbers)}, max={max(numbers)}, '
+                    f'mean={mean:.4g}, nulls={nulls}'
+                )
+                continue
+            except TypeError:
+                # e.g. Decimal mixed with float
+                pass
+        distinct = len({str(v) for v in values})
+        lines.append(f'- {column}: distinct={distinct}, nulls={nulls}')
+    return lines
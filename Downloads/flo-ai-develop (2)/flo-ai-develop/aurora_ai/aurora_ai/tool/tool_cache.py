@@ -0,0 +1,136 @@
+"""
+Result caching for idempotent tools.
+
+A tool declared idempotent can be given a ``CachePolicy``; identical calls
+(same arguments, or same key from the policy's key function) then reuse the
+previous result until it expires. Concurrent identical calls are coalesced
+into a single execution (single-flight), and failures are never cached. A
+shared call is cancelled once no caller waits for it any more.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from aurora_ai.utils.usage import add_cache_hit
+
+
+@dataclass
+class CachePolicy:
+    """
+    How results of an idempotent tool are cached.
+
+    Attributes:
+        ttl: Seconds a result stays valid, None to keep it until evicted
+        max_entries: Maximum number of cached results (least recently used evicted)
+        key: Optional function called with the tool arguments returning a hashable
+            cache key; by default the arguments themselves are the key
+    """
+
+    ttl: Optional[float] = None
+    max_entries: int = 128
+    key: Optional[Callable[..., Hashable]] = None
+
+    def __post_init__(self):
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError('Cache ttl must be positive')
+        if self.max_entries < 1:
+            raise ValueError('Cache max_entries must be at least 1')
+
+
+def _default_key(kwargs: Dict[str, Any]) -> Hashable:
+    # Arguments come from JSON tool calls, so they normally serialise directly
+    return json.dumps(kwargs, sort_keys=True, default=repr)
+
+
+class ToolResultCache:
+    """
+    LRU cache of tool results with TTL expiry and single-flight calls.
+
+    Safe for concurrent use from coroutines of one event loop: a result is
+    looked up and an in-flight call registered without awaiting in between.
+
+    Attributes:
+        hits: Calls answered from the cache
+        misses: Calls that executed the tool
+        coalesced: Calls that waited for an identical in-flight call
+    """
+
+    def __init__(self, policy: CachePolicy):
+        self.policy = policy
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        # Callers waiting for each in-flight call
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def make_key(self, kwargs: Dict[str, Any]) -> Hashable:
+        if self.policy.key is not None:
+            return self.policy.key(**kwargs)
+        return _default_key(kwargs)
+
+    async def get_or_call(
+        self, kwargs: Dict[str, Any], call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached result for these arguments, or run ``call`` once"""
+        key = self.make_key(kwargs)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                add_cache_hit()
+                return value
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            add_cache_hit()
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        # A cancelled caller must not cancel the call other callers are waiting on
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            waiters = self._waiters.pop(task) - 1
+            if waiters:
+                self._waiters[task] = waiters
+            elif not task.done():
+                # Every caller timed out or was cancelled; a hung call must not
+                # stay in flight for later identical calls to join
+                task.cancel()
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        self._in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        ttl = self.policy.ttl
+        expires_at = float('inf') if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires_at, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.policy.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, **kwargs):
+        """Drop the cached result for these arguments"""
+        self._entries.pop(self.make_key(kwargs), None)
+
+    def clear(self):
+        """Drop all cached results"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
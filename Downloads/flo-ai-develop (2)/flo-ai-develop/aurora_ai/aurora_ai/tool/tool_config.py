@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from .base_tool import Tool
+from .circuit_breaker import CircuitBreaker
 
 
 class ToolConfig:
@@ -15,6 +16,8 @@ class ToolConfig:
         prefilled_params: Optional[Dict[str, Any]] = None,
         name_override: Optional[str] = None,
         description_override: Optional[str] = None,
+        timeout: Optional[float] = None,
+        circuit_breaker: Union[CircuitBreaker, Dict[str, Any], int, None] = None,
     ):
         """
         Create a tool configuration.
@@ -24,11 +27,16 @@ class ToolConfig:
             prefilled_params: Optional pre-filled parameters
             name_override: Optional custom name
             description_override: Optional custom description
+            timeout: Optional per-call timeout in seconds
+            circuit_breaker: Optional CircuitBreaker, dict of its arguments, or
+                number of consecutive failures that opens the circuit
         """
         self.tool = tool
         self.prefilled_params = prefilled_params or {}
         self.name_override = name_override
         self.description_override = description_override
+        self.timeout = timeout
+        self.circuit_breaker = CircuitBreaker.from_config(circuit_breaker)
 
     def is_partial(self) -> bool:
         """Check if this tool configuration has pre-filled parameters."""
@@ -50,6 +58,20 @@ class ToolConfig:
                 prefilled_params=self.prefilled_params,
                 name_override=self.name_override,
                 description_override=self.description_override,
+                timeout=self.timeout,
+                circuit_breaker=self.circuit_breaker,
+            )
+        elif self.timeout is not None or self.circuit_breaker is not None:
+            # Only execution limits differ: keep the tool as the LLM sees it
+            from .partial_tool import PartialTool
+
+            return PartialTool(
+                base_tool=self.tool,
+                prefilled_params={},
+                name_override=self.tool.name,
+                description_override=self.tool.description,
+                timeout=self.timeout,
+                circuit_breaker=self.circuit_breaker,
             )
         else:
             # No customizations, return original tool
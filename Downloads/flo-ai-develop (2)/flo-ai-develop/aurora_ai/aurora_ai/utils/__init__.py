@@ -1,3 +1,13 @@
-from .aurora_utils import FloUtils
+from .aurora_utils import FloUtils, JsonStreamExtractor
+from .executors import ExecutionPolicy, register_executor, shutdown_executors
+from .deadline import deadline_scope, remaining_time
 
-__all__ = ['FloUtils']
+__all__ = [
+    'FloUtils',
+    'JsonStreamExtractor',
+    'ExecutionPolicy',
+    'register_executor',
+    'shutdown_executors',
+    'deadline_scope',
+    'remaining_time',
+]
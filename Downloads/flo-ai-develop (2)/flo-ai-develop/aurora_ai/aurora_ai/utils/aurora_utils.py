@@ -1,82 +1,298 @@
-from typing import Dict, Any
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Deque, Dict, List, Optional, Union
 import json
+import re
 from aurora_ai.utils.logger import logger
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Characters that matter while matching braces; everything else is skipped
+_TOKENS = re.compile(r'[{}"\\/]')
+
+# Initial size of the text given to the decoder, grown until the error is certain
+_DECODE_WINDOW = 256
+
+# Longest literal (-Infinity) the decoder may reject only because it was cut off
+_MAX_LITERAL = 9
+
+
+class _Span:
+    """A ``{`` and, once found, its matching ``}`` (absolute positions)"""
+
+    __slots__ = ('start', 'end', 'parent', 'slashes', 'error', 'stripped')
+
+    def __init__(self, start: int, parent: Optional['_Span'], slashes: int):
+        self.start = start
+        self.end: Optional[int] = None
+        # Innermost span this one is nested in, as seen from both of them
+        self.parent = parent
+        # Slashes before the span, then slashes inside it once it closes
+        self.slashes = slashes
+        # Where decoding failed, once it did
+        self.error: Optional[int] = None
+        # Comments were stripped from this span or one it is nested in
+        self.stripped = False
+
+
+class _View:
+    """
+    Open spans that currently read the text alike (in or out of a string).
+
+    Spans opened at different places can disagree on what is quoted; spans that
+    agree stay in agreement, so they share a brace depth and are kept by the
+    depth at which each of them closes.
+    """
+
+    __slots__ = ('depth', 'levels', 'size')
+
+    def __init__(self):
+        self.depth = 0
+        self.levels: Dict[int, List[_Span]] = {}
+        self.size = 0
+
+    def push(self, span: _Span) -> None:
+        self.levels.setdefault(self.depth, []).append(span)
+        self.depth += 1
+        self.size += 1
+
+    def pop(self) -> List[_Span]:
+        self.depth -= 1
+        spans = self.levels.pop(self.depth, [])
+        self.size -= len(spans)
+        return spans
+
+    def innermost(self) -> Optional[_Span]:
+        spans = self.levels.get(self.depth - 1)
+        return spans[-1] if spans else None
+
+
+def _merge(first: Optional[_View], second: Optional[_View]) -> Optional[_View]:
+    """Join two views that read the text alike from here on"""
+    if first is None or second is None:
+        return first or second
+    if first.size < second.size:
+        first, second = second, first
+    shift = first.depth - second.depth
+    for level, spans in second.levels.items():
+        first.levels.setdefault(level + shift, []).extend(spans)
+    first.size += second.size
+    return first
+
+
+class JsonStreamExtractor:
+    """
+    Extract JSON objects from text that may arrive in chunks (e.g. an LLM stream).
+
+    The text is scanned once. Every ``{`` opens a candidate span whose matching
+    ``}`` is found in that same pass, even when a stray brace or quote makes
+    candidates disagree on what is quoted. Candidates are decided in order with
+    ``raw_decode``: a valid one is returned and the candidates inside it are
+    dropped; an invalid one gives way to the candidates after its ``{``, so a
+    stray brace in prose hides nothing. A failed decode also settles the spans
+    nested in it that contain the error, which are never decoded again, so text
+    is not rescanned. Only the text from the oldest undecided ``{`` on is kept.
+
+    Example:
+        >>> extractor = JsonStreamExtractor()
+        >>> extractor.feed('Answer: {"name": "te')
+        []
+        >>> extractor.feed('st"} done')
+        [{'name': 'test'}]
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        self._offset = 0  # absolute position of self._buffer[0]
+        self._scanned = 0  # absolute position up to which text has been scanned
+        self._slashes = 0
+        self._undecided: Deque[_Span] = deque()
+        self._reset_views()
+
+    def _reset_views(self) -> None:
+        self._outside: Optional[_View] = None  # spans reading outside a string
+        self._inside: Optional[_View] = None  # spans reading inside a string
+        self._escaped: Optional[_View] = None  # inside a string, after a backslash
+        self._escaped_position = -1
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Add text and return the JSON objects completed by it, in order."""
+        self._buffer += chunk
+        objects: List[Dict[str, Any]] = []
+
+        for match in _TOKENS.finditer(self._buffer, self._scanned - self._offset):
+            self._read(match.start() + self._offset, match.group(), objects)
+        self._scanned = self._offset + len(self._buffer)
+
+        # Drop text that can no longer be part of an object
+        keep_from = self._undecided[0].start if self._undecided else self._scanned
+        if keep_from > self._offset:
+            self._buffer = self._buffer[keep_from - self._offset :]
+            self._offset = keep_from
+
+        return objects
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        Finish the stream and return the objects found after unclosed braces.
+
+        For example ``'{ broken {"a": 1}'`` yields ``{"a": 1}`` only once the
+        stream ends, since the outer brace could still have closed.
+        """
+        objects: List[Dict[str, Any]] = []
+        self._decide(objects, final=True)
+        self.__init__()
+        return objects
+
+    def _read(self, position: int, char: str, objects: List[Dict[str, Any]]) -> None:
+        escaped = self._escaped
+        if escaped is not None:
+            self._escaped = None
+            if position != self._escaped_position:
+                # The escaped character was not a token
+                self._inside = _merge(self._inside, escaped)
+                escaped = None
+
+        if char == '{':
+            if self._outside is None:
+                self._outside = _View()
+            span = _Span(position, self._outside.innermost(), self._slashes)
+            self._outside.push(span)
+            self._undecided.append(span)
+        elif char == '}':
+            if self._outside is not None:
+                closed = self._outside.pop()
+                for span in closed:
+                    span.end = position + 1
+                    span.slashes = self._slashes - span.slashes
+                if closed:
+                    self._decide(objects, final=False)
+        elif char == '"':
+            self._outside, self._inside = self._inside, self._outside
+        elif char == '\\':
+            # Escapes only apply in strings; outside of them the backslash is text
+            self._escaped, self._inside = self._inside, None
+            self._escaped_position = position + 1
+        else:
+            self._slashes += 1
+
+        if escaped is not None:
+            self._inside = _merge(self._inside, escaped)
+
+    def _decide(self, objects: List[Dict[str, Any]], final: bool) -> None:
+        """Decide closed candidates in order, up to the first one still open"""
+        undecided = self._undecided
+        while undecided:
+            span = undecided[0]
+            if span.end is None and not final:
+                return
+            undecided.popleft()
+            obj = self._decode(span) if span.end is not None else None
+            if obj is not None:
+                objects.append(obj)
+                while undecided and undecided[0].start < span.end:
+                    undecided.popleft()
+        # Open spans only matter as candidates, and none is left
+        self._reset_views()
+
+    def _decode(self, span: _Span) -> Optional[Dict[str, Any]]:
+        parent = span.parent
+        if parent is not None and parent.error is not None:
+            if span.start < parent.error < span.end:
+                # Decoding the parent already read this span up to the error
+                span.error = parent.error
+                span.stripped = parent.stripped
+                return None
+
+        start, end = span.start - self._offset, span.end - self._offset
+        obj, error = _raw_decode(self._buffer, start, end)
+        if obj is not None:
+            return obj
+        if error is not None:
+            span.error = error + self._offset
+
+        # Comments are stripped once per nesting chain, keeping this linear
+        blocked = parent is not None and parent.stripped
+        span.stripped = blocked or span.slashes > 0
+        if span.slashes and not blocked:
+            candidate = FloUtils.strip_comments_from_string(self._buffer[start:end])
+            try:
+                return json.loads(candidate)
+            except (json.JSONDecodeError, RecursionError):
+                pass
+        return None
+
+
+def _raw_decode(text: str, start: int, end: int):
+    """
+    Decode the object spanning ``text[start:end]``.
+
+    Returns ``(object, None)``, or ``(None, error position)``; the position
+    is None when the object nests too deeply to decode. The decoder only sees
+    a window that grows until it fails short of the window's end, so an early
+    error costs little however long the span is.
+    """
+    size = _DECODE_WINDOW
+    while True:
+        stop = min(end, start + size)
+        window = text[start:stop]
+        try:
+            obj, used = _JSON_DECODER.raw_decode(window)
+        except RecursionError:
+            return None, None
+        except json.JSONDecodeError as e:
+            cut_off = e.pos >= len(window) - _MAX_LITERAL or e.msg.startswith(
+                'Unterminated'
+            )
+            if stop == end or not cut_off:
+                return None, start + e.pos
+        else:
+            if used < len(window) or stop < end:
+                return None, start + used
+            return obj, None
+        size *= 4
+
 
 class FloUtils:
     @staticmethod
     def extract_jsons_from_string(data: str, strict: bool = False) -> Dict[str, Any]:
         """
-        1) Find all balanced `{ … }` blocks via a custom parser
-        2) Strip comments and json.loads() each
+        1) Find all balanced `{ … }` blocks in a single pass (JsonStreamExtractor),
+           trying the blocks after the opening brace of one that is not valid JSON
+        2) Decode each with raw_decode, stripping comments only when that fails
         3) Merge into one dict (later keys override earlier)
         4) On strict mode, raise FloException if no JSON found
         """
+        extractor = JsonStreamExtractor()
+        objects = extractor.feed(data) + extractor.close()
 
-        # Custom function to find balanced braces since (?R) is not supported in Python re
-        def find_balanced_braces(text):
-            matches = []
-            i = 0
-            while i < len(text):
-                if text[i] == '{':
-                    start = i
-                    brace_count = 1
-                    j = i + 1
-                    in_string = False
-                    escape_next = False
-
-                    while j < len(text) and brace_count > 0:
-                        char = text[j]
-
-                        if escape_next:
-                            escape_next = False
-                        elif char == '\\' and in_string:
-                            escape_next = True
-                        elif char == '"' and not escape_next:
-                            in_string = not in_string
-                        elif not in_string:
-                            if char == '{':
-                                brace_count += 1
-                            elif char == '}':
-                                brace_count -= 1
-
-                        j += 1
-
-                    if brace_count == 0:
-                        candidate = text[start:j]
-                        # Try to validate it's actually JSON by attempting to parse
-                        try:
-                            cleaned = FloUtils.strip_comments_from_string(candidate)
-                            json.loads(cleaned)
-                            matches.append(candidate)
-                            i = j  # Continue from after the valid JSON
-                        except json.JSONDecodeError:
-                            # Not valid JSON, try starting from the next character
-                            i += 1
-                    else:
-                        # Unbalanced braces, try starting from the next character
-                        i += 1
-                else:
-                    i += 1
-            return matches
-
-        matches = find_balanced_braces(data)
         merged: Dict[str, Any] = {}
+        for obj in objects:
+            merged.update(obj)
 
-        for json_str in matches:
-            try:
-                cleaned = FloUtils.strip_comments_from_string(json_str)
-                obj = json.loads(cleaned)
-                merged.update(obj)
-            except json.JSONDecodeError as e:
-                logger.error(f'Invalid JSON in response: {json_str}, {e}')
-
-        if strict and not matches:
+        if strict and not objects:
             logger.error(f'No JSON found in strict mode: {data}')
             raise ValueError(f'No JSON found in strict mode: {data}')
 
         return merged
 
+    @staticmethod
+    async def extract_jsons_from_stream(
+        chunks: AsyncIterable[Union[str, Dict[str, Any]]],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield JSON objects from a stream of text chunks as soon as each one completes.
+
+        Chunks may be strings or the ``{'content': ...}`` dicts yielded by
+        ``BaseLLM.stream``.
+        """
+        extractor = JsonStreamExtractor()
+        async for chunk in chunks:
+            text = (chunk.get('content') or '') if isinstance(chunk, dict) else chunk
+            for obj in extractor.feed(text):
+                yield obj
+        for obj in extractor.close():
+            yield obj
+
     @staticmethod
     def strip_comments_from_string(data: str) -> str:
         """Remove JS-style comments (// and /*…*/) so json.loads() will succeed."""
@@ -0,0 +1,45 @@
+"""
+Deadlines shared by everything running inside a workflow.
+
+``deadline_scope`` records an absolute deadline in a context variable, so it is
+visible to every coroutine and task started inside the scope (tasks copy the
+context they are created in). Tools read ``remaining_time()`` to bound their own
+timeouts and fail fast once the workflow has run out of time.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar('aurora_deadline', default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Run the block with a deadline ``seconds`` from now.
+
+    Nested scopes can only shorten the deadline. ``None`` keeps the current one.
+    Yields the absolute deadline on the ``time.monotonic()`` clock, or None.
+    """
+    current = _deadline.get()
+    if seconds is None:
+        yield current
+        return
+    deadline = time.monotonic() + seconds
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline (may be negative), None without one"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
@@ -0,0 +1,107 @@
+"""
+Chunking helpers for splitting extracted document text into bounded pieces.
+
+Token counts are estimated from character counts so no tokenizer dependency is
+needed; the estimate is deliberately conservative for English text.
+"""
+
+import re
+from typing import List
+
+# Rough average for English text across common tokenizers
+CHARS_PER_TOKEN = 4
+
+_HEADING_PATTERN = re.compile(r'^#{1,6}\s', re.MULTILINE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in ``text``."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def chunk_by_tokens(text: str, max_tokens: int) -> List[str]:
+    """
+    Split text into chunks of at most ``max_tokens`` estimated tokens.
+
+    Chunks are cut at the last line break (or space) before the limit so that
+    lines and words are kept intact whenever possible.
+
+    Args:
+        text: Text to split
+        max_tokens: Maximum estimated tokens per chunk
+
+    Returns:
+        List of non-empty chunks, in order
+    """
+    if max_tokens < 1:
+        raise ValueError('max_tokens must be at least 1')
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + max_chars
+        if end < len(text):
+            cut = text.rfind('\n', start, end)
+            if cut <= start:
+                cut = text.rfind(' ', start, end)
+            if cut > start:
+                end = cut + 1
+        chunk = text[start:end]
+        if chunk.strip():
+            chunks.append(chunk)
+        start = end
+    return chunks
+
+
+def chunk_by_headings(text: str, max_tokens: int) -> List[str]:
+    """
+    Split markdown text into sections at headings, packing small sections together.
+
+    Consecutive sections are merged while they fit within ``max_tokens``;
+    sections that are larger on their own are split with ``chunk_by_tokens``.
+
+    Args:
+        text: Markdown text, e.g. the output of pymupdf4llm
+        max_tokens: Maximum estimated tokens per chunk
+
+    Returns:
+        List of non-empty chunks, in order
+    """
+    boundaries = [match.start() for match in _HEADING_PATTERN.finditer(text)]
+    if not boundaries or boundaries[0] != 0:
+        boundaries.insert(0, 0)
+    boundaries.append(len(text))
+    sections = [
+        text[start:end] for start, end in zip(boundaries, boundaries[1:]) if end > start
+    ]
+
+    return pack_chunks(sections, max_tokens)
+
+
+def pack_chunks(pieces: List[str], max_tokens: int) -> List[str]:
+    """
+    Merge consecutive pieces into chunks of at most ``max_tokens`` estimated tokens.
+
+    Pieces larger than the limit are split with ``chunk_by_tokens``.
+    """
+    if max_tokens < 1:
+        raise ValueError('max_tokens must be at least 1')
+
+    chunks = []
+    current = ''
+    for piece in pieces:
+        if estimate_tokens(piece) > max_tokens:
+            if current.strip():
+                chunks.append(current)
+            current = ''
+            chunks.extend(chunk_by_tokens(piece, max_tokens))
+        elif estimate_tokens(current + piece) > max_tokens:
+            if current.strip():
+                chunks.append(current)
+            current = piece
+        else:
+            current += piece
+    if current.strip():
+        chunks.append(current)
+    return chunks
@@ -3,21 +3,42 @@ Document processing utilities for Flo AI framework.
 
 This module provides extensible document processing capabilities for PDF and TXT files,
 with a factory pattern design for easy addition of new document types.
+
+PDF extraction is CPU bound, so it runs in a worker pool (processes by default,
+threads as a fallback) and large documents are split into page ranges that are
+converted concurrently and re-assembled in order. Worker processes open the PDF
+by path: in-memory documents are written to a temporary file once rather than
+pickled into every task.
+
+Processors can also stream a document as ``DocumentChunk`` objects (pages for
+PDFs, line-aligned blocks for text) so callers can start working on the first
+pages before the whole document has been extracted.
 """
 
+import asyncio
 import base64
+import mmap
+import os
+import tempfile
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Union
+from collections import deque
+from contextlib import aclosing, asynccontextmanager, contextmanager, nullcontext
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, Any, AsyncIterator, List, Optional, Union
 
-import pymupdf
-import pymupdf4llm
-import chardet
-
-from aurora_ai.models.document import DocumentType
+from aurora_ai.models.document import DocumentType, DocumentChunk
 from aurora_ai.models.chat_message import DocumentMessageContent
+from aurora_ai.utils.encoding_detection import IncrementalTextDecoder
+from aurora_ai.utils.executors import process_context
 from aurora_ai.utils.logger import logger
 
+if TYPE_CHECKING:
+    import pymupdf
+
 
 class DocumentProcessingError(Exception):
     """Exception raised when document processing fails."""
@@ -41,21 +62,158 @@ class BaseDocumentProcessor(ABC):
         """
         pass
 
+    async def stream(
+        self, document: DocumentMessageContent
+    ) -> AsyncIterator[DocumentChunk]:
+        """
+        Yield the document as chunks while it is being extracted.
+
+        The default implementation processes the whole document and yields it as
+        a single chunk; processors that can extract incrementally override it.
+        """
+        result = await self.process(document)
+        yield DocumentChunk(
+            text=result.get('extracted_text', ''),
+            chunk_index=0,
+            metadata=result.get('metadata', {}),
+        )
+
+
+def _open_pdf(pdf_content: Union[str, bytes]) -> 'pymupdf.Document':
+    """Open a PDF from a file path or from in-memory bytes."""
+    # Imported on first use, pymupdf is slow to import and only needed for PDFs
+    import pymupdf
+
+    if isinstance(pdf_content, str):
+        return pymupdf.open(pdf_content)
+    return pymupdf.open(stream=pdf_content)
+
+
+def _spill_pdf(pdf_content: bytes) -> str:
+    """Write PDF bytes to a temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+        f.write(pdf_content)
+    return f.name
+
+
+def _pdf_info(pdf_content: Union[str, bytes]) -> Dict[str, Any]:
+    """Return the page count and document metadata of a PDF (runs inside a worker)."""
+    doc = _open_pdf(pdf_content)
+    try:
+        metadata = {key: value for key, value in (doc.metadata or {}).items() if value}
+        return {'page_count': doc.page_count, 'metadata': metadata}
+    finally:
+        doc.close()
+
+
+def _pdf_pages_to_markdown(
+    pdf_content: Union[str, bytes], pages: List[int]
+) -> List[Dict[str, Any]]:
+    """
+    Convert the given pages to markdown with pymupdf4llm, one entry per page.
+
+    Defined at module level so it can be pickled and sent to a process pool.
+    """
+    import pymupdf4llm
+
+    doc = _open_pdf(pdf_content)
+    try:
+        page_chunks = pymupdf4llm.to_markdown(
+            doc, pages=pages, page_chunks=True, show_progress=False
+        )
+        # Only keep picklable, lightweight fields
+        return [
+            {
+                'page': chunk['metadata']['page'],
+                'text': chunk['text'],
+                'toc_items': chunk['toc_items'],
+            }
+            for chunk in page_chunks
+        ]
+    finally:
+        doc.close()  # Clean up document object
+
+
+def get_page_text(result: Dict[str, Any], page_number: int) -> str:
+    """
+    Slice the text of one page out of a ``process_document`` result.
+
+    Args:
+        result: Result returned by a processor, with ``page_offsets``
+        page_number: One-based page number
+
+    Returns:
+        The extracted text of that page
+    """
+    offsets = result['page_offsets']
+    if not 1 <= page_number < len(offsets):
+        raise IndexError(
+            f'Page {page_number} out of range (document has {len(offsets) - 1} pages)'
+        )
+    return result['extracted_text'][offsets[page_number - 1] : offsets[page_number]]
+
 
 class PDFProcessor(BaseDocumentProcessor):
-    """Processor for PDF documents."""
+    """
+    Processor for PDF documents.
+
+    Extraction never runs on the event loop: pymupdf4llm is called in a worker
+    pool and documents larger than ``pages_per_chunk`` are split into page
+    ranges that are converted in parallel.
+
+    Args:
+        executor: Optional executor to run extraction in. If not provided, a
+            pool is created lazily and shared by this processor.
+        use_process_pool: Create a process pool (default) instead of a thread
+            pool. Falls back to threads if processes are unavailable.
+        max_workers: Size of the lazily created pool (defaults to CPU count).
+        pages_per_chunk: Maximum number of pages converted by a single worker call.
+        max_concurrency: Maximum number of page chunks in flight per event loop
+            (defaults to ``max_workers``).
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        use_process_pool: bool = True,
+        max_workers: Optional[int] = None,
+        pages_per_chunk: int = 25,
+        max_concurrency: Optional[int] = None,
+    ):
+        if pages_per_chunk < 1:
+            raise ValueError('pages_per_chunk must be at least 1')
+
+        self.use_process_pool = use_process_pool
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pages_per_chunk = pages_per_chunk
+        self.max_concurrency = max_concurrency or self.max_workers
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+        # asyncio primitives are bound to a loop, keep one semaphore per loop
+        self._semaphores = weakref.WeakKeyDictionary()
 
     async def process(self, document: DocumentMessageContent) -> Dict[str, Any]:
-        """Extract text and metadata from PDF document."""
+        """
+        Extract text and metadata from PDF document.
+
+        Besides the text, the result carries the real page count, the document
+        metadata and ``page_offsets``: ``page_offsets[i]`` is where page ``i + 1``
+        starts in ``extracted_text`` and the last entry is the text length, so a
+        page can be sliced out in O(1) (see ``get_page_text``).
+        """
         try:
             pdf_content = await self._get_pdf_content(document)
 
             # Process with pymupdf4llm (LLM-optimized)
-            text_data = await self._process_with_pymupdf4llm(pdf_content)
+            async with self._worker_content(pdf_content) as worker_content:
+                text_data = await self._process_with_pymupdf4llm(worker_content)
 
             return {
                 'extracted_text': text_data['text'],
                 'page_count': text_data.get('page_count', 0),
+                'page_offsets': text_data.get('page_offsets', [0]),
                 'processing_method': text_data.get('method', 'unknown'),
                 'metadata': text_data.get('metadata', {}),
                 'document_type': DocumentType.PDF.value,
@@ -81,44 +239,232 @@ class PDFProcessor(BaseDocumentProcessor):
     async def _process_with_pymupdf4llm(
         self, pdf_content: Union[str, bytes]
     ) -> Dict[str, Any]:
-        """Process PDF using pymupdf4llm (LLM-optimized)."""
-        if isinstance(pdf_content, str):
-            # File path - pass directly to pymupdf4llm
-            text_data = pymupdf4llm.to_markdown(pdf_content)
-            metadata = {}
-        else:
-            # Bytes - create PyMuPDF Document from memory
-            doc = pymupdf.open(stream=pdf_content)
-            try:
-                text_data = pymupdf4llm.to_markdown(doc)
-                metadata = {}
-            finally:
-                doc.close()  # Clean up document object
+        """Process PDF using pymupdf4llm (LLM-optimized) off the event loop."""
+        info = await self._run_in_executor(_pdf_info, pdf_content)
+        page_ranges = self._split_page_ranges(info['page_count'])
+
+        # Ranges are gathered in submission order so the output keeps page order
+        range_outputs = await asyncio.gather(
+            *[
+                self._run_in_executor(_pdf_pages_to_markdown, pdf_content, pages)
+                for pages in page_ranges
+            ]
+        )
+
+        # Page offsets come from the per-page lengths, the joined text is never rescanned
+        page_texts = [page['text'] for pages in range_outputs for page in pages]
+        page_offsets = [0]
+        for page_text in page_texts:
+            page_offsets.append(page_offsets[-1] + len(page_text))
 
         return {
-            'text': text_data,
+            'text': ''.join(page_texts),
             'method': 'pymupdf4llm',
-            'metadata': metadata,
-            'page_count': len(text_data.split('\n---\n')) if '---' in text_data else 1,
+            'metadata': info['metadata'],
+            'page_count': info['page_count'],
+            'page_offsets': page_offsets,
         }
 
+    async def stream(
+        self, document: DocumentMessageContent
+    ) -> AsyncIterator[DocumentChunk]:
+        """
+        Yield one chunk per page, in page order, as page ranges finish extracting.
+
+        Up to ``max_concurrency`` page ranges are extracted ahead of the consumer,
+        so extraction of later pages overlaps with work done on earlier ones.
+        """
+        async with self._worker_content(
+            await self._get_pdf_content(document)
+        ) as pdf_content:
+            # Closed before the temporary file is removed, cancelling its work
+            async with aclosing(self._stream_pages(pdf_content)) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+
+    async def _stream_pages(
+        self, pdf_content: Union[str, bytes]
+    ) -> AsyncIterator[DocumentChunk]:
+        info = await self._run_in_executor(_pdf_info, pdf_content)
+        page_ranges = iter(self._split_page_ranges(info['page_count']))
+
+        def schedule_next(pending: deque) -> None:
+            pages = next(page_ranges, None)
+            if pages is not None:
+                pending.append(
+                    asyncio.ensure_future(
+                        self._run_in_executor(
+                            _pdf_pages_to_markdown, pdf_content, pages
+                        )
+                    )
+                )
+
+        pending: deque = deque()
+        for _ in range(self.max_concurrency):
+            schedule_next(pending)
+
+        chunk_index = 0
+        try:
+            while pending:
+                pages_output = await pending.popleft()
+                schedule_next(pending)
+                for page in pages_output:
+                    yield DocumentChunk(
+                        text=page['text'],
+                        chunk_index=chunk_index,
+                        page_number=page['page'],
+                        metadata={
+                            **info['metadata'],
+                            'page_count': info['page_count'],
+                            'toc_items': page['toc_items'],
+                        },
+                    )
+                    chunk_index += 1
+        finally:
+            # Consumer stopped early or extraction failed: drop remaining work
+            for task in pending:
+                task.cancel()
+
+    @asynccontextmanager
+    async def _worker_content(self, pdf_content: Union[str, bytes]):
+        """
+        Yield the PDF as passed to worker calls.
+
+        Arguments of process pool calls are pickled, so in-memory bytes would be
+        copied into every page-range task. They are written to a temporary file
+        once instead, and workers open it by path. Thread pools share the bytes.
+        """
+        if isinstance(pdf_content, str) or not isinstance(
+            self._get_executor(), ProcessPoolExecutor
+        ):
+            yield pdf_content
+            return
+        path = await asyncio.to_thread(_spill_pdf, pdf_content)
+        try:
+            yield path
+        finally:
+            try:
+                os.unlink(path)
+            except OSError as e:
+                logger.warning(f'Could not remove temporary PDF {path}: {e}')
+
+    def _split_page_ranges(self, total_pages: int) -> List[List[int]]:
+        """Split ``range(total_pages)`` into consecutive chunks of ``pages_per_chunk``."""
+        return [
+            list(range(start, min(start + self.pages_per_chunk, total_pages)))
+            for start in range(0, total_pages, self.pages_per_chunk)
+        ]
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    def _get_executor(self) -> Executor:
+        """Return the extraction executor, creating the shared pool on first use."""
+        if self._executor is not None:
+            return self._executor
+
+        with self._executor_lock:
+            if self._executor is None:
+                if self.use_process_pool:
+                    try:
+                        # Never forked: the caller runs an event loop and threads
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers, mp_context=process_context()
+                        )
+                    except (OSError, NotImplementedError, ImportError) as e:
+                        logger.warning(
+                            f'Process pool unavailable ({e}), falling back to threads for PDF processing'
+                        )
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix='aurora-pdf',
+                    )
+        return self._executor
+
+    def _fall_back_to_threads(self, broken: Executor) -> None:
+        with self._executor_lock:
+            if self._executor is broken:
+                logger.warning(
+                    'PDF process pool is broken, falling back to threads for PDF processing'
+                )
+                self.use_process_pool = False
+                self._executor = None
+                self._owns_executor = True
+        broken.shutdown(wait=False)
+
+    async def _run_in_executor(self, func, *args):
+        async with self._get_semaphore():
+            executor = self._get_executor()
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                if not self._owns_executor:
+                    raise
+                self._fall_back_to_threads(executor)
+                return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pool created by this processor (no-op for injected executors)."""
+        if not self._owns_executor:
+            return
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
 
 class TXTProcessor(BaseDocumentProcessor):
-    """Processor for text documents."""
+    """
+    Processor for text documents.
+
+    Local files (``document.url`` pointing to a path) are memory-mapped instead
+    of being loaded into a ``bytes`` object first.
+
+    Args:
+        chunk_size: Approximate number of characters per streamed chunk.
+            Chunks are cut at line boundaries when possible.
+    """
+
+    # Number of bytes decoded at a time when streaming
+    _BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, chunk_size: int = 16 * 1024):
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.chunk_size = chunk_size
 
     async def process(self, document: DocumentMessageContent) -> Dict[str, Any]:
         """Extract text from TXT document."""
         try:
-            text_content = await self._get_text_content(document)
+            # Lines are counted per decoded block instead of re-scanning the text
+            parts = []
+            line_count = 0
+            with self._open_buffer(document) as buffer:
+                decoder = IncrementalTextDecoder(buffer, block_size=self._BLOCK_SIZE)
+                for text in decoder:
+                    parts.append(text)
+                    line_count += text.count('\n')
+            text_content = ''.join(parts)
+            if text_content and not text_content.endswith('\n'):
+                line_count += 1
 
             return {
                 'extracted_text': text_content,
                 'page_count': 1,
+                'page_offsets': [0, len(text_content)],
                 'processing_method': 'text_reader',
                 'metadata': {
                     'character_count': len(text_content),
-                    'line_count': len(text_content.splitlines()),
-                    'encoding': 'utf-8',
+                    'line_count': line_count,
+                    'encoding': decoder.encoding,
+                    'encoding_detection': decoder.guess.method,
                 },
                 'document_type': DocumentType.TXT.value,
             }
@@ -127,38 +473,50 @@ class TXTProcessor(BaseDocumentProcessor):
             logger.error(f'Error processing TXT: {str(e)}')
             raise DocumentProcessingError(f'Failed to process TXT: {str(e)}')
 
-    async def _get_text_content(self, document: DocumentMessageContent) -> str:
-        """Get text content from various sources."""
+    async def stream(
+        self, document: DocumentMessageContent
+    ) -> AsyncIterator[DocumentChunk]:
+        """Yield line-aligned text chunks of roughly ``chunk_size`` characters."""
+        chunk_index = 0
+        with self._open_buffer(document) as buffer:
+            pending = ''
+            for text in IncrementalTextDecoder(buffer, block_size=self._BLOCK_SIZE):
+                pending += text
+                while len(pending) >= self.chunk_size:
+                    cut = pending.rfind('\n', 0, self.chunk_size) + 1
+                    if cut <= 0:
+                        cut = self.chunk_size
+                    yield DocumentChunk(text=pending[:cut], chunk_index=chunk_index)
+                    chunk_index += 1
+                    pending = pending[cut:]
+                    # Let other tasks run between chunks of large files
+                    await asyncio.sleep(0)
+            if pending or chunk_index == 0:
+                yield DocumentChunk(text=pending, chunk_index=chunk_index)
+
+    def _open_buffer(self, document: DocumentMessageContent):
+        """Return a context manager yielding the raw bytes of the document."""
         if document.bytes:
-            return await self._decode_bytes(document.bytes)
+            return nullcontext(memoryview(document.bytes))
         elif document.base64:
-            decoded_bytes = base64.b64decode(document.base64)
-            return await self._decode_bytes(decoded_bytes)
-        else:
-            raise DocumentProcessingError('No TXT content provided')
+            return nullcontext(memoryview(base64.b64decode(document.base64)))
+        elif document.url:
+            return _map_file(document.url)
+        raise DocumentProcessingError('No TXT content provided')
 
-    async def _read_text_file(self, file_path: str) -> str:
-        """Read text file with encoding detection."""
-        try:
-            # Try UTF-8 first
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Try encoding detection with chardet
-            with open(file_path, 'rb') as f:
-                raw_data = f.read()
-            detected = chardet.detect(raw_data)
-            encoding = detected.get('encoding', 'utf-8')
-            return raw_data.decode(encoding, errors='replace')
-
-    async def _decode_bytes(self, content_bytes: bytes) -> str:
-        """Decode bytes with encoding detection."""
-        try:
-            return content_bytes.decode('utf-8')
-        except UnicodeDecodeError:
-            detected = chardet.detect(content_bytes)
-            encoding = detected.get('encoding', 'utf-8')
-            return content_bytes.decode(encoding, errors='replace')
+
+@contextmanager
+def _map_file(file_path: str):
+    """Memory-map a local file read-only for the duration of a ``with`` block."""
+    if not os.path.isfile(file_path):
+        raise DocumentProcessingError(f'File not found: {file_path}')
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be memory-mapped
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
 
 
 class DocumentProcessor:
@@ -180,21 +538,8 @@ class DocumentProcessor:
         """Register a new document processor for a specific type."""
         self._processors[document_type] = processor
 
-    async def process_document(
-        self, document: DocumentMessageContent
-    ) -> Dict[str, Any]:
-        """
-        Process a document using the appropriate processor.
-
-        Args:
-            document: DocumentMessageContent containing document data
-
-        Returns:
-            Dict containing extracted content and metadata
-
-        Raises:
-            DocumentProcessingError: If processing fails or document type unsupported
-        """
+    def _get_document_type(self, document: DocumentMessageContent) -> DocumentType:
+        """Map the document mime_type to a supported DocumentType."""
         # Convert mime_type string to DocumentType enum
         if not document.mime_type:
             raise DocumentProcessingError('Document mime_type is required')
@@ -211,8 +556,28 @@ class DocumentProcessor:
                 f'Unsupported document type: {document.mime_type}. '
                 f'Supported types: {[dt.value for dt in self._processors.keys()]}'
             )
+        return document_type
+
+    def _get_processor(self, document: DocumentMessageContent) -> BaseDocumentProcessor:
+        return self._processors[self._get_document_type(document)]
+
+    async def process_document(
+        self, document: DocumentMessageContent
+    ) -> Dict[str, Any]:
+        """
+        Process a document using the appropriate processor.
+
+        Args:
+            document: DocumentMessageContent containing document data
 
-        processor: BaseDocumentProcessor = self._processors[document_type]
+        Returns:
+            Dict containing extracted content and metadata
+
+        Raises:
+            DocumentProcessingError: If processing fails or document type unsupported
+        """
+        processor = self._get_processor(document)
+        document_type = self._get_document_type(document)
 
         try:
             result = await processor.process(document)
@@ -221,8 +586,8 @@ class DocumentProcessor:
             result['processing_timestamp'] = time.time()
 
             logger.info(
-                f"Successfully processed {document_type.value} document "
-                f"using {result.get('processing_method', 'unknown')} method"
+                f'Successfully processed {document_type.value} document '
+                f'using {result.get("processing_method", "unknown")} method'
             )
 
             return result
@@ -231,6 +596,31 @@ class DocumentProcessor:
             logger.error(f'Document processing failed: {str(e)}')
             raise
 
+    async def stream_document(
+        self, document: DocumentMessageContent
+    ) -> AsyncIterator[DocumentChunk]:
+        """
+        Stream a document as chunks (pages for PDFs) as they are extracted.
+
+        Args:
+            document: DocumentMessageContent containing document data
+
+        Yields:
+            DocumentChunk objects in document order
+
+        Raises:
+            DocumentProcessingError: If processing fails or document type unsupported
+        """
+        processor = self._get_processor(document)
+        try:
+            async for chunk in processor.stream(document):
+                yield chunk
+        except DocumentProcessingError:
+            raise
+        except Exception as e:
+            logger.error(f'Document streaming failed: {str(e)}')
+            raise DocumentProcessingError(f'Failed to stream document: {str(e)}')
+
 
 # Lazy singleton for default processor
 _default_processor = None
@@ -0,0 +1,196 @@
+"""
+Bounded-cost text encoding detection.
+
+Detection is tiered so that the common cases never reach chardet:
+
+1. Byte order marks identify UTF-8/16/32 immediately.
+2. A prefix of the buffer is validated as UTF-8.
+3. Otherwise chardet runs on a few fixed-size windows sampled across the buffer,
+   aligned to line breaks so multi-byte characters are not cut, and stops as
+   soon as it is confident.
+
+The amount of data inspected is capped by the prefix and sample sizes, so the
+cost does not grow with the size of the file. ``IncrementalTextDecoder`` then
+decodes the buffer block by block and switches encoding if the UTF-8 guess
+turns out to be wrong further into the file.
+"""
+
+import codecs
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from aurora_ai.utils.logger import logger
+
+# Checked in order: the UTF-32 LE BOM starts with the UTF-16 LE BOM
+_BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+DEFAULT_PREFIX_SIZE = 64 * 1024
+DEFAULT_SAMPLE_SIZE = 8 * 1024
+DEFAULT_SAMPLE_COUNT = 4
+
+
+@dataclass
+class EncodingGuess:
+    """Result of encoding detection.
+
+    Attributes:
+        encoding: Codec name usable with ``codecs``
+        method: Tier that produced the guess: 'bom', 'utf-8', 'sampled' or 'default'
+        confidence: Confidence between 0 and 1 (1 for BOM and valid UTF-8)
+    """
+
+    encoding: str
+    method: str
+    confidence: float = 1.0
+
+
+def detect_encoding(
+    buffer,
+    prefix_size: int = DEFAULT_PREFIX_SIZE,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    sample_count: int = DEFAULT_SAMPLE_COUNT,
+) -> EncodingGuess:
+    """
+    Guess the encoding of a bytes-like buffer while inspecting a bounded amount of it.
+
+    Args:
+        buffer: bytes, memoryview or mmap
+        prefix_size: Number of leading bytes validated as UTF-8
+        sample_size: Size of each window passed to chardet
+        sample_count: Number of windows sampled across the buffer
+
+    Returns:
+        EncodingGuess for the buffer
+    """
+    head = bytes(buffer[:4])
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return EncodingGuess(encoding=encoding, method='bom')
+
+    size = len(buffer)
+    if prefix_size > 0:
+        try:
+            # A multi-byte character may be cut at the end of the prefix
+            codecs.getincrementaldecoder('utf-8')().decode(
+                buffer[:prefix_size], final=size <= prefix_size
+            )
+            return EncodingGuess(encoding='utf-8', method='utf-8')
+        except UnicodeDecodeError:
+            pass
+
+    # Imported here: most buffers never get past the UTF-8 check
+    import chardet
+
+    detector = chardet.UniversalDetector()
+    for window in _sample_windows(buffer, sample_size, sample_count):
+        detector.feed(window)
+        if detector.done:
+            break
+    detected = detector.close()
+    encoding = _normalize(detected.get('encoding'))
+    if encoding is None:
+        return EncodingGuess(encoding='utf-8', method='default', confidence=0.0)
+    return EncodingGuess(
+        encoding=encoding,
+        method='sampled',
+        confidence=detected.get('confidence') or 0.0,
+    )
+
+
+def _sample_windows(buffer, sample_size: int, sample_count: int) -> List[bytes]:
+    """Return ``sample_count`` windows spread evenly over the buffer."""
+    size = len(buffer)
+    if size <= sample_size * sample_count:
+        return [bytes(buffer)]
+
+    step = (size - sample_size) // max(sample_count - 1, 1)
+    windows = []
+    for i in range(sample_count):
+        start = i * step
+        window = bytes(buffer[start : start + sample_size])
+        # Start after and end on a line break so multi-byte characters stay whole
+        if start > 0:
+            window = window[window.find(b'\n') + 1 :]
+        if start + sample_size < size:
+            window = window[: window.rfind(b'\n') + 1] or window
+        windows.append(window)
+    return windows
+
+
+def _normalize(encoding: Optional[str]) -> Optional[str]:
+    """Map chardet's names to codecs, treating ASCII as UTF-8 (its superset)."""
+    if not encoding:
+        return None
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return None
+    return 'utf-8' if name == 'ascii' else name
+
+
+class IncrementalTextDecoder:
+    """
+    Decode a bytes-like buffer block by block with a detected encoding.
+
+    Decoding starts with the encoding from ``detect_encoding``. If the buffer
+    was guessed as UTF-8 but invalid bytes show up later, the rest of the buffer
+    is decoded with an encoding sampled from the remaining bytes.
+
+    Attributes:
+        encoding: Encoding currently used (updated if decoding falls back)
+        guess: Initial EncodingGuess
+    """
+
+    def __init__(self, buffer, block_size: int = 64 * 1024, **detect_options):
+        self.buffer = buffer
+        self.block_size = block_size
+        self.detect_options = detect_options
+        self.guess = detect_encoding(buffer, **detect_options)
+        self.encoding = self.guess.encoding
+
+    def __iter__(self) -> Iterator[str]:
+        # Only trust UTF-8 (or a BOM) strictly; sampled guesses replace bad bytes
+        errors = 'strict' if self.guess.method in ('bom', 'utf-8') else 'replace'
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors=errors)
+        size = len(self.buffer)
+        position = 0
+        while position < size:
+            block = self.buffer[position : position + self.block_size]
+            # Bytes of a character cut by the previous block, not yet decoded
+            pending = len(decoder.getstate()[0])
+            try:
+                text = decoder.decode(block, final=False)
+            except UnicodeDecodeError:
+                # Only strict decoders raise: re-decode from the first undecoded byte
+                position -= pending
+                decoder = self._fall_back(position)
+                errors = 'replace'
+                continue
+            position += len(block)
+            if text:
+                yield text
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+    def _fall_back(self, position: int):
+        options = dict(self.detect_options)
+        # The UTF-8 guess was wrong, skip straight to sampling
+        options['prefix_size'] = 0
+        # Zero-copy view of the remaining bytes, only the samples are copied
+        with memoryview(self.buffer) as view:
+            guess = detect_encoding(view[position:], **options)
+        if guess.encoding == 'utf-8':
+            guess.encoding = 'cp1252'
+        logger.debug(
+            f'Invalid {self.encoding} at byte {position}, '
+            f'falling back to {guess.encoding}'
+        )
+        self.encoding = guess.encoding
+        return codecs.getincrementaldecoder(self.encoding)(errors='replace')
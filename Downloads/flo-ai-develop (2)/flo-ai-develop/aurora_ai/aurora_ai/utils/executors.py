@@ -0,0 +1,218 @@
+"""
+Running tool and node callables without blocking the event loop.
+
+Coroutine functions are awaited directly. Plain functions are assumed to block
+(CPU work or blocking IO) and run on a shared executor: the 'thread' pool by
+default, the 'process' pool for CPU-heavy work that must not hold the GIL, or
+any executor registered with ``register_executor``. An ``ExecutionPolicy``
+selects the pool per tool or node and can bound concurrency and time.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import multiprocessing
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from aurora_ai.utils.logger import logger
+from aurora_ai.utils.usage import add_queue_wait
+
+INLINE = 'inline'
+
+
+@dataclass
+class ExecutionPolicy:
+    """
+    Where and how a tool or function node callable runs.
+
+    Attributes:
+        pool: 'thread', 'process', the name of a pool registered with
+            ``register_executor``, or 'inline' to call plain functions on the
+            event loop (only for trivial functions)
+        max_concurrency: Maximum concurrent calls through this policy, None for
+            no limit beyond the pool size
+        timeout: Seconds to wait for a call. A thread cannot be interrupted, so a
+            timed-out blocking call keeps its worker until it returns.
+    """
+
+    pool: str = 'thread'
+    max_concurrency: Optional[int] = None
+    timeout: Optional[float] = None
+    _semaphores: 'weakref.WeakKeyDictionary' = field(
+        default_factory=weakref.WeakKeyDictionary,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self):
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError('timeout must be positive')
+
+    def limiter(self):
+        """Async context manager enforcing ``max_concurrency`` on the running loop"""
+        if self.max_concurrency is None:
+            return nullcontext()
+        # asyncio primitives belong to one loop; keep one semaphore per loop
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+
+_DEFAULT_POLICY = ExecutionPolicy()
+
+
+class ExecutionTimeoutError(TimeoutError):
+    """A call did not finish within its policy's ``timeout`` (in seconds)"""
+
+    def __init__(self, message: str, timeout: float):
+        super().__init__(message)
+        self.timeout = timeout
+
+
+def process_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for worker processes: forkserver where available, else spawn.
+
+    Forking a process that runs an event loop and other threads can copy held
+    locks into the child, so workers are never forked from the caller.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+_executors: Dict[str, Executor] = {}
+_owned: set = set()
+_executors_lock = threading.Lock()
+_factories: Dict[str, Callable[[], Executor]] = {
+    'thread': lambda: ThreadPoolExecutor(thread_name_prefix='aurora-tool'),
+    'process': lambda: ProcessPoolExecutor(mp_context=process_context()),
+}
+
+
+def register_executor(name: str, executor: Executor):
+    """
+    Make ``executor`` available as the pool ``name`` for execution policies.
+
+    Registering under 'thread' or 'process' replaces the default pool. The
+    caller keeps ownership: ``shutdown_executors`` leaves it running.
+    """
+    if name == INLINE:
+        raise ValueError(f"'{INLINE}' is reserved and cannot name an executor")
+    with _executors_lock:
+        previous = _executors.get(name)
+        _executors[name] = executor
+        owned = name in _owned
+        _owned.discard(name)
+    if previous is not None and previous is not executor and owned:
+        previous.shutdown(wait=False)
+
+
+def get_executor(name: str) -> Executor:
+    """Return the pool ``name``, creating the default thread/process pools lazily"""
+    executor = _executors.get(name)
+    if executor is not None:
+        return executor
+    with _executors_lock:
+        if name not in _executors:
+            factory = _factories.get(name)
+            if factory is None:
+                raise ValueError(
+                    f"Unknown executor '{name}'. Available: "
+                    f'{sorted(set(_factories) | set(_executors))}'
+                )
+            _executors[name] = factory()
+            _owned.add(name)
+        return _executors[name]
+
+
+def shutdown_executors(wait: bool = True):
+    """Shut down the default pools created here; registered pools are kept"""
+    with _executors_lock:
+        owned = [(name, _executors.pop(name)) for name in list(_owned)]
+        _owned.clear()
+    for _, executor in owned:
+        executor.shutdown(wait=wait)
+
+
+def is_blocking(func: Callable) -> bool:
+    """Whether ``func`` is a plain function rather than a coroutine function"""
+    # Callable objects with an async __call__ count as coroutine functions
+    return not (
+        inspect.iscoroutinefunction(func)
+        or inspect.iscoroutinefunction(getattr(func, '__call__', None))
+    )
+
+
+def _drop_broken(name: str, executor: Executor):
+    with _executors_lock:
+        if _executors.get(name) is not executor or name not in _owned:
+            return
+        del _executors[name]
+        _owned.discard(name)
+    logger.warning(f"Executor '{name}' is broken, it will be recreated")
+    executor.shutdown(wait=False)
+
+
+async def _call(func: Callable, kwargs: Dict[str, Any], pool: str) -> Any:
+    if pool == INLINE or not is_blocking(func):
+        result = func(**kwargs)
+    else:
+        executor = get_executor(pool)
+        loop = asyncio.get_running_loop()
+        call = partial(func, **kwargs)
+        if isinstance(executor, ThreadPoolExecutor):
+            # Like asyncio.to_thread: keep the deadline, usage scope and
+            # current span of the caller
+            call = partial(contextvars.copy_context().run, call)
+        try:
+            result = await loop.run_in_executor(executor, call)
+        except BrokenProcessPool:
+            _drop_broken(pool, executor)
+            raise
+    # Plain functions may still return awaitables
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def run_callable(
+    func: Callable,
+    kwargs: Dict[str, Any],
+    policy: Optional[ExecutionPolicy] = None,
+) -> Any:
+    """
+    Call ``func(**kwargs)`` according to ``policy`` and return its result.
+
+    Raises:
+        ExecutionTimeoutError: If the call takes longer than ``policy.timeout``
+    """
+    policy = policy or _DEFAULT_POLICY
+    queued_at = time.monotonic()
+    async with policy.limiter():
+        add_queue_wait(time.monotonic() - queued_at)
+        if policy.timeout is None:
+            return await _call(func, kwargs, policy.pool)
+        try:
+            return await asyncio.wait_for(
+                _call(func, kwargs, policy.pool), policy.timeout
+            )
+        except asyncio.TimeoutError:
+            name = getattr(func, '__name__', repr(func))
+            raise ExecutionTimeoutError(
+                f'{name} did not finish within {policy.timeout}s', policy.timeout
+            ) from None
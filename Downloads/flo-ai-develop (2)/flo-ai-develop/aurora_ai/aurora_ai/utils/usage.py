@@ -0,0 +1,187 @@
+"""
+Per-node resource accounting for workflow runs.
+
+The workflow opens a ``usage_scope`` around every node it executes. The scope's
+``NodeUsage`` is kept in a context variable, so LLM calls, tool calls, caches and
+concurrency limits anywhere below the node (including tasks it starts) add to it
+through the ``add_*`` helpers. Outside a scope the helpers do nothing.
+
+Usage of a nested workflow node is added to the node that runs it, so the outer
+run report covers everything that ran on its behalf.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class NodeUsage:
+    """
+    Resources used by one node execution.
+
+    Attributes:
+        node_name: Name of the node
+        node_type: Type of node ('agent', 'function', 'foreach', ...)
+        status: 'success' or 'error'
+        execution_time: Wall-clock seconds the node took
+        prompt_tokens: Prompt tokens reported by LLM providers
+        completion_tokens: Completion tokens reported by LLM providers
+        llm_calls: LLM requests (generate and stream calls)
+        tool_calls: Tool calls made by agents
+        cache_hits: Results reused instead of computed: node results from the
+            node cache or a previous run, cached tool results, prefetched tools
+        queue_wait_time: Seconds spent waiting for a concurrency slot
+        time_to_first_token: Seconds from node start to the first LLM output,
+            the first chunk for streams and the full response otherwise
+        reused_from: 'cache' or 'previous_run' when the node did not execute
+    """
+
+    node_name: str
+    node_type: str = ''
+    status: str = 'success'
+    execution_time: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    llm_calls: int = 0
+    tool_calls: int = 0
+    cache_hits: int = 0
+    queue_wait_time: float = 0.0
+    time_to_first_token: Optional[float] = None
+    reused_from: Optional[str] = None
+    started_at: float = field(default_factory=time.monotonic, repr=False, compare=False)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def absorb(self, other: 'NodeUsage') -> None:
+        """Add the counts of a nested node execution to this one"""
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.llm_calls += other.llm_calls
+        self.tool_calls += other.tool_calls
+        self.cache_hits += other.cache_hits
+        self.queue_wait_time += other.queue_wait_time
+        if other.time_to_first_token is not None and self.time_to_first_token is None:
+            self.time_to_first_token = (
+                other.started_at - self.started_at + other.time_to_first_token
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+        data['total_tokens'] = self.total_tokens
+        return data
+
+
+class RunReport:
+    """
+    Resource usage of the nodes of one workflow run, in execution order.
+
+    Nodes visited several times have one entry per visit; ``by_node`` sums them.
+    """
+
+    def __init__(self):
+        self.nodes: List[NodeUsage] = []
+
+    def add(self, usage: NodeUsage) -> None:
+        self.nodes.append(usage)
+
+    def by_node(self) -> Dict[str, NodeUsage]:
+        """Usage per node name, summed over visits"""
+        totals: Dict[str, NodeUsage] = {}
+        for usage in self.nodes:
+            total = totals.get(usage.node_name)
+            if total is None:
+                total = totals[usage.node_name] = NodeUsage(
+                    usage.node_name, usage.node_type, started_at=usage.started_at
+                )
+            total.absorb(usage)
+            total.execution_time += usage.execution_time
+            if usage.status != 'success':
+                total.status = usage.status
+        return totals
+
+    def total(self) -> NodeUsage:
+        """Usage of the whole run"""
+        total = NodeUsage('*')
+        for usage in self.nodes:
+            total.absorb(usage)
+            total.execution_time += usage.execution_time
+        total.time_to_first_token = None
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'nodes': [usage.to_dict() for usage in self.nodes],
+            'total': self.total().to_dict(),
+        }
+
+
+_usage: ContextVar[Optional[NodeUsage]] = ContextVar('aurora_node_usage', default=None)
+
+
+@contextmanager
+def usage_scope(usage: Optional[NodeUsage]) -> Iterator[Optional[NodeUsage]]:
+    """
+    Account everything run in the block to ``usage``.
+
+    ``None`` keeps the current scope. On exit the usage is added to the
+    enclosing scope, if any.
+    """
+    if usage is None:
+        yield _usage.get()
+        return
+    parent = _usage.get()
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+        if parent is not None:
+            parent.absorb(usage)
+
+
+def current_usage() -> Optional[NodeUsage]:
+    """Usage of the node running in this context, None outside a node"""
+    return _usage.get()
+
+
+def add_tokens(prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+    usage = _usage.get()
+    if usage is not None:
+        usage.prompt_tokens += prompt_tokens or 0
+        usage.completion_tokens += completion_tokens or 0
+
+
+def add_llm_call() -> None:
+    usage = _usage.get()
+    if usage is not None:
+        usage.llm_calls += 1
+
+
+def mark_first_token() -> None:
+    """Record that LLM output arrived, if none arrived earlier in the node"""
+    usage = _usage.get()
+    if usage is not None and usage.time_to_first_token is None:
+        usage.time_to_first_token = time.monotonic() - usage.started_at
+
+
+def add_tool_call() -> None:
+    usage = _usage.get()
+    if usage is not None:
+        usage.tool_calls += 1
+
+
+def add_cache_hit() -> None:
+    usage = _usage.get()
+    if usage is not None:
+        usage.cache_hits += 1
+
+
+def add_queue_wait(seconds: float) -> None:
+    usage = _usage.get()
+    if usage is not None:
+        usage.queue_wait_time += seconds
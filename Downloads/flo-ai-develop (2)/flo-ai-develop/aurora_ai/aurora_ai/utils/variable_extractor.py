@@ -3,13 +3,87 @@ Variable extraction utilities for the Flo AI framework.
 
 This module provides functions to extract variable placeholders from text,
 inputs, and agent configurations for runtime variable validation.
+
+Prompts are parsed once into a ``PromptTemplate`` (literal and variable
+segments) and cached, so extracting or resolving variables on a prompt that was
+seen before does not run a regex again.
 """
 
 import re
-from typing import List, Set, Dict, Any
+from functools import lru_cache
+from typing import FrozenSet, List, Set, Dict, Any
 
 from aurora_ai.models.chat_message import BaseMessage, TextMessageContent, AssistantMessage
 
+# \w+ matches word characters (letters, digits, underscore)
+_VARIABLE_PATTERN = re.compile(r'<(\w+)>')
+
+# Longer texts (e.g. pasted documents) are parsed without being cached
+_MAX_CACHED_TEMPLATE_LENGTH = 16 * 1024
+
+
+class PromptTemplate:
+    """A prompt parsed once into literal and <variable_name> segments.
+
+    Rendering joins the segments with the variable values instead of running a
+    regex substitution, and the set of required variables is computed once.
+
+    Examples:
+        >>> template = PromptTemplate('Hello <name>, your <role> is important')
+        >>> sorted(template.variables)
+        ['name', 'role']
+        >>> template.render({'name': 'Ada', 'role': 'review'})
+        'Hello Ada, your review is important'
+    """
+
+    __slots__ = ('text', 'variables', '_literals', '_names')
+
+    def __init__(self, text: str):
+        self.text = text
+        # split() alternates literal text and captured variable names
+        parts = _VARIABLE_PATTERN.split(text)
+        self._literals: List[str] = parts[0::2]
+        self._names: List[str] = parts[1::2]
+        self.variables: FrozenSet[str] = frozenset(self._names)
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """Substitute variable values into the template.
+
+        Args:
+            variables: Dictionary of variable name to value mappings
+
+        Returns:
+            The rendered text (the original text if there is nothing to substitute)
+
+        Raises:
+            ValueError: If a variable placeholder is found but not provided in variables
+        """
+        if not self._names or not variables:
+            return self.text
+
+        segments = [self._literals[0]]
+        for name, literal in zip(self._names, self._literals[1:]):
+            if name not in variables:
+                raise ValueError(
+                    f"Variable '{name}' referenced in text but not provided. "
+                    f'Available variables: {list(variables.keys())}'
+                )
+            segments.append(str(variables[name]))
+            segments.append(literal)
+        return ''.join(segments)
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(text: str) -> PromptTemplate:
+    return PromptTemplate(text)
+
+
+def compile_template(text: str) -> PromptTemplate:
+    """Return the (cached) PromptTemplate for a prompt text."""
+    if len(text) > _MAX_CACHED_TEMPLATE_LENGTH:
+        return PromptTemplate(text)
+    return _compile_cached(text)
+
 
 def extract_variables_from_text(text: str | AssistantMessage) -> Set[str]:
     """Extract variable placeholders from text using <variable_name> pattern.
@@ -33,11 +107,9 @@ def extract_variables_from_text(text: str | AssistantMessage) -> Set[str]:
     elif isinstance(text, str):
         text_str = text
 
-    # Use regex to find all <variable_name> patterns
-    # \w+ matches word characters (letters, digits, underscore)
-    variable_pattern = r'<(\w+)>'
-    matches = re.findall(variable_pattern, text_str)
-    return set(matches)
+    if '<' not in text_str:
+        return set()
+    return set(compile_template(text_str).variables)
 
 
 def extract_variables_from_inputs(inputs: List[BaseMessage]) -> Set[str]:
@@ -122,21 +194,10 @@ def resolve_variables(
     Raises:
         ValueError: If a variable placeholder is found but not provided in variables
     """
-    if not text or not variables:
+    if not text or not variables or '<' not in text:
         return text
 
-    def replace_var(match):
-        var_name = match.group(1)
-        if var_name in variables:
-            return str(variables[var_name])
-        else:
-            available = list(variables.keys())
-            raise ValueError(
-                f"Variable '{var_name}' referenced in text but not provided. "
-                f'Available variables: {available}'
-            )
-
-    return re.sub(r'<(\w+)>', replace_var, text)
+    return compile_template(text).render(variables)
 
 
 def validate_multi_agent_variables(
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Gemini Concurrency Benchmark
+
+Compares the previous thread-per-call Gemini path (``asyncio.to_thread`` around
+the synchronous SDK, one hop per streamed chunk) with the native async client
+(``client.aio``) used by ``Gemini`` and ``VertexAI``, at several concurrency
+levels. The SDK is replaced by a fake client with fixed network latency, so no
+API key is needed and results only reflect client-side scheduling.
+
+Usage (from the project root):
+    PYTHONPATH=. python benchmarks/gemini_concurrency_benchmark.py --concurrency 50 200
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from aurora_ai.llm.gemini_llm import Gemini
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.usage_metadata = None
+        self.candidates = []
+
+
+class FakeClient:
+    """Mimics the sync and async generate/stream calls with fixed latency."""
+
+    def __init__(self, latency: float, chunks: int):
+        self.latency = latency
+        self.chunks = chunks
+        self.models = SimpleNamespace(
+            generate_content=self._generate,
+            generate_content_stream=self._stream,
+        )
+        self.aio = SimpleNamespace(
+            models=SimpleNamespace(
+                generate_content=self._agenerate,
+                generate_content_stream=self._astream,
+            )
+        )
+
+    def _generate(self, **kwargs):
+        time.sleep(self.latency)
+        return FakeResponse('done')
+
+    def _stream(self, **kwargs):
+        for _ in range(self.chunks):
+            time.sleep(self.latency / self.chunks)
+            yield FakeResponse('tok')
+
+    async def _agenerate(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return FakeResponse('done')
+
+    async def _astream(self, **kwargs):
+        async def chunks():
+            for _ in range(self.chunks):
+                await asyncio.sleep(self.latency / self.chunks)
+                yield FakeResponse('tok')
+
+        return chunks()
+
+
+async def legacy_generate(client, **kwargs):
+    return await asyncio.to_thread(client.models.generate_content, **kwargs)
+
+
+async def legacy_stream(client, **kwargs):
+    stream = await asyncio.to_thread(client.models.generate_content_stream, **kwargs)
+
+    def get_next_chunk():
+        try:
+            return next(stream)
+        except StopIteration:
+            return None
+
+    count = 0
+    while await asyncio.to_thread(get_next_chunk) is not None:
+        count += 1
+    return count
+
+
+async def native_stream(llm, messages):
+    return len([chunk async for chunk in llm.stream(messages)])
+
+
+async def run(label, make_call, concurrency):
+    start = time.perf_counter()
+    await asyncio.gather(*(make_call() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    print(
+        f'{label:<18} {concurrency:>6} {elapsed * 1000:>10.0f} {concurrency / elapsed:>10.1f}'
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[50, 200])
+    parser.add_argument('--latency', type=float, default=0.2, help='Seconds per call')
+    parser.add_argument('--chunks', type=int, default=20, help='Chunks per stream')
+    args = parser.parse_args()
+
+    client = FakeClient(args.latency, args.chunks)
+    with patch('aurora_ai.llm.gemini_llm.genai.Client', return_value=client):
+        llm = Gemini(api_key='benchmark')
+    messages = [{'role': 'user', 'content': 'Hello'}]
+    request = {'model': llm.model, 'contents': ['Hello'], 'config': None}
+
+    print(f'{"path":<18} {"calls":>6} {"total (ms)":>10} {"calls/s":>10}')
+    for concurrency in args.concurrency:
+        await run(
+            'to_thread generate',
+            lambda: legacy_generate(client, **request),
+            concurrency,
+        )
+        await run('aio generate', lambda: llm.generate(messages), concurrency)
+        await run(
+            'to_thread stream', lambda: legacy_stream(client, **request), concurrency
+        )
+        await run('aio stream', lambda: native_stream(llm, messages), concurrency)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Import Time Benchmark
+
+Measures the cold-start cost of ``import aurora_ai`` in fresh interpreters and
+fails if the median exceeds a budget. Also reports which heavy optional
+dependencies were loaded by the import; provider SDKs, PDF processing and the
+OpenTelemetry SDK should only be imported on first use.
+
+Usage (from the project root):
+    PYTHONPATH=. python benchmarks/import_time_benchmark.py --budget 1.0
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = [
+    'openai',
+    'anthropic',
+    'google.genai',
+    'aiohttp',
+    'chardet',
+    'pymupdf',
+    'pymupdf4llm',
+    'opentelemetry.sdk',
+    'opentelemetry.exporter.otlp.proto.grpc',
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str) -> dict:
+    code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--module', default='aurora_ai', help='Module to import')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters')
+    parser.add_argument(
+        '--budget', type=float, default=1.0, help='Maximum median import time (s)'
+    )
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    times = [run['seconds'] for run in runs]
+    median = statistics.median(times)
+
+    print(f'import {args.module}: {args.runs} runs')
+    print(f'  median {median * 1000:8.1f} ms')
+    print(f'  min    {min(times) * 1000:8.1f} ms')
+    print(f'  max    {max(times) * 1000:8.1f} ms')
+    print(f'  heavy modules loaded: {", ".join(runs[-1]["loaded"]) or "none"}')
+
+    if median > args.budget:
+        print(f'FAIL: median import time exceeds the {args.budget:.2f}s budget')
+        sys.exit(1)
+    print(f'OK: within the {args.budget:.2f}s budget')
+
+
+if __name__ == '__main__':
+    main()
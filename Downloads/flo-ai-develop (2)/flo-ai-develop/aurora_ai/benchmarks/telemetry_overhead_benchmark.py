@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Telemetry Overhead Benchmark
+
+Runs the same workflow of agents with telemetry off, on, head-sampled and in
+low-overhead mode (no expensive span attributes), and reports the time per run.
+The LLM is replaced by a fake one returning large answers without latency, so
+attribute computation such as ``len(str(result))`` on agent results shows up.
+Spans are created but not exported, so results only reflect in-process
+overhead.
+
+Usage (from the project root):
+    aurora_ai_LOG_LEVEL=WARNING PYTHONPATH=. python benchmarks/telemetry_overhead_benchmark.py --runs 200 --result-kb 256
+"""
+
+import argparse
+import asyncio
+import time
+
+from aurora_ai.arium.arium import aurora
+from aurora_ai.arium.memory import MessageMemory
+from aurora_ai.builder.agent_builder import AgentBuilder
+from aurora_ai.llm.base_llm import BaseLLM
+from aurora_ai.telemetry import configure_telemetry
+from aurora_ai.telemetry.telemetry import _global_telemetry
+
+
+class FakeLLM(BaseLLM):
+    """Answers every request at once with the same large response."""
+
+    def __init__(self, answer: str):
+        super().__init__(model='fake')
+        self.answer = answer
+
+    async def generate(self, messages, functions=None, output_schema=None, **kwargs):
+        return {'content': self.answer}
+
+    async def stream(self, messages, functions=None, output_schema=None):
+        yield {'content': self.answer}
+
+    async def get_function_call(self, response):
+        return None
+
+    def get_message_content(self, response):
+        return response['content']
+
+    def format_tool_for_llm(self, tool):
+        return {'name': tool.name}
+
+    def format_tools_for_llm(self, tools):
+        return [self.format_tool_for_llm(tool) for tool in tools]
+
+    def format_image_in_message(self, image):
+        raise NotImplementedError
+
+
+def build_workflow(nodes: int, result_kb: int):
+    llm = FakeLLM('x' * (result_kb * 1024))
+    agents = [
+        AgentBuilder()
+        .with_name(f'step{i}')
+        .with_prompt('Repeat the input.')
+        .with_llm(llm)
+        .build()
+        for i in range(nodes)
+    ]
+    workflow = aurora(MessageMemory())
+    workflow.add_nodes(agents)
+    workflow.start_at(agents[0])
+    for current, following in zip(agents, agents[1:]):
+        workflow.add_edge(current.name, [following.name])
+    workflow.add_end_to(agents[-1])
+    workflow.compile()
+    return workflow, agents
+
+
+def use_mode(mode: str, sample_rate: float):
+    if mode == 'off':
+        _global_telemetry.tracer = None
+        return
+    configure_telemetry(
+        service_name='telemetry_benchmark',
+        sample_rate=sample_rate if mode == 'sampled' else 1.0,
+        detailed_attributes=mode != 'low-overhead',
+    )
+
+
+async def run(workflow: aurora, agents: list, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        await workflow.run('go')
+        # Agents keep their conversation across runs; start each run afresh
+        for agent in agents:
+            agent.clear_history()
+    return (time.perf_counter() - start) / runs
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=200)
+    parser.add_argument('--nodes', type=int, default=5, help='Nodes per workflow')
+    parser.add_argument(
+        '--result-kb', type=int, default=256, help='Size of each node result'
+    )
+    parser.add_argument('--sample-rate', type=float, default=0.1)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    workflow, agents = build_workflow(args.nodes, args.result_kb)
+    modes = ['off', 'on', 'sampled', 'low-overhead']
+    best = {}
+    # Modes are interleaved and the best round kept, to even out machine noise
+    for _ in range(args.rounds):
+        for mode in modes:
+            use_mode(mode, args.sample_rate)
+            await run(workflow, agents, 5)  # warm up
+            per_run = await run(workflow, agents, args.runs)
+            best[mode] = min(best.get(mode, per_run), per_run)
+
+    print(f'{"mode":<14} {"ms/run":>10} {"overhead":>10}')
+    for mode in modes:
+        overhead = (best[mode] / best['off'] - 1) * 100
+        print(f'{mode:<14} {best[mode] * 1000:>10.3f} {overhead:>9.1f}%')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for the document processing utilities.
+"""
+
+import sys
+import os
+import tempfile
+import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pymupdf
+import pymupdf4llm
+
+from aurora_ai.models.agent import Agent
+from aurora_ai.models.chat_message import DocumentMessageContent
+from aurora_ai.models.document import DocumentType
+from aurora_ai.utils.document_processor import (
+    DocumentProcessor,
+    DocumentProcessingError,
+    PDFProcessor,
+    TXTProcessor,
+    get_page_text,
+)
+
+
+def make_pdf(page_count: int, title: str = '') -> bytes:
+    """Build an in-memory PDF with one line of text per page."""
+    doc = pymupdf.open()
+    if title:
+        doc.set_metadata({'title': title})
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 72), f'This is page number {i + 1}')
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestPDFProcessor:
+    """Test cases for PDFProcessor."""
+
+    def test_split_page_ranges(self):
+        """Test that pages are split into ordered, bounded chunks."""
+        processor = PDFProcessor(use_process_pool=False, pages_per_chunk=2)
+        assert processor._split_page_ranges(5) == [[0, 1], [2, 3], [4]]
+        assert processor._split_page_ranges(0) == []
+
+    def test_invalid_pages_per_chunk(self):
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError):
+            PDFProcessor(pages_per_chunk=0)
+
+    @pytest.mark.asyncio
+    async def test_chunked_output_matches_single_pass(self):
+        """Test that chunked extraction re-assembles pages in order."""
+        pdf_bytes = make_pdf(5)
+        processor = PDFProcessor(use_process_pool=False, pages_per_chunk=2)
+
+        result = await processor.process(
+            DocumentMessageContent(bytes=pdf_bytes, mime_type=DocumentType.PDF.value)
+        )
+        processor.shutdown()
+
+        single_pass = pymupdf4llm.to_markdown(
+            pymupdf.open(stream=pdf_bytes), show_progress=False
+        )
+        assert result['extracted_text'] == single_pass
+        positions = [
+            result['extracted_text'].index(f'page number {i}') for i in range(1, 6)
+        ]
+        assert positions == sorted(positions)
+
+    @pytest.mark.asyncio
+    async def test_page_count_offsets_and_metadata(self):
+        """Test that page count, offsets and metadata come from the document."""
+        processor = PDFProcessor(use_process_pool=False, pages_per_chunk=2)
+
+        result = await processor.process(
+            DocumentMessageContent(
+                bytes=make_pdf(5, title='Quarterly report'),
+                mime_type=DocumentType.PDF.value,
+            )
+        )
+        processor.shutdown()
+
+        assert result['page_count'] == 5
+        assert result['metadata']['title'] == 'Quarterly report'
+        assert len(result['page_offsets']) == 6
+        assert result['page_offsets'][-1] == len(result['extracted_text'])
+        for page_number in range(1, 6):
+            page_text = get_page_text(result, page_number)
+            assert f'page number {page_number}' in page_text
+            assert 'page number' not in page_text.replace(
+                f'page number {page_number}', ''
+            )
+        with pytest.raises(IndexError):
+            get_page_text(result, 6)
+
+    @pytest.mark.asyncio
+    async def test_uses_injected_executor(self):
+        """Test that extraction runs in the provided executor."""
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='test-pdf')
+        processor = PDFProcessor(executor=executor, pages_per_chunk=1)
+
+        result = await processor.process(
+            DocumentMessageContent(bytes=make_pdf(3), mime_type=DocumentType.PDF.value)
+        )
+
+        assert 'page number 3' in result['extracted_text']
+        # Injected executors are owned by the caller
+        processor.shutdown()
+        assert processor._get_executor() is executor
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_process_pool_extraction(self):
+        """Test extraction through the default process pool."""
+        processor = PDFProcessor(max_workers=2, pages_per_chunk=2)
+        try:
+            result = await processor.process(
+                DocumentMessageContent(
+                    bytes=make_pdf(3), mime_type=DocumentType.PDF.value
+                )
+            )
+        finally:
+            processor.shutdown()
+
+        assert 'page number 1' in result['extracted_text']
+        assert 'page number 3' in result['extracted_text']
+
+    @pytest.mark.asyncio
+    async def test_process_pool_gets_path_not_bytes(self):
+        """Test that process pool tasks open a temporary file instead of pickled bytes."""
+        submitted = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(args[0])
+                return super().submit(fn, *args, **kwargs)
+
+        executor = RecordingPool(max_workers=2)
+        processor = PDFProcessor(executor=executor, pages_per_chunk=1)
+        document = DocumentMessageContent(
+            bytes=make_pdf(3), mime_type=DocumentType.PDF.value
+        )
+        try:
+            result = await processor.process(document)
+            chunks = [chunk async for chunk in processor.stream(document)]
+        finally:
+            executor.shutdown()
+
+        assert 'page number 3' in result['extracted_text']
+        assert [chunk.page_number for chunk in chunks] == [1, 2, 3]
+        # An info call and three page ranges, for each of process and stream
+        assert len(submitted) == 8
+        assert all(isinstance(content, str) for content in submitted)
+        assert not any(os.path.exists(path) for path in submitted)
+
+    def test_process_pool_not_forked(self):
+        """Test that the default process pool never forks the caller."""
+        processor = PDFProcessor(max_workers=1)
+        executor = processor._get_executor()
+        try:
+            assert executor._mp_context.get_start_method() != 'fork'
+        finally:
+            processor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_pages_in_order(self):
+        """Test that streaming yields one chunk per page, in order."""
+        processor = PDFProcessor(
+            use_process_pool=False, pages_per_chunk=2, max_concurrency=2
+        )
+        document = DocumentMessageContent(
+            bytes=make_pdf(5), mime_type=DocumentType.PDF.value
+        )
+
+        chunks = [chunk async for chunk in processor.stream(document)]
+        processor.shutdown()
+
+        assert [chunk.page_number for chunk in chunks] == [1, 2, 3, 4, 5]
+        assert [chunk.chunk_index for chunk in chunks] == [0, 1, 2, 3, 4]
+        for chunk in chunks:
+            assert f'page number {chunk.page_number}' in chunk.text
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_early(self):
+        """Test that a consumer can stop streaming before the last page."""
+        processor = PDFProcessor(use_process_pool=False, pages_per_chunk=1)
+        document = DocumentMessageContent(
+            bytes=make_pdf(4), mime_type=DocumentType.PDF.value
+        )
+
+        stream = processor.stream(document)
+        first = await stream.__anext__()
+        await stream.aclose()
+        processor.shutdown()
+
+        assert first.page_number == 1
+
+
+class TestTXTProcessor:
+    """Test cases for TXTProcessor."""
+
+    @pytest.mark.asyncio
+    async def test_stream_from_file_splits_on_lines(self):
+        """Test streaming a memory-mapped local file in line-aligned chunks."""
+        lines = [f'line {i} caf\u00e9' for i in range(200)]
+        text = '\n'.join(lines) + '\n'
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as f:
+            f.write(text.encode('utf-8'))
+        try:
+            processor = TXTProcessor(chunk_size=100)
+            document = DocumentMessageContent(
+                url=f.name, mime_type=DocumentType.TXT.value
+            )
+            chunks = [chunk async for chunk in processor.stream(document)]
+            result = await processor.process(document)
+        finally:
+            os.unlink(f.name)
+
+        assert ''.join(chunk.text for chunk in chunks) == text
+        assert all(chunk.text.endswith('\n') for chunk in chunks)
+        assert all(chunk.page_number is None for chunk in chunks)
+        assert result['extracted_text'] == text
+        assert result['metadata']['line_count'] == 200
+        assert result['page_offsets'] == [0, len(text)]
+
+    @pytest.mark.asyncio
+    async def test_line_count_without_trailing_newline(self):
+        """Test that a final line without a newline is counted."""
+        document = DocumentMessageContent(
+            bytes=b'first\nsecond\r\nthird', mime_type=DocumentType.TXT.value
+        )
+
+        result = await TXTProcessor().process(document)
+
+        assert result['metadata']['line_count'] == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_decodes_multibyte_across_blocks(self):
+        """Test that multi-byte characters split across blocks decode correctly."""
+        text = '\u00e9' * (TXTProcessor._BLOCK_SIZE + 1)
+        processor = TXTProcessor()
+        document = DocumentMessageContent(
+            bytes=text.encode('utf-8'), mime_type=DocumentType.TXT.value
+        )
+
+        chunks = [chunk async for chunk in processor.stream(document)]
+
+        assert ''.join(chunk.text for chunk in chunks) == text
+
+    @pytest.mark.asyncio
+    async def test_stream_empty_file(self):
+        """Test that an empty file yields a single empty chunk."""
+        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+            pass
+        try:
+            document = DocumentMessageContent(
+                url=f.name, mime_type=DocumentType.TXT.value
+            )
+            chunks = [chunk async for chunk in TXTProcessor().stream(document)]
+        finally:
+            os.unlink(f.name)
+
+        assert [chunk.text for chunk in chunks] == ['']
+
+
+class TestDocumentProcessor:
+    """Test cases for DocumentProcessor."""
+
+    @pytest.mark.asyncio
+    async def test_stream_document_dispatches_by_type(self):
+        """Test that stream_document uses the processor for the mime type."""
+        processor = DocumentProcessor()
+        document = DocumentMessageContent(
+            bytes=b'hello\nworld\n', mime_type=DocumentType.TXT.value
+        )
+
+        chunks = [chunk async for chunk in processor.stream_document(document)]
+
+        assert [chunk.text for chunk in chunks] == ['hello\nworld\n']
+
+    @pytest.mark.asyncio
+    async def test_stream_document_unsupported_type(self):
+        """Test that unsupported mime types are rejected."""
+        processor = DocumentProcessor()
+        document = DocumentMessageContent(bytes=b'x', mime_type='image/png')
+
+        with pytest.raises(DocumentProcessingError):
+            [chunk async for chunk in processor.stream_document(document)]
+
+
+class TestAgentStreamDocument:
+    """Test cases for Agent.stream_document."""
+
+    @pytest.mark.asyncio
+    async def test_runs_llm_per_chunk(self):
+        """Test that the agent calls the LLM once per chunk, in order."""
+        llm = MagicMock()
+        llm.generate = AsyncMock(side_effect=[{'n': 1}, {'n': 2}])
+        llm.get_message_content = MagicMock(side_effect=lambda r: f'summary {r["n"]}')
+        agent = Agent(name='summarizer', system_prompt='Summarize for <team>', llm=llm)
+        document = DocumentMessageContent(
+            bytes=make_pdf(2), mime_type=DocumentType.PDF.value
+        )
+
+        results = [
+            result
+            async for result in agent.stream_document(
+                document, instruction='Summarize:', variables={'team': 'ops'}
+            )
+        ]
+
+        assert [(chunk.page_number, text) for chunk, text in results] == [
+            (1, 'summary 1'),
+            (2, 'summary 2'),
+        ]
+        messages = llm.generate.call_args_list[1].args[0]
+        assert messages[0] == {'role': 'system', 'content': 'Summarize for ops'}
+        assert messages[1]['content'].startswith('Summarize:\n\n')
+        assert 'page number 2' in messages[1]['content']
+        assert agent.conversation_history == []
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for bounded-cost encoding detection.
+"""
+
+import sys
+import os
+import codecs
+import pytest
+from unittest.mock import patch
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chardet
+
+from aurora_ai.models.chat_message import DocumentMessageContent
+from aurora_ai.models.document import DocumentType
+from aurora_ai.utils.document_processor import TXTProcessor
+from aurora_ai.utils.encoding_detection import (
+    IncrementalTextDecoder,
+    detect_encoding,
+)
+
+FRENCH = 'Le cœur déçu mais l’âme plutôt naïve, Louÿs rêva de crapaüter. ' * 40
+RUSSIAN = 'Съешь же ещё этих мягких французских булок, да выпей чаю. ' * 40
+JAPANESE = (
+    'いろはにほへと ちりぬるを わかよたれそ つねならむ、日本語のテキストです。' * 40
+)
+
+
+class TestDetectEncoding:
+    """Test cases for detect_encoding."""
+
+    @pytest.mark.parametrize(
+        'bom, encoding',
+        [
+            (codecs.BOM_UTF8, 'utf-8-sig'),
+            (codecs.BOM_UTF16_LE, 'utf-16'),
+            (codecs.BOM_UTF16_BE, 'utf-16'),
+            (codecs.BOM_UTF32_LE, 'utf-32'),
+            (codecs.BOM_UTF32_BE, 'utf-32'),
+        ],
+    )
+    def test_bom(self, bom, encoding):
+        """Test that byte order marks are recognised without chardet."""
+        with patch.object(chardet, 'detect') as detect:
+            guess = detect_encoding(bom + b'text')
+
+        assert guess.encoding == encoding
+        assert guess.method == 'bom'
+        detect.assert_not_called()
+
+    def test_utf8_prefix(self):
+        """Test that valid UTF-8 is accepted from the prefix alone."""
+        data = FRENCH.encode('utf-8') * 100
+        with patch.object(chardet, 'detect') as detect:
+            guess = detect_encoding(data, prefix_size=1000)
+
+        assert (guess.encoding, guess.method) == ('utf-8', 'utf-8')
+        detect.assert_not_called()
+
+    def test_utf8_prefix_cut_mid_character(self):
+        """Test that a character split at the prefix boundary is still valid."""
+        data = 'é'.encode('utf-8') * 10
+        assert detect_encoding(data, prefix_size=5).encoding == 'utf-8'
+
+    @pytest.mark.parametrize(
+        'text, encoding',
+        [
+            (FRENCH, 'cp1252'),
+            (RUSSIAN, 'koi8-r'),
+            (RUSSIAN, 'iso-8859-5'),
+            (JAPANESE, 'shift_jis'),
+        ],
+    )
+    def test_sampled_detection_decodes_correctly(self, text, encoding):
+        """Test that legacy encodings are detected from samples."""
+        data = text.encode(encoding)
+
+        guess = detect_encoding(data)
+
+        assert guess.method == 'sampled'
+        assert data.decode(guess.encoding) == text
+
+    def test_detection_cost_is_bounded(self):
+        """Test that chardet only sees the sampled windows of a large buffer."""
+        data = RUSSIAN.encode('koi8-r') * 500
+        seen = []
+        original = chardet.UniversalDetector.feed
+
+        def record(detector, window):
+            seen.append(len(window))
+            return original(detector, window)
+
+        with patch.object(chardet.UniversalDetector, 'feed', record):
+            guess = detect_encoding(data, sample_size=4096, sample_count=3)
+
+        assert len(data) > 1_000_000
+        assert 0 < sum(seen) <= 4096 * 3
+        assert guess.encoding == 'koi8-r'
+
+    def test_samples_do_not_cut_multibyte_characters(self):
+        """Test that sampled windows of a large multi-byte file are decodable."""
+        text = (JAPANESE + '\n') * 200
+        data = text.encode('shift_jis')
+
+        guess = detect_encoding(data, sample_size=1024, sample_count=4)
+
+        assert data.decode(guess.encoding) == text
+
+
+class TestIncrementalTextDecoder:
+    """Test cases for IncrementalTextDecoder."""
+
+    def test_decodes_utf16_across_blocks(self):
+        """Test that BOM-detected UTF-16 decodes across small blocks."""
+        data = RUSSIAN.encode('utf-16')
+        decoder = IncrementalTextDecoder(data, block_size=7)
+
+        assert ''.join(decoder) == RUSSIAN
+
+    def test_falls_back_when_utf8_guess_is_wrong(self):
+        """Test that invalid UTF-8 after the prefix switches encoding."""
+        head = 'plain ascii line\n' * 100
+        tail = 'déjà vu, naïve café\n' * 100
+        data = head.encode('utf-8') + tail.encode('cp1252')
+        decoder = IncrementalTextDecoder(data, block_size=64, prefix_size=256)
+
+        text = ''.join(decoder)
+
+        assert decoder.guess.method == 'utf-8'
+        assert text.startswith(head)
+        assert text.count('�') == 0
+        assert decoder.encoding != 'utf-8'
+        assert text[len(head) :] == data[len(head) :].decode(decoder.encoding)
+
+
+class TestTXTProcessorEncoding:
+    """Test cases for TXTProcessor encoding handling."""
+
+    @pytest.mark.asyncio
+    async def test_reports_detected_encoding(self):
+        """Test that the detected encoding is reported in the metadata."""
+        document = DocumentMessageContent(
+            bytes=RUSSIAN.encode('koi8-r'), mime_type=DocumentType.TXT.value
+        )
+
+        result = await TXTProcessor().process(document)
+
+        assert result['extracted_text'] == RUSSIAN
+        assert result['metadata']['encoding_detection'] == 'sampled'
+        assert codecs.lookup(result['metadata']['encoding']).name == 'koi8-r'
+
+    @pytest.mark.asyncio
+    async def test_utf8_sig_strips_bom(self):
+        """Test that a UTF-8 BOM is not part of the extracted text."""
+        document = DocumentMessageContent(
+            bytes=codecs.BOM_UTF8 + b'hello', mime_type=DocumentType.TXT.value
+        )
+
+        result = await TXTProcessor().process(document)
+
+        assert result['extracted_text'] == 'hello'
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for the aurora workflow event bus.
+"""
+
+import sys
+import os
+import asyncio
+import time
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.arium import (
+    OverflowPolicy,
+    auroraEvent,
+    auroraEventBus,
+    auroraEventType,
+)
+from aurora_ai.arium import arium as arium_module
+from aurora_ai.arium.arium import aurora
+from aurora_ai.arium.memory import MessageMemory
+from aurora_ai.arium.nodes import FunctionNode
+
+
+def build_workflow(node_count=2):
+    async def step(inputs, variables):
+        return 'ok'
+
+    nodes = [
+        FunctionNode(name=f'step{i}', description='Step', function=step)
+        for i in range(node_count)
+    ]
+    workflow = aurora(MessageMemory())
+    workflow.add_nodes(nodes)
+    workflow.start_at(nodes[0])
+    for current, following in zip(nodes, nodes[1:]):
+        workflow.add_edge(current.name, [following.name])
+    workflow.add_end_to(nodes[-1])
+    workflow.compile()
+    return workflow
+
+
+def event(event_type=auroraEventType.NODE_STARTED, name=None):
+    return auroraEvent(event_type=event_type, timestamp=0.0, node_name=name)
+
+
+class TestWorkflowEvents:
+    """Test cases for publishing workflow events."""
+
+    @pytest.mark.asyncio
+    async def test_no_events_without_subscribers(self, monkeypatch):
+        """Test that no event objects are created when nobody listens."""
+
+        def fail(**kwargs):
+            raise AssertionError('event created without subscribers')
+
+        monkeypatch.setattr(arium_module, 'auroraEvent', fail)
+
+        await build_workflow().run('hi')
+
+    @pytest.mark.asyncio
+    async def test_filters_and_multiple_subscribers(self):
+        """Test that each subscriber only receives the event types it asked for."""
+        workflow = build_workflow()
+        started, everything = [], []
+        workflow.events.subscribe(started.append, events=[auroraEventType.NODE_STARTED])
+
+        await workflow.run('hi', event_callback=everything.append)
+
+        assert [e.node_name for e in started] == ['__start__', 'step0', 'step1']
+        assert everything[0].event_type == auroraEventType.WORKFLOW_STARTED
+        assert everything[-1].event_type == auroraEventType.WORKFLOW_COMPLETED
+        assert len(everything) > len(started)
+
+    @pytest.mark.asyncio
+    async def test_run_callback_removed_after_run(self):
+        """Test that the per-run callback does not outlive the run."""
+        workflow = build_workflow()
+        events = []
+
+        await workflow.run(
+            'hi',
+            event_callback=events.append,
+            events_filter=[auroraEventType.WORKFLOW_COMPLETED],
+        )
+
+        assert len(events) == 1
+        assert workflow.events.mask == 0
+
+    @pytest.mark.asyncio
+    async def test_overlapping_runs_keep_their_events(self):
+        """Test that a per-run callback never receives another run's events."""
+
+        async def step(inputs, variables):
+            await asyncio.sleep(0.02)
+            return 'ok'
+
+        node = FunctionNode(name='step', description='Step', function=step)
+        workflow = aurora(MessageMemory())
+        workflow.add_nodes([node])
+        workflow.start_at(node)
+        workflow.add_end_to(node)
+        workflow.compile()
+        lasting, first, second = [], [], []
+        workflow.events.subscribe(
+            lasting.append, events=[auroraEventType.WORKFLOW_STARTED]
+        )
+
+        await asyncio.gather(
+            workflow.run('a', event_callback=first.append),
+            workflow.run('b', event_callback=second.append),
+        )
+
+        for events in (first, second):
+            types = [e.event_type for e in events]
+            assert types.count(auroraEventType.WORKFLOW_STARTED) == 1
+            assert types.count(auroraEventType.WORKFLOW_COMPLETED) == 1
+        assert len(lasting) == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_async_subscriber_off_critical_path(self):
+        """Test that an async subscriber does not hold up the workflow."""
+        workflow = build_workflow()
+        received = []
+
+        async def push(event):
+            await asyncio.sleep(0.05)
+            received.append(event.event_type)
+
+        workflow.events.subscribe(push)
+        start = time.monotonic()
+        await workflow.run('hi')
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.05
+        await workflow.events.drain()
+        assert received[-1] == auroraEventType.WORKFLOW_COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_does_not_fail_workflow(self):
+        """Test that subscriber errors are logged, not raised."""
+        workflow = build_workflow()
+
+        def broken(event):
+            raise RuntimeError('socket closed')
+
+        result = await workflow.run('hi', event_callback=broken)
+
+        assert result[-1].result.content == 'ok'
+
+
+class TestEventBus:
+    """Test cases for event bus queueing and overflow policies."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'overflow, expected',
+        [
+            (OverflowPolicy.DROP_NEWEST, ['e0', 'e1']),
+            (OverflowPolicy.DROP_OLDEST, ['e3', 'e4']),
+        ],
+    )
+    async def test_drop_policies(self, overflow, expected):
+        """Test that full queues drop events according to the policy."""
+        bus = auroraEventBus()
+        received = []
+
+        async def collect(event):
+            received.append(event.node_name)
+
+        subscription = bus.subscribe(collect, max_queue=2, overflow=overflow)
+        for i in range(5):
+            bus.publish(event(name=f'e{i}'))
+        await bus.drain()
+
+        assert received == expected
+        assert subscription.dropped == 3
+
+    @pytest.mark.asyncio
+    async def test_block_applies_back_pressure(self):
+        """Test that the block policy keeps every event and makes publishers wait."""
+        bus = auroraEventBus()
+        received = []
+
+        async def collect(event):
+            await asyncio.sleep(0.01)
+            received.append(event.node_name)
+
+        subscription = bus.subscribe(collect, max_queue=1, overflow='block')
+        for i in range(3):
+            bus.publish(event(name=f'e{i}'))
+
+        assert bus.backlogged
+        await bus.wait_for_capacity()
+        assert not bus.backlogged
+        await bus.drain()
+
+        assert received == ['e0', 'e1', 'e2']
+        assert subscription.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_publishers_all_get_capacity(self):
+        """Test that every publisher waiting on a full queue is woken."""
+        bus = auroraEventBus()
+        received = []
+
+        async def collect(event):
+            await asyncio.sleep(0.01)
+            received.append(event.node_name)
+
+        bus.subscribe(collect, max_queue=1, overflow='block')
+
+        async def publish(prefix):
+            for i in range(2):
+                bus.publish(event(name=f'{prefix}{i}'))
+                await bus.wait_for_capacity()
+
+        await asyncio.wait_for(asyncio.gather(publish('a'), publish('b')), 2)
+        await bus.drain()
+
+        assert sorted(received) == ['a0', 'a1', 'b0', 'b1']
+
+    def test_mask_tracks_subscriptions(self):
+        """Test that unsubscribing clears the bits of unused event types."""
+        bus = auroraEventBus()
+        nodes = bus.subscribe(print, events=[auroraEventType.NODE_FAILED])
+        workflow = bus.subscribe(print, events=[auroraEventType.WORKFLOW_FAILED])
+
+        assert bus.wants(auroraEventType.NODE_FAILED)
+        assert not bus.wants(auroraEventType.NODE_STARTED)
+
+        nodes.unsubscribe()
+        assert not bus.wants(auroraEventType.NODE_FAILED)
+        workflow.unsubscribe()
+        assert bus.mask == 0
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for running blocking tools and function nodes off the event loop.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.arium.nodes import FunctionNode
+from aurora_ai.tool import ExecutionPolicy, ToolTimeoutError, aurora_tool
+from aurora_ai.utils import executors
+from aurora_ai.utils.deadline import deadline_scope, remaining_time
+from aurora_ai.utils.executors import (
+    ExecutionTimeoutError,
+    is_blocking,
+    register_executor,
+    run_callable,
+)
+from aurora_ai.utils.usage import NodeUsage, add_tool_call, usage_scope
+
+
+@aurora_tool(execution=ExecutionPolicy(pool='process'))
+def worker_pid(value: int) -> tuple:
+    """Return the worker process id"""
+    return os.getpid(), value * 2
+
+
+@pytest.fixture(autouse=True, scope='module')
+def shutdown_pools():
+    yield
+    executors.shutdown_executors()
+
+
+class TestIsBlocking:
+    """Test cases for blocking callable detection."""
+
+    def test_detection(self):
+        """Test plain functions, coroutine functions and async callables."""
+
+        async def coroutine_function():
+            pass
+
+        class AsyncCallable:
+            async def __call__(self):
+                pass
+
+        assert is_blocking(lambda: None)
+        assert is_blocking(len)
+        assert not is_blocking(coroutine_function)
+        assert not is_blocking(AsyncCallable())
+
+
+class TestToolExecution:
+    """Test cases for Tool execution through execution policies."""
+
+    @pytest.mark.asyncio
+    async def test_sync_tool_runs_off_the_loop(self):
+        """Test that a blocking tool neither fails nor stalls the event loop."""
+
+        @aurora_tool()
+        def slow(seconds: float) -> int:
+            time.sleep(seconds)
+            return threading.get_ident()
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        thread_id, _ = await asyncio.gather(slow.tool.execute(seconds=0.2), ticker())
+
+        assert thread_id != threading.get_ident()
+        assert ticks == 10
+        assert slow(seconds=0) == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_inline_pool(self):
+        """Test that the inline pool calls plain functions on the loop thread."""
+
+        @aurora_tool(execution=ExecutionPolicy(pool='inline'))
+        def where() -> int:
+            return threading.get_ident()
+
+        assert await where.tool.execute() == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        """Test that at most max_concurrency calls run at once."""
+        lock = threading.Lock()
+        running = peak = 0
+
+        @aurora_tool(execution=ExecutionPolicy(max_concurrency=2))
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(work.tool.execute() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test that slow calls fail with a timeout error."""
+
+        @aurora_tool(execution=ExecutionPolicy(timeout=0.05))
+        async def hang() -> None:
+            await asyncio.sleep(1)
+
+        with pytest.raises(ToolTimeoutError, match='timed out after 0.05s'):
+            await hang.tool.execute()
+
+    @pytest.mark.asyncio
+    async def test_sync_tool_keeps_context(self):
+        """Test that blocking tools see the caller's deadline and usage scope."""
+
+        @aurora_tool()
+        def inspect_context() -> float:
+            add_tool_call()
+            return remaining_time()
+
+        usage = NodeUsage('node')
+        with deadline_scope(30), usage_scope(usage):
+            remaining = await inspect_context.tool.execute()
+
+        assert 0 < remaining <= 30
+        assert usage.tool_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self):
+        """Test that a module-level sync tool runs in a worker process."""
+        pid, doubled = await worker_pid.tool.execute(value=21)
+
+        assert doubled == 42
+        assert pid != os.getpid()
+        start_method = executors.get_executor('process')._mp_context.get_start_method()
+        assert start_method in ('forkserver', 'spawn')
+
+    @pytest.mark.asyncio
+    async def test_registered_executor(self):
+        """Test that policies can select a registered pool by name."""
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='reports')
+        register_executor('reports', pool)
+        try:
+            result = await run_callable(
+                lambda: threading.current_thread().name,
+                {},
+                ExecutionPolicy(pool='reports'),
+            )
+            assert result.startswith('reports')
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unknown_pool(self):
+        """Test that an unknown pool name is reported."""
+        with pytest.raises(ValueError, match="Unknown executor 'missing'"):
+            await run_callable(lambda: None, {}, ExecutionPolicy(pool='missing'))
+
+    def test_invalid_policy(self):
+        """Test that invalid limits are rejected."""
+        with pytest.raises(ValueError):
+            ExecutionPolicy(max_concurrency=0)
+        with pytest.raises(ValueError):
+            ExecutionPolicy(timeout=0)
+
+
+class TestFunctionNodeExecution:
+    """Test cases for FunctionNode with blocking functions."""
+
+    @pytest.mark.asyncio
+    async def test_sync_function_node_runs_off_the_loop(self):
+        """Test that sync function nodes run on the thread pool."""
+
+        def describe(inputs, variables, suffix):
+            return f'{inputs}-{suffix}-{threading.get_ident()}'
+
+        node = FunctionNode(
+            name='describe',
+            description='Describe inputs',
+            function=describe,
+            prefilled_params={'suffix': 'done'},
+        )
+
+        result = await node.run(inputs='hello')
+
+        content, thread_id = result.content.rsplit('-', 1)
+        assert content == 'hello-done'
+        assert int(thread_id) != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_function_node_timeout(self):
+        """Test that function node execution policies apply timeouts."""
+
+        async def wait(inputs, variables):
+            await asyncio.sleep(1)
+
+        node = FunctionNode(
+            name='wait',
+            description='Wait',
+            function=wait,
+            execution=ExecutionPolicy(timeout=0.05),
+        )
+
+        with pytest.raises(ExecutionTimeoutError, match='wait did not finish') as e:
+            await node.run(inputs='x')
+        assert e.value.timeout == 0.05
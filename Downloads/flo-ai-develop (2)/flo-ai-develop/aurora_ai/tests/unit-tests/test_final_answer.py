@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for final answer detection in tool-using agents.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.builder.agent_builder import AgentBuilder
+from aurora_ai.llm.base_llm import BaseLLM, normalize_finish_reason
+from aurora_ai.models.agent import MAX_INTERMEDIATE_TURNS, Agent
+from aurora_ai.models.base_agent import ReasoningPattern
+from aurora_ai.models.final_answer import FINISH_TOOL_NAME, FinalAnswerDetector
+from aurora_ai.tool import aurora_tool
+
+
+class ScriptedLLM(BaseLLM):
+    """LLM that replays scripted responses and records every call."""
+
+    def __init__(self, responses):
+        super().__init__(model='scripted')
+        self.responses = list(responses)
+        self.calls = []
+
+    async def generate(self, messages, functions=None, output_schema=None, **kwargs):
+        self.calls.append(messages)
+        return self.responses.pop(0)
+
+    async def stream(self, messages, functions=None, output_schema=None):
+        yield {'content': ''}
+
+    async def get_function_call(self, response):
+        return response.get('function_call')
+
+    def get_message_content(self, response):
+        return response.get('content', '')
+
+    def format_tool_for_llm(self, tool):
+        return {'name': tool.name}
+
+    def format_tools_for_llm(self, tools):
+        return [self.format_tool_for_llm(tool) for tool in tools]
+
+    def format_image_in_message(self, image):
+        raise NotImplementedError
+
+
+@aurora_tool(description='Look up a record')
+async def lookup(key: str) -> str:
+    return f'record {key}'
+
+
+def make_agent(llm, **kwargs):
+    return Agent(
+        name='a', system_prompt='Look things up', llm=llm, tools=[lookup.tool], **kwargs
+    )
+
+
+def tool_call(name, **arguments):
+    return {'function_call': {'name': name, 'arguments': arguments}}
+
+
+class TestFinalAnswerDetector:
+    """Test cases for the cheap decision paths."""
+
+    @pytest.mark.asyncio
+    async def test_signals_decide_without_llm_call(self):
+        """Test that markers, schemas, finish reasons and heuristics skip the LLM."""
+        llm = ScriptedLLM([])
+        detector = FinalAnswerDetector()
+        cases = [
+            ('Thought: done\nFinal Answer: 42', {}, ReasoningPattern.REACT),
+            ('{"answer": 42}', {'output_schema': {'type': 'object'}}, None),
+            ('The answer is', {'response': {'finish_reason': 'length'}}, None),
+            ('I need to check the table first.', {}, ReasoningPattern.REACT),
+            ('Action: lookup\nAction Input: {}', {}, ReasoningPattern.REACT),
+            ('The answer is 42.', {'response': {'finish_reason': 'stop'}}, None),
+            ('The answer is 42.', {}, None),
+            (
+                'Let me know if you need anything else. The total is $42k.',
+                {'response': {'finish_reason': 'stop'}},
+                None,
+            ),
+            ("Let's see: the total is $42k.", {}, ReasoningPattern.DIRECT),
+        ]
+
+        decisions = []
+        for message, kwargs, pattern in cases:
+            decisions.append(
+                await detector.decide(
+                    llm,
+                    message,
+                    reasoning_pattern=pattern or ReasoningPattern.DIRECT,
+                    **kwargs,
+                )
+            )
+
+        assert decisions == [
+            (True, 'token'),
+            (True, 'schema'),
+            (False, 'finish_reason'),
+            (False, 'heuristic'),
+            (False, 'heuristic'),
+            (True, 'finish_reason'),
+            (True, 'heuristic'),
+            (True, 'finish_reason'),
+            (True, 'heuristic'),
+        ]
+        assert llm.calls == []
+        assert detector.counts[('heuristic', False)] == 2
+
+    @pytest.mark.asyncio
+    async def test_llm_classifier_for_undecided_react(self):
+        """Test that ReACT text without a marker falls back to the classifier."""
+        llm = ScriptedLLM([{'content': 'INTERMEDIATE'}, {'content': 'FINAL'}])
+        detector = FinalAnswerDetector()
+
+        first = await detector.decide(
+            llm, 'The table has users.', reasoning_pattern=ReasoningPattern.REACT
+        )
+        second = await detector.decide(
+            llm, 'There are 12 users.', reasoning_pattern=ReasoningPattern.COT
+        )
+
+        assert first == (False, 'llm')
+        assert second == (True, 'llm')
+        assert len(llm.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_classifier_disabled(self):
+        """Test that undecided text gets the default when the classifier is off."""
+        llm = ScriptedLLM([])
+        detector = FinalAnswerDetector(llm_classifier=False, default=True)
+
+        decision = await detector.decide(
+            llm, 'There are 12 users.', reasoning_pattern=ReasoningPattern.REACT
+        )
+
+        assert decision == (True, 'default')
+        assert llm.calls == []
+
+    def test_normalize_finish_reason(self):
+        """Test that provider stop reasons map onto a common vocabulary."""
+
+        class GeminiReason:
+            name = 'MAX_TOKENS'
+
+        assert normalize_finish_reason('end_turn') == 'stop'
+        assert normalize_finish_reason('tool_use') == 'tool_call'
+        assert normalize_finish_reason(GeminiReason()) == 'length'
+        assert normalize_finish_reason('SAFETY') is None
+        assert normalize_finish_reason(None) is None
+
+
+class TestAgentFinalAnswer:
+    """Test cases for final answer handling in Agent runs."""
+
+    @pytest.mark.asyncio
+    async def test_direct_answer_costs_no_extra_call(self):
+        """Test that a direct-mode answer after a tool call ends the run."""
+        llm = ScriptedLLM(
+            [
+                tool_call('lookup', key='a'),
+                {'content': 'Record a was found.', 'finish_reason': 'stop'},
+            ]
+        )
+        agent = make_agent(llm)
+
+        result = await agent.run('find a')
+
+        assert result[-1].content == 'Record a was found.'
+        assert len(llm.calls) == 2
+        assert agent.final_answer_detector.counts == {('finish_reason', True): 1}
+
+    @pytest.mark.asyncio
+    async def test_planning_text_continues(self):
+        """Test that a plan is treated as intermediate and the loop continues."""
+        llm = ScriptedLLM(
+            [
+                {'content': 'Let me look up record a.'},
+                tool_call('lookup', key='a'),
+                {'content': 'Record a was found.'},
+            ]
+        )
+        agent = make_agent(llm)
+
+        result = await agent.run('find a')
+
+        assert result[-1].content == 'Record a was found.'
+        assert len(llm.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_answer_starting_with_let_me(self):
+        """Test that a direct-mode answer opening with "Let me" ends the run."""
+        answer = 'Let me know if you need anything else. The total revenue is $42k.'
+        llm = ScriptedLLM([{'content': answer, 'finish_reason': 'stop'}])
+        agent = make_agent(llm)
+
+        result = await agent.run('total revenue?')
+
+        assert result[-1].content == answer
+        assert len(llm.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_intermediate_turns_bounded(self):
+        """Test that text turns without tool calls cannot loop forever."""
+        llm = ScriptedLLM([{'content': 'Let me look up record a.'}] * 20)
+        agent = make_agent(llm)
+
+        await agent.run('find a')
+
+        # The capped plans, then the request for a final answer
+        assert len(llm.calls) == MAX_INTERMEDIATE_TURNS + 1
+
+    @pytest.mark.asyncio
+    async def test_finish_tool(self):
+        """Test that calling the finish tool ends the run with its answer."""
+        llm = ScriptedLLM(
+            [
+                tool_call('lookup', key='a'),
+                tool_call(FINISH_TOOL_NAME, answer='Record a was found.'),
+            ]
+        )
+        agent = (
+            AgentBuilder()
+            .with_name('a')
+            .with_llm(llm)
+            .with_tools([lookup.tool])
+            .with_finish_tool()
+            .build()
+        )
+
+        result = await agent.run('find a')
+
+        assert FINISH_TOOL_NAME in agent.tools_dict
+        assert result[-1].content == 'Record a was found.'
+        assert len(llm.calls) == 2
+        assert agent.final_answer_detector.counts == {('finish_tool', True): 1}
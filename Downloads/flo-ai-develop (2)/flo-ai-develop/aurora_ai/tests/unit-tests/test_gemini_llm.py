@@ -6,7 +6,7 @@ Pytest tests for the Gemini LLM implementation.
 import sys
 import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 # Add the aurora_ai directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -18,6 +18,13 @@ from aurora_ai.tool.base_tool import Tool
 os.environ['GOOGLE_API_KEY'] = 'test-key-123'
 
 
+@pytest.fixture(autouse=True)
+def offline_client():
+    """Avoid real genai clients, whose async transport closes itself on the test loop."""
+    with patch('aurora_ai.llm.gemini_llm.genai.Client') as client:
+        yield client
+
+
 class TestGemini:
     """Test class for Gemini LLM implementation."""
 
@@ -110,14 +117,14 @@ class TestGemini:
         mock_response.text = 'Hello, world!'
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Hello'}]
         result = await llm.generate(messages)
 
         # Verify the API call
-        llm.client.models.generate_content.assert_called_once()
-        call_args = llm.client.models.generate_content.call_args
+        llm.client.aio.models.generate_content.assert_called_once()
+        call_args = llm.client.aio.models.generate_content.call_args
 
         assert call_args[1]['model'] == 'gemini-2.5-flash'
         assert call_args[1]['contents'] == ['Hello']
@@ -140,7 +147,7 @@ class TestGemini:
         mock_response.text = "I'm a helpful assistant"
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [
             {'role': 'system', 'content': 'You are a helpful assistant'},
@@ -150,7 +157,7 @@ class TestGemini:
         await llm.generate(messages)
 
         # Verify system instruction was passed correctly
-        call_args = llm.client.models.generate_content.call_args
+        call_args = llm.client.aio.models.generate_content.call_args
         config = call_args[1]['config']
         assert config.system_instruction == 'You are a helpful assistant\n'
 
@@ -179,7 +186,7 @@ class TestGemini:
         mock_response.candidates = []
 
         llm.client = Mock()
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Generate JSON'}]
         result = await llm.generate(messages, output_schema=output_schema)
@@ -221,7 +228,7 @@ class TestGemini:
         mock_response.candidates = []
 
         llm.client = Mock()
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Use the function'}]
         result = await llm.generate(messages, functions=functions)
@@ -278,7 +285,7 @@ class TestGemini:
         mock_response.candidates = [mock_candidate]
 
         llm.client = Mock()
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Use the function'}]
         result = await llm.generate(messages, functions=functions)
@@ -299,13 +306,13 @@ class TestGemini:
         mock_response.candidates = []
 
         llm.client = Mock()
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Hello'}]
         await llm.generate(messages)
 
         # Verify kwargs were passed through
-        call_args = llm.client.models.generate_content.call_args
+        call_args = llm.client.aio.models.generate_content.call_args
         config = call_args[1]['config']
         assert config.top_p == 0.9
         assert config.max_output_tokens == 1000
@@ -426,7 +433,9 @@ class TestGemini:
 
         # Mock client to raise an exception
         llm.client = Mock()
-        llm.client.models.generate_content = Mock(side_effect=Exception('API Error'))
+        llm.client.aio.models.generate_content = AsyncMock(
+            side_effect=Exception('API Error')
+        )
 
         messages = [{'role': 'user', 'content': 'Hello'}]
 
@@ -470,7 +479,7 @@ class TestGemini:
         mock_response.candidates = []
 
         llm.client = Mock()
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         # We need to patch the types.GenerateContentConfig to test this
         with patch('aurora_ai.llm.gemini_llm.types.GenerateContentConfig') as mock_config:
@@ -498,14 +507,16 @@ class TestGemini:
         mock_chunk2 = Mock()
         mock_chunk2.text = ', world!'
 
-        # Create a regular iterator (Gemini API returns regular iterator, not async)
-        def regular_iter():
+        # The native async client resolves to an async iterator
+        async def async_iter():
             yield mock_chunk1
             yield mock_chunk2
 
         # Mock the client response
         llm.client = Mock()
-        llm.client.models.generate_content_stream = Mock(return_value=regular_iter())
+        llm.client.aio.models.generate_content_stream = AsyncMock(
+            return_value=async_iter()
+        )
 
         messages = [{'role': 'user', 'content': 'Hello'}]
 
@@ -515,8 +526,8 @@ class TestGemini:
             results.append(chunk)
 
         # Verify the API call
-        llm.client.models.generate_content_stream.assert_called_once()
-        call_args = llm.client.models.generate_content_stream.call_args
+        llm.client.aio.models.generate_content_stream.assert_called_once()
+        call_args = llm.client.aio.models.generate_content_stream.call_args
 
         assert call_args[1]['model'] == 'gemini-2.5-flash'
         assert call_args[1]['contents'] == ['Hello']
@@ -555,13 +566,15 @@ class TestGemini:
         mock_chunk = Mock()
         mock_chunk.text = 'I will use the function'
 
-        # Create a regular iterator (Gemini API returns regular iterator, not async)
-        def regular_iter():
+        # The native async client resolves to an async iterator
+        async def async_iter():
             yield mock_chunk
 
         # Mock the client response
         llm.client = Mock()
-        llm.client.models.generate_content_stream = Mock(return_value=regular_iter())
+        llm.client.aio.models.generate_content_stream = AsyncMock(
+            return_value=async_iter()
+        )
 
         messages = [{'role': 'user', 'content': 'Use the function'}]
 
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for single-pass and streaming JSON extraction.
+"""
+
+import sys
+import os
+import time
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.utils.aurora_utils import FloUtils, JsonStreamExtractor
+
+
+def feed_in_chunks(text: str, size: int):
+    extractor = JsonStreamExtractor()
+    objects = []
+    for i in range(0, len(text), size):
+        objects.extend(extractor.feed(text[i : i + size]))
+    return objects + extractor.close()
+
+
+async def as_stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestJsonStreamExtractor:
+    """Test cases for JsonStreamExtractor."""
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 7, 1000])
+    def test_chunk_boundaries(self, size):
+        """Test that results do not depend on where the text is split."""
+        text = (
+            'Reply: {"quote": "say \\"hi\\" {not a brace}", "n": 1} and '
+            '{"nested": {"deep": [1, 2]}} done'
+        )
+
+        assert feed_in_chunks(text, size) == [
+            {'quote': 'say "hi" {not a brace}', 'n': 1},
+            {'nested': {'deep': [1, 2]}},
+        ]
+
+    def test_objects_are_returned_when_they_close(self):
+        """Test that each object is returned by the chunk that completes it."""
+        extractor = JsonStreamExtractor()
+
+        assert extractor.feed('{"a": 1} {"b"') == [{'a': 1}]
+        assert extractor.feed(': 2') == []
+        assert extractor.feed('}') == [{'b': 2}]
+
+    def test_buffer_only_keeps_open_objects(self):
+        """Test that text outside of objects is not retained."""
+        extractor = JsonStreamExtractor()
+        extractor.feed('x' * 10_000 + '{"a": ')
+
+        assert extractor._buffer == '{"a": '
+
+    def test_unclosed_outer_brace(self):
+        """Test that complete objects inside an unclosed brace are found on close."""
+        extractor = JsonStreamExtractor()
+
+        assert extractor.feed('Text { invalid {"valid": true} more') == []
+        assert extractor.close() == [{'valid': True}]
+
+    def test_invalid_outer_object_falls_back_to_children(self):
+        """Test that valid objects nested in an invalid one are extracted."""
+        assert feed_in_chunks('{ "a": {"b": 1}, oops }', 4) == [{'b': 1}]
+
+    @pytest.mark.parametrize(
+        'text, expected',
+        [
+            (
+                'Use the syntax {name" in templates.\n```json\n{"answer": 42}\n```',
+                {'answer': 42},
+            ),
+            ('{ "{"x": 1}}', {'x': 1}),
+            ('{"a{"y": 2}"', {'y': 2}),
+            ('{"{"x": 1} a{"y": 2}', {'x': 1, 'y': 2}),
+            ('{"x": 1}{//"/:{"y": 2}', {'x': 1, 'y': 2}),
+            (' {:"{"x": 1}:{"y": 2}//', {'x': 1, 'y': 2}),
+        ],
+    )
+    @pytest.mark.parametrize('size', [1, 3, 1000])
+    def test_stray_brace_before_quote(self, text, expected, size):
+        """Test that a stray brace whose quotes never balance hides nothing after it."""
+        assert FloUtils.extract_jsons_from_string(text) == expected
+
+        merged = {}
+        for obj in feed_in_chunks(text, size):
+            merged.update(obj)
+        assert merged == expected
+
+    def test_comments(self):
+        """Test that JSON with comments is decoded."""
+        text = '{"a": 1, // one\n "b": "http://x" /* two */}'
+        assert feed_in_chunks(text, 5) == [{'a': 1, 'b': 'http://x'}]
+
+    def test_unbalanced_braces_scale_linearly(self):
+        """Test that many unclosed braces do not cause quadratic rescanning."""
+        text = '{' * 20_000 + '{"ok": true}'
+
+        start = time.perf_counter()
+        result = FloUtils.extract_jsons_from_string(text)
+
+        assert result == {'ok': True}
+        assert time.perf_counter() - start < 1.0
+
+    @pytest.mark.parametrize(
+        'text',
+        [
+            '{a ' * 20_000 + '}' * 20_000,
+            '{"a": ' * 2_000 + 'x' + '}' * 2_000,
+        ],
+    )
+    def test_nested_invalid_objects_scale_linearly(self, text):
+        """Test that invalid nested objects are not decoded once per level."""
+        start = time.perf_counter()
+        result = feed_in_chunks(text, 1000)
+
+        assert result == []
+        assert time.perf_counter() - start < 1.0
+
+
+class TestExtractJsonsFromStream:
+    """Test cases for FloUtils.extract_jsons_from_stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_objects_from_llm_chunks(self):
+        """Test that text and LLM stream chunks are both accepted."""
+        chunks = ['{"a"', {'content': ': 1}'}, {'content': None}, ' {"b": 2}']
+
+        objects = [
+            obj async for obj in FloUtils.extract_jsons_from_stream(as_stream(chunks))
+        ]
+
+        assert objects == [{'a': 1}, {'b': 2}]
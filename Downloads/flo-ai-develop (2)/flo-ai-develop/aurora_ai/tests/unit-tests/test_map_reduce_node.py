@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for document chunking and the MapReduceNode.
+"""
+
+import sys
+import os
+import asyncio
+import re
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pymupdf
+
+from aurora_ai.arium import aurora, MessageMemory
+from aurora_ai.arium.nodes import FunctionNode, MapReduceNode
+from aurora_ai.models.agent import Agent
+from aurora_ai.models.chat_message import (
+    DocumentMessageContent,
+    TextMessageContent,
+    UserMessage,
+)
+from aurora_ai.models.document import DocumentType
+from aurora_ai.utils.document_chunker import (
+    chunk_by_headings,
+    chunk_by_tokens,
+    estimate_tokens,
+    pack_chunks,
+)
+
+
+def make_pdf(page_count: int) -> bytes:
+    """Build an in-memory PDF with one line of text per page."""
+    doc = pymupdf.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 72), f'This is page number {i + 1}')
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def message_text(inputs) -> str:
+    return inputs[-1].content.text
+
+
+class TestDocumentChunker:
+    """Test cases for the chunking helpers."""
+
+    def test_chunk_by_tokens_respects_limit_and_lines(self):
+        """Test that token chunks stay under the limit and keep lines intact."""
+        text = ''.join(f'line {i:03d}\n' for i in range(100))
+        chunks = chunk_by_tokens(text, max_tokens=10)
+
+        assert ''.join(chunks) == text
+        assert all(estimate_tokens(chunk) <= 10 for chunk in chunks)
+        assert all(chunk.endswith('\n') for chunk in chunks)
+
+    def test_chunk_by_headings_splits_sections(self):
+        """Test that sections start at headings and small ones are packed."""
+        text = '# A\nalpha\n## B\nbeta\n# C\n' + 'gamma ' * 50
+        chunks = chunk_by_headings(text, max_tokens=8)
+
+        assert chunks[0] == '# A\nalpha\n## B\nbeta\n'
+        assert chunks[1].startswith('# C\n')
+        assert ''.join(chunks).replace(' ', '') == text.replace(' ', '')
+
+    def test_pack_chunks(self):
+        """Test that pieces are merged up to the token limit."""
+        assert pack_chunks(['aaaa', 'bbbb', 'cccc'], max_tokens=2) == [
+            'aaaabbbb',
+            'cccc',
+        ]
+
+
+class TestMapReduceNode:
+    """Test cases for MapReduceNode."""
+
+    def test_invalid_options(self):
+        """Test that invalid chunking options are rejected."""
+        map_node = FunctionNode(name='map', description='', function=lambda **_: '')
+        with pytest.raises(ValueError):
+            MapReduceNode(name='mr', map_node=map_node, chunk_by='sentences')
+        with pytest.raises(ValueError):
+            MapReduceNode(name='mr', map_node=map_node, reduce_fan_in=1)
+
+    @pytest.mark.asyncio
+    async def test_maps_pages_concurrently_and_reduces_hierarchically(self):
+        """Test page chunking, bounded concurrency and multi-level reduce."""
+        in_flight = 0
+        peak = 0
+
+        async def summarize(inputs, variables=None, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            page = re.search(r'page number (\d+)', message_text(inputs)).group(1)
+            return f'[{page}]'
+
+        reduce_calls = []
+
+        async def combine(inputs, variables=None, **kwargs):
+            text = message_text(inputs)
+            reduce_calls.append(text)
+            return text.replace('\n\n', '')
+
+        node = MapReduceNode(
+            name='mr',
+            map_node=FunctionNode(name='map', description='', function=summarize),
+            reduce_node=FunctionNode(name='reduce', description='', function=combine),
+            chunk_by='pages',
+            # Large enough for exactly one page per chunk
+            max_chunk_tokens=10,
+            max_concurrency=2,
+            reduce_fan_in=2,
+        )
+        document = DocumentMessageContent(
+            bytes=make_pdf(5), mime_type=DocumentType.PDF.value
+        )
+
+        result = await node.run([UserMessage(content=document)])
+
+        assert result.content == '[1][2][3][4][5]'
+        assert peak == 2
+        # 5 -> 3 -> 2 -> 1 partial results
+        assert len(reduce_calls) == 3 + 2 + 1
+
+    @pytest.mark.asyncio
+    async def test_agents_run_with_isolated_history(self):
+        """Test that concurrent map calls on one agent do not share history."""
+        llm = MagicMock()
+        llm.generate = AsyncMock(return_value={})
+        llm.get_message_content = MagicMock(return_value='summary')
+        agent = Agent(name='mapper', system_prompt='Summarize <topic>', llm=llm)
+
+        node = MapReduceNode(
+            name='mr', map_node=agent, chunk_by='tokens', max_chunk_tokens=5
+        )
+        text = 'one two three four five six seven <not_a_var> eight nine ten'
+
+        result = await node.run(
+            [UserMessage(TextMessageContent(text=text))], variables={'topic': 'x'}
+        )
+
+        assert result.content == '\n\n'.join(['summary'] * llm.generate.call_count)
+        for call in llm.generate.call_args_list:
+            messages = call.args[0]
+            assert [m['role'] for m in messages] == ['user', 'system']
+            assert messages[1]['content'] == 'Summarize x'
+        assert agent.conversation_history == []
+
+    @pytest.mark.asyncio
+    async def test_runs_as_workflow_node(self):
+        """Test that aurora executes a MapReduceNode and stores its result."""
+
+        def summarize(inputs, variables=None, **kwargs):
+            return message_text(inputs).upper()
+
+        node = MapReduceNode(
+            name='mr',
+            map_node=FunctionNode(name='map', description='', function=summarize),
+            chunk_by='headings',
+        )
+        workflow = aurora(MessageMemory())
+        workflow.add_nodes([node])
+        workflow.start_at(node)
+        workflow.add_end_to(node)
+        workflow.compile()
+
+        result = await workflow.run(
+            [UserMessage(TextMessageContent(text='# Intro\nhello'))], variables={}
+        )
+
+        assert result[-1].node == 'mr'
+        assert result[-1].result.content == '# INTRO\nHELLO'
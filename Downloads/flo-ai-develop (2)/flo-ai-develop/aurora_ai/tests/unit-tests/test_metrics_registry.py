@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for lazily bound telemetry metrics.
+"""
+
+import sys
+import os
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.telemetry import instrumentation
+from aurora_ai.telemetry.instrumentation import (
+    AttributeSets,
+    LLMMetrics,
+    WorkflowMetrics,
+)
+
+
+class FakeInstrument:
+    def __init__(self, name):
+        self.name = name
+        self.points = []
+
+    def add(self, amount, attributes=None):
+        self.points.append((amount, attributes))
+
+    record = add
+
+
+class FakeMeter:
+    """Meter keeping the instruments it creates."""
+
+    def __init__(self):
+        self.instruments = {}
+
+    def create_counter(self, name, description='', unit=''):
+        return self.instruments.setdefault(name, FakeInstrument(name))
+
+    create_histogram = create_counter
+
+
+def use_meter(monkeypatch, meter):
+    monkeypatch.setattr(instrumentation, 'get_meter', lambda: meter)
+
+
+class TestLateBinding:
+    """Test cases for metrics configured after import."""
+
+    def test_records_after_late_configuration(self, monkeypatch):
+        """Test that metrics created before configuration still record."""
+        metrics = WorkflowMetrics()
+        use_meter(monkeypatch, None)
+        metrics.record_node_latency(5.0, 'wf', 'fetch', 'function')
+        assert metrics.node_latency is None
+
+        meter = FakeMeter()
+        use_meter(monkeypatch, meter)
+        metrics.record_node_latency(7.0, 'wf', 'fetch', 'function')
+
+        points = meter.instruments['workflow.node.duration'].points
+        assert points == [
+            (
+                7.0,
+                {'workflow_name': 'wf', 'node_name': 'fetch', 'node_type': 'function'},
+            )
+        ]
+
+    def test_instruments_created_once_per_meter(self, monkeypatch):
+        """Test that instruments are reused, and recreated for a new meter."""
+        metrics = LLMMetrics()
+        first = FakeMeter()
+        use_meter(monkeypatch, first)
+        metrics.record_request('gpt', 'openai')
+        counter = metrics.request_counter
+        metrics.record_request('gpt', 'openai')
+
+        assert metrics.request_counter is counter
+        assert len(counter.points) == 2
+
+        second = FakeMeter()
+        use_meter(monkeypatch, second)
+        metrics.record_tokens(total_tokens=3, prompt_tokens=2, completion_tokens=1)
+
+        assert metrics.request_counter is not counter
+        assert second.instruments['llm.tokens.total'].points[0][0] == 3
+
+
+class TestAttributeSets:
+    """Test cases for pre-bound attribute sets."""
+
+    def test_same_values_share_dict(self, monkeypatch):
+        """Test that hot paths do not build a new attribute dict per call."""
+        metrics = LLMMetrics()
+        use_meter(monkeypatch, FakeMeter())
+
+        metrics.record_latency(1.0, 'gpt', 'openai')
+        metrics.record_latency(2.0, 'gpt', 'openai')
+        metrics.record_latency(3.0, 'claude', 'anthropic')
+
+        (_, a), (_, b), (_, c) = metrics.latency_histogram.points
+        assert a is b
+        assert c == {'model': 'claude', 'provider': 'anthropic'}
+
+    def test_bounded(self):
+        """Test that only a bounded number of value combinations are kept."""
+        attributes = AttributeSets('node_name', max_sets=2)
+
+        for name in ['a', 'b', 'c']:
+            attributes.get(name)
+
+        assert attributes.get('c') == {'node_name': 'c'}
+        assert attributes.get('c') is not attributes.get('c')
+        assert attributes.get('a') is attributes.get('a')
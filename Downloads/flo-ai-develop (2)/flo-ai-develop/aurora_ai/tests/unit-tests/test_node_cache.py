@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for node result caching in aurora workflows.
+"""
+
+import sys
+import os
+import pickle
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.arium import (
+    InMemoryNodeCache,
+    NodeCachePolicy,
+    NodeResultCache,
+    SQLiteNodeCache,
+    auroraEventType,
+)
+from aurora_ai.arium import node_cache as node_cache_module
+from aurora_ai.arium.arium import aurora
+from aurora_ai.arium.memory import MessageMemory
+from aurora_ai.arium.nodes import FunctionNode, auroraNode
+
+
+def build_workflow(calls, node_cache, prefilled_params=None):
+    async def fetch(inputs, variables, **params):
+        calls.append(inputs[-1].content)
+        return f'rows for {inputs[-1].content} {params}'
+
+    async def report(inputs, variables):
+        return f'report of {inputs[-1].content}'
+
+    fetch_node = FunctionNode(
+        name='fetch',
+        description='Fetch rows',
+        function=fetch,
+        prefilled_params=prefilled_params,
+    )
+    report_node = FunctionNode(name='report', description='Report', function=report)
+
+    workflow = aurora(MessageMemory(), node_cache=node_cache)
+    workflow.add_nodes([fetch_node, report_node])
+    workflow.start_at(fetch_node)
+    workflow.add_edge('fetch', ['report'])
+    workflow.add_end_to(report_node)
+    workflow.compile()
+    return workflow
+
+
+class TestWorkflowNodeCache:
+    """Test cases for skipping cached nodes in workflow runs."""
+
+    @pytest.mark.asyncio
+    async def test_rerun_uses_cached_result(self):
+        """Test that an unchanged node is skipped on a re-run."""
+        calls = []
+        cache = NodeResultCache().enable('fetch')
+        workflow = build_workflow(calls, cache)
+        events = []
+
+        first = await workflow.run('sales')
+        second = await workflow.run('sales', event_callback=events.append)
+
+        assert calls == ['sales']
+        assert [m.result.content for m in first] == [m.result.content for m in second]
+        completed = {
+            e.node_name: e.metadata
+            for e in events
+            if e.event_type == auroraEventType.NODE_COMPLETED
+        }
+        assert completed['fetch'] == {'reused_from': 'cache'}
+        assert completed['report'] is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_key_covers_inputs_and_config(self):
+        """Test that different inputs or node configuration miss the cache."""
+        calls = []
+        cache = NodeResultCache().enable('fetch')
+
+        await build_workflow(calls, cache).run('sales')
+        await build_workflow(calls, cache).run('refunds')
+        await build_workflow(calls, cache, {'limit': 10}).run('sales')
+        await build_workflow(calls, cache, {'limit': 10}).run('sales')
+
+        assert calls == ['sales', 'refunds', 'sales']
+
+    @pytest.mark.asyncio
+    async def test_uncached_nodes_always_run(self):
+        """Test that only nodes with a policy are memoized."""
+        calls = []
+        workflow = build_workflow(calls, NodeResultCache().enable('report'))
+
+        await workflow.run('sales')
+        await workflow.run('sales')
+
+        assert calls == ['sales', 'sales']
+
+    @pytest.mark.asyncio
+    async def test_stores_only_memory_value(self):
+        """Test that a list result is cached as the item that goes into memory."""
+        calls = []
+        cache = NodeResultCache().enable('nested')
+        nested = auroraNode(name='nested', aurora=build_workflow(calls, None))
+        workflow = aurora(MessageMemory(), node_cache=cache)
+        workflow.add_nodes([nested])
+        workflow.start_at(nested)
+        workflow.add_end_to(nested)
+        workflow.compile()
+
+        first = await workflow.run('sales')
+        second = await workflow.run('sales')
+
+        assert calls == ['sales']
+        (value,) = [value for _, value in cache.backend._entries.values()]
+        assert [m.content for m in pickle.loads(value)] == [
+            'report of rows for sales {}'
+        ]
+        assert [m.result.content for m in first] == [m.result.content for m in second]
+
+
+class TestNodeCacheBackends:
+    """Test cases for node cache storage backends."""
+
+    def test_in_memory_ttl_and_lru(self, monkeypatch):
+        """Test that entries expire after their TTL and the oldest are evicted."""
+        now = [100.0]
+        monkeypatch.setattr(node_cache_module.time, 'monotonic', lambda: now[0])
+        backend = InMemoryNodeCache(max_entries=2)
+
+        backend.set('a', b'1', ttl=10)
+        backend.set('b', b'2')
+        assert backend.get('a') == b'1'
+        backend.set('c', b'3')
+        assert backend.get('b') is None
+
+        now[0] += 10
+        assert backend.get('a') is None
+        assert backend.get('c') == b'3'
+
+    def test_sqlite_persists(self, tmp_path):
+        """Test that SQLite-backed results survive reopening the cache."""
+        path = str(tmp_path / 'nodes.db')
+        policy = NodeCachePolicy()
+        cache = NodeResultCache(SQLiteNodeCache(path))
+        cache.set('key', {'rows': [1, 2]}, policy)
+        cache.backend.close()
+
+        reopened = NodeResultCache(SQLiteNodeCache(path))
+        assert reopened.get('key') == (True, {'rows': [1, 2]})
+        assert reopened.get('other') == (False, None)
+
+    def test_sqlite_ttl(self, tmp_path, monkeypatch):
+        """Test that expired SQLite entries are not returned."""
+        now = [1000.0]
+        monkeypatch.setattr(node_cache_module.time, 'time', lambda: now[0])
+        backend = SQLiteNodeCache(str(tmp_path / 'nodes.db'))
+
+        backend.set('key', b'value', ttl=5)
+        assert backend.get('key') == b'value'
+        now[0] += 5
+        assert backend.get('key') is None
+
+    def test_unpicklable_result_not_cached(self):
+        """Test that results which cannot be stored are skipped."""
+        cache = NodeResultCache()
+        cache.set('key', lambda: None, NodeCachePolicy())
+
+        assert len(cache.backend) == 0
+
+    def test_invalid_ttl(self):
+        """Test that non-positive TTLs are rejected."""
+        with pytest.raises(ValueError):
+            NodeCachePolicy(ttl=0)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for caching of generated parser models and JSON schemas.
+"""
+
+import sys
+import os
+import copy
+import pytest
+from unittest.mock import MagicMock, patch
+from pydantic import BaseModel
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.builder.agent_builder import AgentBuilder
+from aurora_ai.formatter import yaml_format_parser
+from aurora_ai.formatter.yaml_format_parser import (
+    FloJsonParser,
+    FloYamlParser,
+    clear_contract_cache,
+    get_json_schema,
+)
+from aurora_ai.llm import BaseLLM
+
+CONTRACT = {
+    'name': 'Ticket',
+    'fields': [
+        {'name': 'title', 'type': 'str', 'description': 'Title'},
+        {
+            'name': 'priority',
+            'type': 'literal',
+            'description': 'Priority',
+            'values': [{'value': 'p1', 'description': 'Urgent'}],
+        },
+        {
+            'name': 'owner',
+            'type': 'object',
+            'description': 'Owner',
+            'fields': [{'name': 'name', 'type': 'str', 'description': 'Name'}],
+        },
+    ],
+}
+
+AGENT_YAML = """
+agent:
+  name: triage
+  job: Triage the ticket
+  parser:
+    name: Ticket
+    fields:
+      - name: title
+        type: str
+        description: Title
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_contract_cache()
+    yield
+    clear_contract_cache()
+
+
+class TestContractCache:
+    """Test cases for the contract model cache."""
+
+    def test_identical_contracts_share_model(self):
+        """Test that separately built parsers reuse one generated model."""
+        first = FloJsonParser.create(json_dict=copy.deepcopy(CONTRACT))
+        second = FloYamlParser.create(yaml_dict=copy.deepcopy(CONTRACT))
+
+        assert first.get_format() is second.get_format()
+        assert first.get_json_schema() is second.get_json_schema()
+        assert first.get_json_schema()['title'] == 'Ticket'
+
+    def test_different_contracts_do_not_collide(self):
+        """Test that a changed field definition produces a new model."""
+        changed = copy.deepcopy(CONTRACT)
+        changed['fields'][0]['type'] = 'int'
+
+        model = FloJsonParser.create(json_dict=copy.deepcopy(CONTRACT)).get_format()
+        other = FloJsonParser.create(json_dict=changed).get_format()
+
+        assert model is not other
+        assert other.model_fields['title'].annotation is int
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that least recently used contracts are evicted."""
+        monkeypatch.setattr(yaml_format_parser, '_MAX_CACHED_CONTRACTS', 2)
+
+        def model_for(name):
+            contract = {**CONTRACT, 'name': name}
+            return FloJsonParser.create(json_dict=contract).get_format()
+
+        a = model_for('A')
+        model_for('B')
+        assert model_for('A') is a
+        model_for('C')
+
+        assert model_for('A') is a
+        assert len(yaml_format_parser._contract_models) == 2
+
+    def test_get_json_schema_for_user_models(self):
+        """Test that JSON schemas of any pydantic model are generated once."""
+
+        class Answer(BaseModel):
+            text: str
+
+        with patch.object(
+            Answer, 'model_json_schema', wraps=Answer.model_json_schema
+        ) as generate:
+            assert get_json_schema(Answer) is get_json_schema(Answer)
+
+        generate.assert_called_once()
+
+
+class TestAgentBuilderReuse:
+    """Test cases for parser reuse when loading agents."""
+
+    def test_from_yaml_reuses_schema(self):
+        """Test that agents loaded from the same YAML share the output schema."""
+        llm = MagicMock(spec=BaseLLM)
+
+        first = AgentBuilder.from_yaml(AGENT_YAML, base_llm=llm).build()
+        second = AgentBuilder.from_yaml(AGENT_YAML, base_llm=llm).build()
+
+        assert first.output_schema is second.output_schema
+        assert first.output_schema['properties']['title']['type'] == 'string'
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for incremental workflow re-runs from recorded node I/O.
+"""
+
+import sys
+import os
+import asyncio
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.arium import RunRecord, auroraEventType
+from aurora_ai.arium.arium import aurora
+from aurora_ai.arium.memory import MessageMemory
+from aurora_ai.arium.nodes import FunctionNode
+
+
+def build_report_workflow(calls, fail_review=False, delay=0.0):
+    """template -> draft -> review, where review only reads the template."""
+
+    async def template(inputs, variables):
+        await asyncio.sleep(delay)
+        calls.append('template')
+        return 'Quarterly report'
+
+    async def draft(inputs, variables):
+        calls.append('draft')
+        return ' | '.join(str(m.content) for m in inputs)
+
+    async def review(inputs, variables):
+        calls.append('review')
+        if fail_review:
+            raise RuntimeError('review service down')
+        return f'style ok for {inputs[-1].content}'
+
+    nodes = [
+        FunctionNode(
+            name='template',
+            description='Template',
+            function=template,
+            input_filter=['settings'],
+        ),
+        FunctionNode(name='draft', description='Draft', function=draft),
+        FunctionNode(
+            name='review',
+            description='Review',
+            function=review,
+            input_filter=['template'],
+        ),
+    ]
+    workflow = aurora(MessageMemory())
+    workflow.add_nodes(nodes)
+    workflow.start_at(nodes[0])
+    workflow.add_edge('template', ['draft'])
+    workflow.add_edge('draft', ['review'])
+    workflow.add_end_to(nodes[2])
+    workflow.compile()
+    return workflow
+
+
+class TestIncrementalRun:
+    """Test cases for re-running only the nodes whose inputs changed."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_nodes_rerun(self):
+        """Test that nodes with unchanged filtered inputs reuse their output."""
+        calls = []
+        workflow = build_report_workflow(calls)
+
+        await workflow.run('Revenue grew 5%', record_run=True)
+        first = workflow.last_run
+        assert calls == ['template', 'draft', 'review']
+
+        calls.clear()
+        events = []
+        result = await workflow.run(
+            'Revenue grew 7%', previous_run=first, event_callback=events.append
+        )
+
+        assert calls == ['draft']
+        assert workflow.last_run.executed == ['draft']
+        assert workflow.last_run.reused == ['template', 'review']
+        assert result[-2].result.content == 'Revenue grew 7% | Quarterly report'
+        reused = {
+            e.node_name: e.metadata
+            for e in events
+            if e.event_type == auroraEventType.NODE_COMPLETED
+        }
+        assert reused['template'] == {'reused_from': 'previous_run'}
+        assert reused['draft'] is None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_run_reuses_everything(self):
+        """Test that records chain, so a repeated run executes nothing."""
+        calls = []
+        workflow = build_report_workflow(calls)
+
+        await workflow.run('Revenue grew 5%', record_run=True)
+        await workflow.run('Revenue grew 7%', previous_run=workflow.last_run)
+        calls.clear()
+        await workflow.run('Revenue grew 7%', previous_run=workflow.last_run)
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_variables_change_reruns(self):
+        """Test that different run variables invalidate recorded outputs."""
+        calls = []
+        workflow = build_report_workflow(calls)
+
+        await workflow.run('Report', variables={'quarter': 'Q1'}, record_run=True)
+        calls.clear()
+        await workflow.run(
+            'Report', variables={'quarter': 'Q2'}, previous_run=workflow.last_run
+        )
+
+        assert calls == ['template', 'draft', 'review']
+
+    @pytest.mark.asyncio
+    async def test_rerun_after_failure(self):
+        """Test that a failed run's record lets the retry skip completed nodes."""
+        calls = []
+        workflow = build_report_workflow(calls, fail_review=True)
+        with pytest.raises(RuntimeError):
+            await workflow.run('Revenue grew 5%', record_run=True)
+        partial = workflow.last_run
+
+        calls.clear()
+        retry = build_report_workflow(calls)
+        await retry.run('Revenue grew 5%', previous_run=partial)
+
+        assert calls == ['review']
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, tmp_path):
+        """Test that a record can be kept on disk between processes."""
+        calls = []
+        workflow = build_report_workflow(calls)
+        await workflow.run('Revenue grew 5%', record_run=True)
+        path = str(tmp_path / 'run.pkl')
+        workflow.last_run.save(path)
+
+        calls.clear()
+        await workflow.run('Revenue grew 5%', previous_run=RunRecord.load(path))
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_not_recorded_by_default(self):
+        """Test that plain runs do not record node I/O."""
+        workflow = build_report_workflow([])
+
+        await workflow.run('Revenue grew 5%')
+
+        assert workflow.last_run is None
+
+    @pytest.mark.asyncio
+    async def test_overlapping_run_keeps_its_record(self):
+        """Test that a run overlapping a recorded run does not write into its record."""
+        calls = []
+        workflow = build_report_workflow(calls, delay=0.02)
+        await workflow.run('Revenue grew 5%', record_run=True)
+        first = workflow.last_run
+
+        calls.clear()
+        other = asyncio.create_task(workflow.run('Revenue grew 9%'))
+        await asyncio.sleep(0.01)
+        await workflow.run('Revenue grew 5%', previous_run=first)
+        record = workflow.last_run
+        await other
+
+        assert workflow.last_run is record
+        assert record.reused == ['template', 'review']
+        assert record.executed == ['draft']
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for per-node usage accounting and workflow run reports.
+"""
+
+import sys
+import os
+import asyncio
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.arium import NodeResultCache, RunReport, auroraEventType
+from aurora_ai.arium.arium import aurora
+from aurora_ai.arium.memory import MessageMemory
+from aurora_ai.arium.nodes import FunctionNode
+from aurora_ai.builder.agent_builder import AgentBuilder
+from aurora_ai.llm.base_llm import BaseLLM
+from aurora_ai.telemetry.instrumentation import llm_metrics, trace_llm_call
+from aurora_ai.tool import aurora_tool
+from aurora_ai.utils.executors import ExecutionPolicy, run_callable
+from aurora_ai.utils.usage import NodeUsage, add_tokens, usage_scope
+
+
+class MeteredLLM(BaseLLM):
+    """LLM replaying canned responses and reporting token usage like providers do."""
+
+    def __init__(self, responses):
+        super().__init__(model='metered')
+        self.responses = list(responses)
+
+    @trace_llm_call(provider='test')
+    async def generate(self, messages, functions=None, output_schema=None, **kwargs):
+        await asyncio.sleep(0.01)
+        llm_metrics.record_tokens(
+            total_tokens=15, prompt_tokens=10, completion_tokens=5, model=self.model
+        )
+        return self.responses.pop(0)
+
+    async def stream(self, messages, functions=None, output_schema=None):
+        yield {'content': ''}
+
+    async def get_function_call(self, response):
+        return response.get('function_call')
+
+    def get_message_content(self, response):
+        return response.get('content', '')
+
+    def format_tool_for_llm(self, tool):
+        return {'name': tool.name}
+
+    def format_tools_for_llm(self, tools):
+        return [self.format_tool_for_llm(tool) for tool in tools]
+
+    def format_image_in_message(self, image):
+        raise NotImplementedError
+
+
+ANSWER_WITH_LOOKUP = [
+    {'function_call': {'name': 'lookup', 'arguments': {'customer': 'acme'}}},
+    {'content': 'Final Answer: acme is gold tier'},
+]
+
+
+def build_workflow(fail_summary=False, node_cache=None):
+    @aurora_tool(description='Look up a customer')
+    async def lookup(customer: str) -> str:
+        return f'{customer}: gold tier'
+
+    llm = MeteredLLM(ANSWER_WITH_LOOKUP)
+    agent = (
+        AgentBuilder()
+        .with_name('support')
+        .with_llm(llm)
+        .with_tools([lookup.tool])
+        .build()
+    )
+
+    async def summary(inputs, variables):
+        if fail_summary:
+            raise RuntimeError('summary failed')
+        return 'summary'
+
+    summary_node = FunctionNode(name='summary', description='Sum', function=summary)
+    workflow = aurora(MessageMemory(), node_cache=node_cache)
+    workflow.add_nodes([agent, summary_node])
+    workflow.start_at(agent)
+    workflow.add_edge('support', ['summary'])
+    workflow.add_end_to(summary_node)
+    workflow.compile()
+    return workflow
+
+
+class TestRunReport:
+    """Test cases for run reports returned by workflow runs."""
+
+    @pytest.mark.asyncio
+    async def test_report_per_node(self):
+        """Test that tokens, LLM and tool calls are attributed to the right node."""
+        workflow = build_workflow()
+
+        result, report = await workflow.run('Tier of acme?', return_report=True)
+
+        assert result[-1].result.content == 'summary'
+        assert report is workflow.last_report
+        support, summary = report.nodes
+        assert (support.node_name, support.node_type) == ('support', 'agent')
+        assert support.llm_calls == 2
+        assert support.tool_calls == 1
+        assert (support.prompt_tokens, support.completion_tokens) == (20, 10)
+        assert support.total_tokens == 30
+        assert 0 < support.time_to_first_token <= support.execution_time
+        assert summary.llm_calls == 0
+        assert summary.time_to_first_token is None
+        assert report.total().total_tokens == 30
+
+    @pytest.mark.asyncio
+    async def test_usage_on_node_completed(self):
+        """Test that node completed events carry the node's usage."""
+        workflow = build_workflow()
+        events = []
+
+        await workflow.run(
+            'Tier of acme?',
+            event_callback=events.append,
+            events_filter=[auroraEventType.NODE_COMPLETED],
+        )
+
+        usage = {e.node_name: e.usage for e in events}
+        assert usage['support'].total_tokens == 30
+        assert usage['summary'] is workflow.last_report.nodes[1]
+        assert usage['__start__'] is None
+
+    @pytest.mark.asyncio
+    async def test_failed_node_reported(self):
+        """Test that a failing node is in the report of the failed run."""
+        workflow = build_workflow(fail_summary=True)
+
+        with pytest.raises(RuntimeError):
+            await workflow.run('Tier of acme?')
+
+        assert [u.status for u in workflow.last_report.nodes] == [
+            'success',
+            'error',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_counted(self):
+        """Test that reused node results count as cache hits."""
+        workflow = build_workflow(node_cache=NodeResultCache().enable('summary'))
+        await workflow.run('Tier of acme?')
+        workflow.nodes['support'].llm.responses = list(ANSWER_WITH_LOOKUP)
+
+        await workflow.run('Tier of acme?')
+
+        summary = workflow.last_report.nodes[-1]
+        assert (summary.cache_hits, summary.reused_from) == (1, 'cache')
+
+    @pytest.mark.asyncio
+    async def test_overlapping_runs_keep_their_reports(self):
+        """Test that overlapping runs of one workflow each get their own report."""
+
+        async def step(inputs, variables):
+            await asyncio.sleep(0.02)
+            return 'ok'
+
+        node = FunctionNode(name='step', description='Step', function=step)
+        workflow = aurora(MessageMemory())
+        workflow.add_nodes([node])
+        workflow.start_at(node)
+        workflow.add_end_to(node)
+        workflow.compile()
+
+        (_, first), (_, second) = await asyncio.gather(
+            workflow.run('a', return_report=True),
+            workflow.run('b', return_report=True),
+        )
+
+        assert first is not second
+        assert [len(first.nodes), len(second.nodes)] == [1, 1]
+        assert workflow.last_report in (first, second)
+
+
+class TestUsageScope:
+    """Test cases for usage accounting outside of workflows."""
+
+    def test_nested_scopes_roll_up(self):
+        """Test that usage of a nested node is added to the enclosing node."""
+        outer, inner = NodeUsage('outer'), NodeUsage('inner')
+
+        with usage_scope(outer):
+            add_tokens(prompt_tokens=3)
+            with usage_scope(inner):
+                add_tokens(prompt_tokens=4, completion_tokens=1)
+
+        assert inner.total_tokens == 5
+        assert outer.total_tokens == 8
+
+    def test_no_scope_is_ignored(self):
+        """Test that recording outside a node does nothing."""
+        add_tokens(prompt_tokens=3)
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_recorded(self):
+        """Test that waiting for a concurrency slot counts as queue wait."""
+        policy = ExecutionPolicy(max_concurrency=1)
+
+        async def work():
+            await asyncio.sleep(0.02)
+
+        usage = NodeUsage('batch')
+        with usage_scope(usage):
+            await asyncio.gather(*(run_callable(work, {}, policy) for _ in range(2)))
+
+        assert usage.queue_wait_time >= 0.015
+
+    def test_report_to_dict(self):
+        """Test that reports serialise with totals."""
+        report = RunReport()
+        report.add(NodeUsage('a', prompt_tokens=2, execution_time=1.0))
+        report.add(NodeUsage('a', completion_tokens=1, execution_time=0.5))
+
+        data = report.to_dict()
+
+        assert len(data['nodes']) == 2
+        assert data['total']['total_tokens'] == 3
+        assert report.by_node()['a'].execution_time == 1.5
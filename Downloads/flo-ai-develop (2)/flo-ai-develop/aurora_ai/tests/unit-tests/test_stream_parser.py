@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for incremental structured-output parsing.
+"""
+
+import sys
+import os
+import json
+import pytest
+from pydantic import ValidationError
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.formatter.yaml_format_parser import FloJsonParser, FloYamlParser
+
+CONTRACT = {
+    'name': 'Report',
+    'fields': [
+        {'name': 'title', 'type': 'str', 'description': 'Title'},
+        {
+            'name': 'severity',
+            'type': 'literal',
+            'description': 'Severity',
+            'values': [
+                {'value': 'low', 'description': 'Low'},
+                {'value': 'high', 'description': 'High'},
+            ],
+        },
+        {
+            'name': 'owner',
+            'type': 'object',
+            'description': 'Owner',
+            'fields': [
+                {'name': 'name', 'type': 'str', 'description': 'Name'},
+                {'name': 'team', 'type': 'str', 'description': 'Team'},
+            ],
+        },
+        {
+            'name': 'scores',
+            'type': 'array',
+            'description': 'Scores',
+            'items': {'name': 'score', 'type': 'int', 'description': 'Score'},
+        },
+        {'name': 'summary', 'type': 'str', 'description': 'Summary'},
+    ],
+}
+
+RESPONSE = {
+    'title': 'Q3 {draft}, "v2"',
+    'severity': 'high',
+    'owner': {'name': 'Ops', 'team': 'infra [eu]'},
+    'scores': [1, 2, 3],
+    'summary': 'All good \\ mostly',
+}
+
+
+def make_parser():
+    return FloJsonParser.create(json_dict=CONTRACT).stream_parser()
+
+
+async def as_stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestFloStreamParser:
+    """Test cases for FloStreamParser."""
+
+    @pytest.mark.parametrize('size', [1, 3, 16, 10_000])
+    def test_fields_complete_in_order(self, size):
+        """Test that every field is emitted once, whatever the chunking."""
+        text = '```json\n' + json.dumps(RESPONSE, indent=2) + '\n```'
+        parser = make_parser()
+
+        fields = []
+        for i in range(0, len(text), size):
+            fields.extend(parser.feed(text[i : i + size]))
+
+        assert [name for name, _ in fields] == list(RESPONSE)
+        assert dict(fields)['owner'].team == 'infra [eu]'
+        assert dict(fields)['title'] == RESPONSE['title']
+        assert parser.done
+        assert parser.close().summary == RESPONSE['summary']
+
+    def test_field_is_emitted_before_response_ends(self):
+        """Test that an early field is available while later ones stream."""
+        parser = make_parser()
+
+        assert parser.feed('{"title": "Inci') == []
+        assert parser.feed('dent", "summary": "Long') == [('title', 'Incident')]
+        assert parser.fields == {'title': 'Incident'}
+        assert parser.feed(' text"}') == [('summary', 'Long text')]
+
+    def test_invalid_field_is_not_emitted(self):
+        """Test that fields failing validation are held back for close()."""
+        parser = make_parser()
+
+        fields = parser.feed('{"severity": "medium", "title": "x"}')
+
+        assert fields == [('title', 'x')]
+        with pytest.raises(ValidationError):
+            parser.close()
+
+    def test_ignores_text_after_object(self):
+        """Test that trailing text after the object is not parsed."""
+        parser = make_parser()
+        parser.feed('{"title": "x"} {"summary": "y"}')
+
+        assert parser.fields == {'title': 'x'}
+
+    @pytest.mark.asyncio
+    async def test_parse_stream_accepts_llm_chunks(self):
+        """Test parsing an LLM stream of content dicts."""
+        parser = FloYamlParser.create(yaml_dict=CONTRACT).stream_parser()
+        chunks = [{'content': '{"scores": [4,'}, {'content': ' 5]'}, '}']
+
+        fields = [field async for field in parser.parse_stream(as_stream(chunks))]
+
+        assert fields == [('scores', [4, 5])]
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for idempotent tool result caching.
+"""
+
+import sys
+import os
+import asyncio
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.tool import CachePolicy, Tool, ToolExecutionError, aurora_tool
+from aurora_ai.tool import tool_cache
+from aurora_ai.tool.partial_tool import create_partial_tool
+
+
+def counting_tool(policy: CachePolicy, delay: float = 0):
+    calls = []
+
+    @aurora_tool(idempotent=True, cache=policy)
+    async def lookup(key: str, region: str = 'eu') -> str:
+        """Look up a value"""
+        calls.append((key, region))
+        if delay:
+            await asyncio.sleep(delay)
+        if key == 'bad':
+            raise RuntimeError('lookup failed')
+        return f'{key}@{region}:{len(calls)}'
+
+    return lookup.tool, calls
+
+
+class TestCachePolicy:
+    """Test cases for cache declarations."""
+
+    def test_cache_requires_idempotent(self):
+        """Test that a cache policy on a non-idempotent tool is rejected."""
+
+        async def write(value: str):
+            return value
+
+        with pytest.raises(ValueError, match='not declared idempotent'):
+            Tool('write', 'Write', write, {}, cache=CachePolicy())
+
+    def test_invalid_policy(self):
+        """Test that non-positive TTLs and sizes are rejected."""
+        with pytest.raises(ValueError):
+            CachePolicy(ttl=0)
+        with pytest.raises(ValueError):
+            CachePolicy(max_entries=0)
+
+    @pytest.mark.asyncio
+    async def test_uncached_by_default(self):
+        """Test that tools without a policy call the function every time."""
+        calls = []
+
+        @aurora_tool(idempotent=True)
+        async def ping() -> str:
+            calls.append(1)
+            return 'pong'
+
+        await ping.tool.execute()
+        await ping.tool.execute()
+        assert ping.tool.result_cache is None
+        assert len(calls) == 2
+
+
+class TestToolResultCache:
+    """Test cases for ToolResultCache behaviour through Tool.execute."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_hit_cache(self):
+        """Test that repeated arguments reuse the result, regardless of order."""
+        tool, calls = counting_tool(CachePolicy())
+
+        first = await tool.execute(key='a', region='us')
+        second = await tool.execute(region='us', key='a')
+        other = await tool.execute(key='b')
+
+        assert first == second == 'a@us:1'
+        assert other == 'b@eu:2'
+        assert tool.result_cache.hits == 1
+        assert tool.result_cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, monkeypatch):
+        """Test that results are recomputed once the TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(tool_cache.time, 'monotonic', lambda: now[0])
+        tool, calls = counting_tool(CachePolicy(ttl=10))
+
+        await tool.execute(key='a')
+        now[0] += 9
+        await tool.execute(key='a')
+        now[0] += 2
+        await tool.execute(key='a')
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test that the least recently used result is evicted first."""
+        tool, calls = counting_tool(CachePolicy(max_entries=2))
+
+        await tool.execute(key='a')
+        await tool.execute(key='b')
+        await tool.execute(key='a')
+        await tool.execute(key='c')  # evicts b
+        await tool.execute(key='a')
+        await tool.execute(key='b')
+
+        assert [key for key, _ in calls] == ['a', 'b', 'c', 'b']
+        assert len(tool.result_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_key_function(self):
+        """Test that a custom key function decides which calls are identical."""
+        tool, calls = counting_tool(CachePolicy(key=lambda key, region='eu': key))
+
+        await tool.execute(key='a', region='us')
+        result = await tool.execute(key='a', region='eu')
+
+        assert result == 'a@us:1'
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_coalesced(self):
+        """Test that concurrent identical calls execute the function once."""
+        tool, calls = counting_tool(CachePolicy(), delay=0.05)
+
+        results = await asyncio.gather(
+            *(tool.execute(key='a') for _ in range(5)), tool.execute(key='b')
+        )
+
+        assert len(set(results[:5])) == 1
+        assert sorted(calls) == [('a', 'eu'), ('b', 'eu')]
+        assert tool.result_cache.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Test that failures reach every waiting caller but are not stored."""
+        tool, calls = counting_tool(CachePolicy(), delay=0.01)
+
+        results = await asyncio.gather(
+            tool.execute(key='bad'), tool.execute(key='bad'), return_exceptions=True
+        )
+        assert all(isinstance(r, ToolExecutionError) for r in results)
+        assert len(calls) == 1
+
+        with pytest.raises(ToolExecutionError):
+            await tool.execute(key='bad')
+        assert len(calls) == 2
+        assert len(tool.result_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test that cancelling one waiter leaves the shared call running."""
+        tool, calls = counting_tool(CachePolicy(), delay=0.05)
+
+        first = asyncio.ensure_future(tool.execute(key='a'))
+        second = asyncio.ensure_future(tool.execute(key='a'))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == 'a@eu:1'
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_abandoned_call_is_cancelled(self):
+        """Test that a hung call is cancelled once every caller gave up."""
+        tool, calls = counting_tool(CachePolicy(), delay=10)
+
+        results = await asyncio.gather(
+            asyncio.wait_for(tool.execute(key='a'), 0.02),
+            asyncio.wait_for(tool.execute(key='a'), 0.05),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(0)
+
+        assert all(isinstance(r, asyncio.TimeoutError) for r in results)
+        assert tool.result_cache._in_flight == {}
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(tool.execute(key='a'), 0.02)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_clear(self):
+        """Test that cached results can be dropped."""
+        tool, calls = counting_tool(CachePolicy())
+
+        await tool.execute(key='a')
+        tool.result_cache.invalidate(key='a')
+        await tool.execute(key='a')
+        tool.result_cache.clear()
+        await tool.execute(key='a')
+
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_partial_tool_shares_cache(self):
+        """Test that partial tools go through their base tool's cache."""
+        tool, calls = counting_tool(CachePolicy())
+        partial = create_partial_tool(tool, region='us')
+
+        await tool.execute(key='a', region='us')
+        result = await partial.execute(key='a')
+
+        assert partial.idempotent
+        assert result == 'a@us:1'
+        assert len(calls) == 1
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for speculative prefetching of an agent's first tool call.
+"""
+
+import sys
+import os
+import asyncio
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.builder.agent_builder import AgentBuilder
+from aurora_ai.llm.base_llm import BaseLLM
+from aurora_ai.models.tool_prefetch import ToolPrefetcher
+from aurora_ai.tool import aurora_tool
+
+
+class SlowLLM(BaseLLM):
+    """LLM that takes a while to answer and logs when it does."""
+
+    def __init__(self, responses, events):
+        super().__init__(model='slow')
+        self.responses = list(responses)
+        self.events = events
+
+    async def generate(self, messages, functions=None, output_schema=None, **kwargs):
+        await asyncio.sleep(0.05)
+        self.events.append('llm')
+        return self.responses.pop(0)
+
+    async def stream(self, messages, functions=None, output_schema=None):
+        yield {'content': ''}
+
+    async def get_function_call(self, response):
+        return response.get('function_call')
+
+    def get_message_content(self, response):
+        return response.get('content', '')
+
+    def format_tool_for_llm(self, tool):
+        return {'name': tool.name}
+
+    def format_tools_for_llm(self, tools):
+        return [self.format_tool_for_llm(tool) for tool in tools]
+
+    def format_image_in_message(self, image):
+        raise NotImplementedError
+
+
+def tool_call(name, **arguments):
+    return {'function_call': {'name': name, 'arguments': arguments}}
+
+
+def schema_tool(events, idempotent=True):
+    @aurora_tool(description='Describe a table', idempotent=idempotent)
+    async def describe(table: str) -> str:
+        events.append(f'tool:{table}')
+        return f'{table}(id, name)'
+
+    return describe.tool
+
+
+async def run_agent(prefetcher, tool, events, table='users'):
+    llm = SlowLLM(
+        [tool_call('describe', table=table), {'content': 'Final Answer: done'}],
+        events,
+    )
+    agent = (
+        AgentBuilder()
+        .with_name('sql')
+        .with_llm(llm)
+        .with_tools([tool])
+        .with_tool_prefetching(prefetcher)
+        .build()
+    )
+    return await agent.run('How many users signed up?')
+
+
+class TestToolPrefetcher:
+    """Test cases for predicting the first tool call."""
+
+    def test_predicts_dominant_call(self):
+        """Test that a call is predicted once it dominates the observations."""
+        prefetcher = ToolPrefetcher(min_observations=3, min_probability=0.6)
+
+        prefetcher.observe('', 'describe', {'table': 'users'})
+        prefetcher.observe('', 'describe', {'table': 'users'})
+        assert prefetcher.predict('') is None
+
+        prefetcher.observe('', None, {})
+        assert prefetcher.predict('') == ('describe', {'table': 'users'})
+
+        prefetcher.observe('', None, {})
+        assert prefetcher.predict('') is None
+        assert prefetcher.predict('other') is None
+
+    def test_patterns_kept_apart(self):
+        """Test that statistics are kept per input pattern."""
+        prefetcher = ToolPrefetcher(
+            pattern=lambda text: text.split()[0].lower(), min_observations=1
+        )
+        prefetcher.observe(prefetcher.pattern('Count users'), 'count', {})
+        prefetcher.observe(prefetcher.pattern('List orders'), 'list', {})
+
+        assert prefetcher.predict('count') == ('count', {})
+        assert prefetcher.predict('list') == ('list', {})
+
+    def test_arguments_bounded_by_window(self):
+        """Test that arguments of calls outside the window are not kept."""
+        prefetcher = ToolPrefetcher(min_observations=2, min_probability=0.6, window=3)
+
+        for i in range(100):
+            prefetcher.observe('', 'describe', {'table': f't{i}'})
+        prefetcher.observe('', 'describe', {'table': 't99'})
+
+        assert [a for _, a in prefetcher._history['']] == [
+            {'table': 't98'},
+            {'table': 't99'},
+            {'table': 't99'},
+        ]
+        assert prefetcher.predict('') == ('describe', {'table': 't99'})
+
+    def test_invalid_settings(self):
+        """Test that invalid thresholds are rejected."""
+        with pytest.raises(ValueError):
+            ToolPrefetcher(min_probability=0)
+        with pytest.raises(ValueError):
+            ToolPrefetcher(min_observations=5, window=3)
+
+
+class TestAgentPrefetch:
+    """Test cases for prefetching in Agent runs."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_overlaps_first_llm_call(self):
+        """Test that a predicted call runs during the first LLM request."""
+        prefetcher = ToolPrefetcher(min_observations=2)
+        events = []
+        tool = schema_tool(events)
+
+        for _ in range(2):
+            await run_agent(prefetcher, tool, events)
+        assert events == ['llm', 'tool:users', 'llm'] * 2
+
+        events.clear()
+        result = await run_agent(prefetcher, tool, events)
+
+        assert events == ['tool:users', 'llm', 'llm']
+        assert result[-1].content == 'Final Answer: done'
+        assert (prefetcher.started, prefetcher.used, prefetcher.discarded) == (1, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_mismatch_discards_prefetch(self):
+        """Test that a different call cancels the prefetch and runs normally."""
+        prefetcher = ToolPrefetcher(min_observations=1)
+        events = []
+        tool = schema_tool(events)
+        prefetcher.observe('', 'describe', {'table': 'users'})
+
+        await run_agent(prefetcher, tool, events, table='orders')
+
+        assert 'tool:orders' in events
+        assert prefetcher.used == 0
+        assert prefetcher.discarded == 1
+
+    @pytest.mark.asyncio
+    async def test_only_idempotent_tools(self):
+        """Test that tools with possible side effects are never prefetched."""
+        prefetcher = ToolPrefetcher(min_observations=1)
+        events = []
+        tool = schema_tool(events, idempotent=False)
+        prefetcher.observe('', 'describe', {'table': 'users'})
+
+        await run_agent(prefetcher, tool, events)
+
+        assert events == ['llm', 'tool:users', 'llm']
+        assert prefetcher.started == 0
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for tool timeouts, workflow deadlines and circuit breakers.
+"""
+
+import sys
+import os
+import asyncio
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.arium.arium import aurora
+from aurora_ai.arium.memory import MessageMemory
+from aurora_ai.arium.nodes import FunctionNode
+from aurora_ai.builder.agent_builder import AgentBuilder
+from aurora_ai.tool import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ToolConfig,
+    ToolExecutionError,
+    ToolTimeoutError,
+    aurora_tool,
+)
+from aurora_ai.tool import circuit_breaker as circuit_breaker_module
+from aurora_ai.tool.circuit_breaker import CircuitState
+from aurora_ai.utils.deadline import deadline_scope, remaining_time
+
+
+def flaky_tool(breaker: CircuitBreaker):
+    calls = []
+
+    @aurora_tool(circuit_breaker=breaker)
+    async def fetch(fail: bool = True) -> str:
+        calls.append(fail)
+        if fail:
+            raise RuntimeError('backend down')
+        return 'ok'
+
+    return fetch.tool, calls
+
+
+class TestToolTimeout:
+    """Test cases for per-tool timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test that a hung tool fails with ToolTimeoutError."""
+
+        @aurora_tool(timeout=0.05)
+        async def hang() -> None:
+            await asyncio.sleep(5)
+
+        with pytest.raises(ToolTimeoutError, match='timed out after 0.05s'):
+            await hang.tool.execute()
+
+    @pytest.mark.asyncio
+    async def test_fast_call_within_timeout(self):
+        """Test that calls finishing in time are unaffected."""
+
+        @aurora_tool(timeout=1)
+        async def quick() -> str:
+            return 'done'
+
+        assert await quick.tool.execute() == 'done'
+
+    def test_invalid_timeout(self):
+        """Test that non-positive timeouts are rejected."""
+        with pytest.raises(ValueError):
+
+            @aurora_tool(timeout=0)
+            async def never() -> None:
+                pass
+
+    @pytest.mark.asyncio
+    async def test_tool_config_timeout_keeps_name(self):
+        """Test that a ToolConfig timeout wraps the tool without renaming it."""
+
+        @aurora_tool(description='Slow lookup')
+        async def lookup(key: str) -> str:
+            await asyncio.sleep(5)
+
+        tool = ToolConfig(lookup.tool, timeout=0.05).to_tool()
+
+        assert tool.name == 'lookup'
+        assert tool.description == 'Slow lookup'
+        with pytest.raises(ToolTimeoutError):
+            await tool.execute(key='a')
+
+    def test_yaml_tool_config(self):
+        """Test that YAML tool configs accept timeouts and circuit breakers."""
+
+        @aurora_tool()
+        async def search(query: str) -> str:
+            return query
+
+        yaml_tools = AgentBuilder._process_yaml_tools(
+            [
+                {
+                    'name': 'search',
+                    'timeout': 2.5,
+                    'circuit_breaker': {'failure_threshold': 3, 'reset_timeout': 10},
+                },
+                'search',
+            ],
+            {'search': search.tool},
+        )
+
+        configured, plain = yaml_tools
+        assert configured.name == 'search'
+        assert configured.timeout == 2.5
+        assert configured.circuit_breaker.failure_threshold == 3
+        assert plain is search.tool
+
+
+class TestDeadline:
+    """Test cases for workflow deadlines."""
+
+    def test_nested_scopes_only_shorten(self):
+        """Test that an inner scope cannot extend the outer deadline."""
+        assert remaining_time() is None
+        with deadline_scope(1):
+            with deadline_scope(10):
+                assert remaining_time() <= 1
+            with deadline_scope(None):
+                assert remaining_time() <= 1
+        assert remaining_time() is None
+
+    @pytest.mark.asyncio
+    async def test_tool_limited_by_deadline(self):
+        """Test that tools stop at the deadline without tripping the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        @aurora_tool(timeout=10, circuit_breaker=breaker)
+        async def hang() -> None:
+            await asyncio.sleep(5)
+
+        with deadline_scope(0.05):
+            with pytest.raises(ToolTimeoutError, match='deadline exceeded'):
+                await hang.tool.execute()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_fails_fast(self):
+        """Test that no call is started once the deadline has passed."""
+        calls = []
+
+        @aurora_tool()
+        async def record() -> None:
+            calls.append(1)
+
+        with deadline_scope(0.01):
+            await asyncio.sleep(0.02)
+            with pytest.raises(ToolTimeoutError):
+                await record.tool.execute()
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_workflow_timeout(self):
+        """Test that a workflow run is cancelled at its deadline."""
+        seen = {}
+
+        async def slow(inputs, variables):
+            seen['remaining'] = remaining_time()
+            await asyncio.sleep(5)
+
+        node = FunctionNode(name='slow', description='Slow', function=slow)
+        workflow = aurora(MessageMemory())
+        workflow.add_nodes([node])
+        workflow.start_at(node)
+        workflow.add_end_to(node)
+        workflow.compile()
+
+        with pytest.raises(TimeoutError, match='deadline'):
+            await workflow.run('hi', timeout=0.1)
+        assert 0 < seen['remaining'] <= 0.1
+
+
+class TestCircuitBreaker:
+    """Test cases for tool circuit breakers."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self):
+        """Test that the breaker short-circuits after N failures."""
+        tool, calls = flaky_tool(CircuitBreaker(failure_threshold=2))
+
+        for _ in range(2):
+            with pytest.raises(ToolExecutionError):
+                await tool.execute()
+        with pytest.raises(CircuitOpenError, match='2 consecutive failures'):
+            await tool.execute()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failures(self):
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        tool, calls = flaky_tool(breaker)
+
+        with pytest.raises(ToolExecutionError):
+            await tool.execute()
+        await tool.execute(fail=False)
+        with pytest.raises(ToolExecutionError):
+            await tool.execute()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial(self, monkeypatch):
+        """Test that one trial call is let through after the reset timeout."""
+        now = [100.0]
+        monkeypatch.setattr(circuit_breaker_module.time, 'monotonic', lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        tool, calls = flaky_tool(breaker)
+
+        with pytest.raises(ToolExecutionError):
+            await tool.execute()
+        assert breaker.state == CircuitState.OPEN
+
+        now[0] += 30
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(ToolExecutionError):
+            await tool.execute()  # failed trial reopens the circuit
+        with pytest.raises(CircuitOpenError):
+            await tool.execute(fail=False)
+
+        now[0] += 30
+        assert await tool.execute(fail=False) == 'ok'
+        assert breaker.state == CircuitState.CLOSED
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_timeouts_count_as_failures(self):
+        """Test that timed-out calls trip the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        @aurora_tool(timeout=0.02, circuit_breaker=breaker)
+        async def hang() -> None:
+            await asyncio.sleep(5)
+
+        with pytest.raises(ToolTimeoutError):
+            await hang.tool.execute()
+        with pytest.raises(CircuitOpenError):
+            await hang.tool.execute()
+
+    def test_from_config(self):
+        """Test building breakers from configuration values."""
+        breaker = CircuitBreaker()
+        assert CircuitBreaker.from_config(breaker) is breaker
+        assert CircuitBreaker.from_config(None) is None
+        assert CircuitBreaker.from_config(4).failure_threshold == 4
+        assert CircuitBreaker.from_config({'reset_timeout': 5}).reset_timeout == 5
+        with pytest.raises(ValueError):
+            CircuitBreaker.from_config('three')
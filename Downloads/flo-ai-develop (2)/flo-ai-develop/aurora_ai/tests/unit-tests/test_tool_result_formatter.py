@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for compact tool result formatting.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.llm.base_llm import BaseLLM
+from aurora_ai.models.agent import Agent
+from aurora_ai.models.chat_message import FunctionMessage
+from aurora_ai.tool.base_tool import Tool, ToolExecutionError
+from aurora_ai.tool.result_formatter import ToolResultFormatter, as_table
+
+COLUMNS = ['id', 'city', 'amount']
+ROWS = [(i, f'city-{i % 3}', i * 1.5) for i in range(100)]
+
+
+class ScriptedLLM(BaseLLM):
+    """LLM returning a fixed sequence of responses."""
+
+    def __init__(self, responses):
+        super().__init__(model='scripted')
+        self.responses = list(responses)
+        self.calls = []
+
+    async def generate(self, messages, functions=None, output_schema=None, **kwargs):
+        self.calls.append([dict(m) for m in messages])
+        return self.responses.pop(0)
+
+    async def stream(self, messages, functions=None, output_schema=None):
+        yield {'content': ''}
+
+    async def get_function_call(self, response):
+        return response.get('function_call')
+
+    def get_message_content(self, response):
+        return response.get('content', '')
+
+    def format_tool_for_llm(self, tool):
+        return {'name': tool.name}
+
+    def format_tools_for_llm(self, tools):
+        return [self.format_tool_for_llm(tool) for tool in tools]
+
+    def format_image_in_message(self, image):
+        raise NotImplementedError
+
+
+class TestAsTable:
+    """Test cases for tabular result detection."""
+
+    def test_shapes(self):
+        """Test that supported tabular shapes are normalised."""
+        assert as_table(([(1, 'a')], ['id', 'name'])) == (['id', 'name'], [(1, 'a')])
+        assert as_table([{'a': 1}, {'a': 2, 'b': 3}], records=True) == (
+            ['a', 'b'],
+            [[1, None], [2, 3]],
+        )
+        assert as_table({'a': [1, 2], 'b': [3, 4]}, records=True) == (
+            ['a', 'b'],
+            [[1, 3], [2, 4]],
+        )
+
+    def test_records_are_opt_in(self):
+        """Test that payloads shaped like records are left alone by default."""
+        hits = [{'title': 'a', 'meta': {'score': 1}}]
+
+        assert as_table(hits) is None
+        assert as_table({'a': [1, 2]}) is None
+        assert ToolResultFormatter().format(hits) == str(hits)
+
+    def test_non_tabular(self):
+        """Test that other results are not treated as tables."""
+        assert as_table('text') is None
+        assert as_table((1, 2)) is None
+        assert as_table({'a': [1], 'b': [1, 2]}, records=True) is None
+        assert as_table([]) is None
+
+
+class TestToolResultFormatter:
+    """Test cases for ToolResultFormatter."""
+
+    def test_small_table_is_encoded_in_full(self):
+        """Test CSV, TSV and markdown encodings of a small table."""
+        result = ([(1, 'a,b'), (2, None)], ['id', 'name'])
+
+        assert ToolResultFormatter().format(result) == (
+            '2 rows x 2 columns\nid,name\n1,"a,b"\n2,'
+        )
+        assert (
+            ToolResultFormatter('tsv').format(result).endswith('id\tname\n1\ta,b\n2\t')
+        )
+        assert ToolResultFormatter('markdown').format(result).splitlines()[1:] == [
+            '| id | name |',
+            '|---|---|',
+            '| 1 | a,b |',
+            '| 2 |  |',
+        ]
+
+    def test_large_table_is_sampled_with_statistics(self):
+        """Test that large tables keep head/tail rows and column statistics."""
+        text = ToolResultFormatter(max_rows=10, head_rows=3, tail_rows=2).format(
+            (ROWS, COLUMNS)
+        )
+        lines = text.splitlines()
+
+        assert lines[0].startswith('100 rows x 3 columns')
+        assert lines[1:5] == [
+            'id,city,amount',
+            '0,city-0,0.0',
+            '1,city-1,1.5',
+            '2,city-2,3.0',
+        ]
+        assert '99,city-0,148.5' in lines
+        assert '- id: min=0, max=99, mean=49.5, nulls=0' in lines
+        assert '- city: distinct=3, nulls=0' in lines
+        assert len(text) < len(str((ROWS, COLUMNS))) / 5
+
+    def test_long_cells_are_cut_when_sampled(self):
+        """Test that long cell values are only truncated in sampled tables."""
+        rows = [('x' * 50,)] * 3
+
+        full = ToolResultFormatter(max_cell_length=5).format((rows, ['text']))
+        sampled = ToolResultFormatter(
+            max_rows=2, head_rows=1, tail_rows=0, max_cell_length=5
+        ).format((rows, ['text']))
+
+        assert full.endswith('x' * 50)
+        assert 'xxxxx...' in sampled.splitlines()
+
+    @pytest.mark.asyncio
+    async def test_spill_and_page(self, tmp_path):
+        """Test that spilled results can be paged through with the pager tool."""
+        formatter = ToolResultFormatter(max_rows=10, spill_dir=str(tmp_path))
+        text = formatter.format((ROWS, COLUMNS))
+        handle = text.split("handle '")[1].split("'")[0]
+
+        page = await formatter.pager_tool().execute(handle=handle, offset=40, limit=2)
+
+        assert (
+            page == 'Rows 40-42 of 100\nid,city,amount\n40,city-1,60.0\n41,city-2,61.5'
+        )
+        with pytest.raises(ToolExecutionError):
+            await formatter.pager_tool().execute(handle='missing')
+
+    def test_spilled_files_are_capped(self, tmp_path):
+        """Test that only the newest spilled results are kept on disk."""
+        formatter = ToolResultFormatter(
+            max_rows=10, spill_dir=str(tmp_path), max_spilled=2
+        )
+        for _ in range(3):
+            formatter.format((ROWS, COLUMNS))
+
+        assert len(os.listdir(tmp_path)) == 2
+        assert len(formatter._spilled) == 2
+
+        formatter.clear_spilled()
+        assert os.listdir(tmp_path) == []
+
+
+class TestAgentToolResults:
+    """Test cases for formatted tool results in the agent loop."""
+
+    @pytest.mark.asyncio
+    async def test_agent_sends_formatted_results(self, tmp_path):
+        """Test that tabular tool results reach the LLM in compact form."""
+
+        async def query():
+            return ROWS, COLUMNS
+
+        tool = Tool(
+            name='query', description='Run a query', function=query, parameters={}
+        )
+        llm = ScriptedLLM(
+            [
+                {'function_call': {'name': 'query', 'arguments': {}}},
+                {'content': 'Final Answer: 100 rows'},
+            ]
+        )
+        agent = Agent(
+            name='analyst',
+            system_prompt='Analyse data',
+            llm=llm,
+            tools=[tool],
+            result_formatter=ToolResultFormatter(max_rows=10, spill_dir=str(tmp_path)),
+        )
+
+        await agent.run('How many rows?')
+
+        function_messages = [
+            m for m in agent.conversation_history if isinstance(m, FunctionMessage)
+        ]
+        assert 'id,city,amount' in function_messages[0].content
+        assert "Full result saved as handle 'result-" in llm.calls[1][-1]['content']
+        assert [tool.name for tool in agent.tools] == ['query', 'read_tool_result']
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for caching formatted tool schemas in agents.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.llm.base_llm import BaseLLM
+from aurora_ai.models.agent import Agent
+from aurora_ai.models.base_agent import ReasoningPattern
+from aurora_ai.tool import aurora_tool
+from aurora_ai.tool.partial_tool import create_partial_tool
+
+
+class CountingLLM(BaseLLM):
+    """LLM that counts schema formatting and records the tools it receives."""
+
+    def __init__(self, responses):
+        super().__init__(model='counting')
+        self.responses = list(responses)
+        self.format_calls = 0
+        self.functions_seen = []
+
+    async def generate(self, messages, functions=None, output_schema=None, **kwargs):
+        self.functions_seen.append(functions)
+        return self.responses.pop(0)
+
+    async def stream(self, messages, functions=None, output_schema=None):
+        yield {'content': ''}
+
+    async def get_function_call(self, response):
+        return response.get('function_call')
+
+    def get_message_content(self, response):
+        return response.get('content', '')
+
+    def format_tool_for_llm(self, tool):
+        return {'name': tool.name, 'parameters': sorted(tool.parameters)}
+
+    def format_tools_for_llm(self, tools):
+        self.format_calls += 1
+        return [self.format_tool_for_llm(tool) for tool in tools]
+
+    def format_image_in_message(self, image):
+        raise NotImplementedError
+
+
+@aurora_tool(description='Look up a record')
+async def lookup(key: str, table: str) -> str:
+    return f'{table}:{key}'
+
+
+def tool_call(name, **arguments):
+    return {'function_call': {'name': name, 'arguments': arguments}}
+
+
+class TestToolSchemaCache:
+    """Test cases for Agent tool schema caching."""
+
+    @pytest.mark.asyncio
+    async def test_formatted_once_per_run(self):
+        """Test that schemas are not rebuilt on every LLM call."""
+        llm = CountingLLM(
+            [
+                tool_call('lookup', key='a', table='t'),
+                tool_call('lookup', key='b', table='t'),
+                {'content': 'Final Answer: done'},
+            ]
+        )
+        agent = Agent(
+            name='a', system_prompt='Look things up', llm=llm, tools=[lookup.tool]
+        )
+
+        await agent.run('find a and b')
+
+        assert len(llm.functions_seen) == 3
+        assert llm.format_calls == 1
+        assert all(f is llm.functions_seen[0] for f in llm.functions_seen)
+
+    def test_invalidated_when_tools_change(self):
+        """Test that prefilled parameter changes and new tools rebuild schemas."""
+        partial = create_partial_tool(lookup.tool)
+        llm = CountingLLM([])
+        agent = Agent(
+            name='a', system_prompt='Look things up', llm=llm, tools=[partial]
+        )
+
+        first = agent._get_formatted_tools()
+        assert agent._get_formatted_tools() is first
+        assert first[0]['parameters'] == ['key', 'table']
+
+        partial.add_prefilled_param('table', 'users')
+        second = agent._get_formatted_tools()
+        assert second[0]['parameters'] == ['key']
+
+        partial.remove_prefilled_param('table')
+        assert agent._get_formatted_tools()[0]['parameters'] == ['key', 'table']
+
+        agent.tools = [lookup.tool, partial]
+        assert len(agent._get_formatted_tools()) == 2
+        assert llm.format_calls == 4
+
+    def test_cached_per_llm(self):
+        """Test that switching the agent's LLM formats schemas for the new one."""
+        agent = Agent(
+            name='a',
+            system_prompt='Look things up',
+            llm=CountingLLM([]),
+            tools=[lookup.tool],
+        )
+        agent._get_formatted_tools()
+
+        agent.llm = CountingLLM([])
+        agent._get_formatted_tools()
+
+        assert agent.llm.format_calls == 1
+
+    def test_react_tools_description_cached(self):
+        """Test that the ReACT prompt reuses the tool description text."""
+        agent = Agent(
+            name='a',
+            system_prompt='Look things up',
+            llm=CountingLLM([]),
+            tools=[lookup.tool],
+            reasoning_pattern=ReasoningPattern.REACT,
+        )
+
+        description = agent._get_tools_description()
+
+        assert description == '- lookup: Look up a record'
+        assert agent._get_tools_description() is description
+        assert description in agent._get_react_prompt()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for trace sampling and the low-overhead telemetry mode.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import Status, StatusCode
+
+from aurora_ai.arium.arium import aurora
+from aurora_ai.arium.memory import MessageMemory
+from aurora_ai.arium.nodes import FunctionNode
+from aurora_ai.telemetry import TailSamplingPolicy, record_details
+from aurora_ai.telemetry.sampling import TailSamplingSpanProcessor
+from aurora_ai.telemetry.telemetry import _global_telemetry
+
+
+def tail_sampled_tracer(policy):
+    exporter = InMemorySpanExporter()
+    processor = TailSamplingSpanProcessor(policy, [SimpleSpanProcessor(exporter)])
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    return provider.get_tracer('test'), processor, exporter
+
+
+class TestTailSampling:
+    """Test cases for the tail sampling span processor."""
+
+    def test_keeps_failed_traces(self):
+        """Test that a trace with a failed child span is exported in full."""
+        tracer, processor, exporter = tail_sampled_tracer(TailSamplingPolicy())
+
+        with tracer.start_as_current_span('ok'):
+            with tracer.start_as_current_span('ok.child'):
+                pass
+        with tracer.start_as_current_span('failed'):
+            with tracer.start_as_current_span('failed.child') as child:
+                child.set_status(Status(StatusCode.ERROR))
+
+        names = [span.name for span in exporter.get_finished_spans()]
+        assert names == ['failed.child', 'failed']
+        assert (processor.kept, processor.dropped) == (1, 1)
+
+    def test_keeps_slow_traces(self):
+        """Test that traces over the latency threshold are kept."""
+        tracer, processor, exporter = tail_sampled_tracer(
+            TailSamplingPolicy(latency_threshold_ms=50)
+        )
+
+        tracer.start_span('fast', start_time=0).end(end_time=10_000_000)
+        tracer.start_span('slow', start_time=0).end(end_time=60_000_000)
+
+        assert [span.name for span in exporter.get_finished_spans()] == ['slow']
+
+    def test_sample_rate_one_keeps_all(self):
+        """Test that the baseline sample rate applies to other traces."""
+        tracer, processor, exporter = tail_sampled_tracer(
+            TailSamplingPolicy(sample_rate=1.0)
+        )
+
+        for _ in range(3):
+            with tracer.start_as_current_span('run'):
+                pass
+
+        assert processor.kept == 3
+
+    def test_unfinished_traces_bounded(self):
+        """Test that buffered traces are decided once there are too many."""
+        tracer, processor, exporter = tail_sampled_tracer(
+            TailSamplingPolicy(max_traces=2)
+        )
+        roots = [tracer.start_span(f'root{i}') for i in range(3)]
+        for i, root in enumerate(roots):
+            with tracer.start_as_current_span(
+                f'child{i}', context=_context_of(root)
+            ) as child:
+                child.set_status(Status(StatusCode.ERROR))
+
+        assert [span.name for span in exporter.get_finished_spans()] == ['child0']
+        processor.shutdown()
+        assert processor.kept == 3
+
+    def test_policy_validation(self):
+        """Test that invalid policies are rejected."""
+        with pytest.raises(ValueError):
+            TailSamplingPolicy(sample_rate=1.5)
+        with pytest.raises(ValueError):
+            TailSamplingPolicy(max_traces=0)
+
+
+def _context_of(span):
+    from opentelemetry import trace
+
+    return trace.set_span_in_context(span)
+
+
+class TestRecordDetails:
+    """Test cases for skipping expensive attributes."""
+
+    @pytest.fixture
+    def use_tracer(self, monkeypatch):
+        def use(sample_rate, detailed_attributes=True):
+            exporter = InMemorySpanExporter()
+            provider = TracerProvider(
+                sampler=ParentBased(TraceIdRatioBased(sample_rate))
+            )
+            provider.add_span_processor(SimpleSpanProcessor(exporter))
+            monkeypatch.setattr(_global_telemetry, 'tracer', provider.get_tracer('t'))
+            monkeypatch.setattr(
+                _global_telemetry, 'detailed_attributes', detailed_attributes
+            )
+            return exporter
+
+        return use
+
+    def test_sampled_out_spans(self, use_tracer):
+        """Test that details are skipped for spans that are not recorded."""
+        use_tracer(0.0)
+        with _global_telemetry.tracer.start_as_current_span('run') as span:
+            assert not record_details(span)
+        assert not record_details(None)
+
+    def test_low_overhead_mode(self, use_tracer):
+        """Test that details are skipped when detailed attributes are off."""
+        use_tracer(1.0, detailed_attributes=False)
+        with _global_telemetry.tracer.start_as_current_span('run') as span:
+            assert span.is_recording()
+            assert not record_details(span)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('detailed', [True, False])
+    async def test_workflow_result_length(self, use_tracer, detailed):
+        """Test that the workflow result length is only computed when wanted."""
+        exporter = use_tracer(1.0, detailed_attributes=detailed)
+
+        async def step(inputs, variables):
+            return 'done'
+
+        node = FunctionNode(name='step', description='Step', function=step)
+        workflow = aurora(MessageMemory())
+        workflow.add_nodes([node])
+        workflow.start_at(node)
+        workflow.add_end_to(node)
+        workflow.compile()
+        await workflow.run('go')
+
+        (span,) = [
+            s
+            for s in exporter.get_finished_spans()
+            if 'workflow.node_count' in s.attributes
+        ]
+        assert ('workflow.result.length' in span.attributes) is detailed
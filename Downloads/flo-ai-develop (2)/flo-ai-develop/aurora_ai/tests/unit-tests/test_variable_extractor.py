@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for prompt templates and variable extraction.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the aurora_ai directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aurora_ai.models.chat_message import AssistantMessage
+from aurora_ai.utils import variable_extractor
+from aurora_ai.utils.variable_extractor import (
+    PromptTemplate,
+    compile_template,
+    extract_variables_from_text,
+    resolve_variables,
+)
+
+
+class TestPromptTemplate:
+    """Test cases for PromptTemplate."""
+
+    def test_segments_and_variables(self):
+        """Test that a prompt is split into literals and variable names."""
+        template = PromptTemplate('<greeting> <name>, meet <name>!')
+
+        assert template.variables == frozenset({'greeting', 'name'})
+        assert template.render({'greeting': 'Hi', 'name': 'Ada'}) == 'Hi Ada, meet Ada!'
+
+    def test_values_are_not_rescanned(self):
+        """Test that substituted values containing placeholders are left as-is."""
+        template = PromptTemplate('a <x> b')
+        assert template.render({'x': '<y>'}) == 'a <y> b'
+
+    def test_missing_variable(self):
+        """Test that a missing variable raises a descriptive error."""
+        with pytest.raises(ValueError, match="Variable 'role' referenced"):
+            PromptTemplate('You are <role>').render({'name': 'Ada'})
+
+    def test_no_variables_returns_original_text(self):
+        """Test that rendering without variables returns the text unchanged."""
+        text = 'Compare a < b and c > d'
+        assert PromptTemplate(text).render({'a': 1}) is text
+
+
+class TestTemplateCache:
+    """Test cases for template compilation caching."""
+
+    def test_compiled_once(self):
+        """Test that the same prompt text is parsed only once."""
+        text = 'Summarize <topic> for <audience>'
+        assert compile_template(text) is compile_template(text)
+
+    def test_long_texts_are_not_cached(self, monkeypatch):
+        """Test that texts above the cache limit are compiled uncached."""
+        monkeypatch.setattr(variable_extractor, '_MAX_CACHED_TEMPLATE_LENGTH', 10)
+        text = 'a long prompt mentioning <topic>'
+        assert compile_template(text) is not compile_template(text)
+        assert compile_template(text).render({'topic': 'x'}).endswith('x')
+
+
+class TestVariableHelpers:
+    """Test cases for the module-level helpers built on templates."""
+
+    def test_extract_variables_from_text(self):
+        """Test extraction from strings and assistant messages."""
+        assert extract_variables_from_text('Hello <name>, your <role>') == {
+            'name',
+            'role',
+        }
+        assert extract_variables_from_text(AssistantMessage(content='<a>')) == {'a'}
+        assert extract_variables_from_text('No variables here') == set()
+
+    def test_resolve_variables(self):
+        """Test that resolve_variables renders through the template."""
+        assert resolve_variables('Hi <name>', {'name': 'Ada'}) == 'Hi Ada'
+        assert resolve_variables('Hi <name>', {}) == 'Hi <name>'
+        with pytest.raises(ValueError):
+            resolve_variables('Hi <name>', {'other': 1})
@@ -6,7 +6,7 @@ Pytest tests for the VertexAI LLM implementation.
 import sys
 import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 # Add the aurora_ai directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -121,14 +121,14 @@ class TestVertexAI:
         mock_response.candidates = []
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Hello'}]
         result = await llm.generate(messages)
 
         # Verify the API call
-        llm.client.models.generate_content.assert_called_once()
-        call_args = llm.client.models.generate_content.call_args
+        llm.client.aio.models.generate_content.assert_called_once()
+        call_args = llm.client.aio.models.generate_content.call_args
 
         assert call_args[1]['model'] == 'gemini-2.5-flash'
         assert call_args[1]['contents'] == ['Hello']
@@ -152,7 +152,7 @@ class TestVertexAI:
         mock_response.candidates = []
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [
             {'role': 'system', 'content': 'You are a helpful assistant'},
@@ -162,7 +162,7 @@ class TestVertexAI:
         await llm.generate(messages)
 
         # Verify system instruction was passed correctly
-        call_args = llm.client.models.generate_content.call_args
+        call_args = llm.client.aio.models.generate_content.call_args
         config = call_args[1]['config']
         assert config.system_instruction == 'You are a helpful assistant\n'
 
@@ -190,7 +190,7 @@ class TestVertexAI:
         mock_response.candidates = []
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Generate JSON'}]
         result = await llm.generate(messages, output_schema=output_schema)
@@ -221,7 +221,7 @@ class TestVertexAI:
         mock_response.candidates = []
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Use the function'}]
         result = await llm.generate(messages, functions=functions)
@@ -267,7 +267,7 @@ class TestVertexAI:
         mock_response.candidates = [mock_candidate]
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Use the function'}]
         result = await llm.generate(messages, functions=functions)
@@ -292,13 +292,13 @@ class TestVertexAI:
         mock_response.candidates = []
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         messages = [{'role': 'user', 'content': 'Hello'}]
         await llm.generate(messages)
 
         # Verify kwargs were passed through
-        call_args = llm.client.models.generate_content.call_args
+        call_args = llm.client.aio.models.generate_content.call_args
         config = call_args[1]['config']
         assert config.top_p == 0.9
         assert config.max_output_tokens == 1000
@@ -513,7 +513,9 @@ class TestVertexAI:
 
         # Mock client to raise an exception
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(side_effect=Exception('API Error'))
+        llm.client.aio.models.generate_content = AsyncMock(
+            side_effect=Exception('API Error')
+        )
 
         messages = [{'role': 'user', 'content': 'Hello'}]
 
@@ -572,7 +574,7 @@ class TestVertexAI:
         mock_response.candidates = []
 
         llm.client = mock_client
-        llm.client.models.generate_content = Mock(return_value=mock_response)
+        llm.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         # We need to patch the types.GenerateContentConfig to test this
         with patch('aurora_ai.llm.gemini_llm.types.GenerateContentConfig') as mock_config:
@@ -1,13 +1,34 @@
+import asyncio
 import time
 import logging
-from dataclasses import dataclass
-from functools import wraps
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial, wraps
 from contextlib import contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
 import redshift_connector
 
 logger = logging.getLogger('RedshiftToolLogger')
 logger.setLevel(logging.INFO)
 
+_WRITE_OPERATIONS = (
+    'INSERT',
+    'UPDATE',
+    'DELETE',
+    'CREATE',
+    'DROP',
+    'ALTER',
+    'TRUNCATE',
+)
+
+# Queries starting with these are read through a server-side cursor
+_ROW_QUERIES = ('SELECT', 'WITH')
+
+# Server-side cursor used for row queries, one per connection at a time
+_CURSOR_NAME = 'aurora_rows'
+
 
 @dataclass
 class RedshiftConfig:
@@ -17,6 +38,36 @@ class RedshiftConfig:
     port: str
     db_name: str
     read_only: bool = False
+    # Maximum number of open connections, also the number of worker threads
+    pool_size: int = 5
+    # Rows fetched per round trip when reading SELECT results
+    fetch_batch_size: int = 1000
+    # Default row cap for results; None keeps every row
+    max_rows: Optional[int] = None
+
+
+@dataclass
+class QueryResult:
+    """Rows returned by a query, capped at ``max_rows``.
+
+    Attributes:
+        rows: Fetched rows
+        column_names: Column names, in row order
+        truncated: Whether more rows were available than were fetched
+    """
+
+    rows: List[Sequence[Any]] = field(default_factory=list)
+    column_names: List[str] = field(default_factory=list)
+    truncated: bool = False
+
+    def summary(self, sample_size: int = 10) -> Dict[str, Any]:
+        """Compact description for agents: columns, row count and a row sample"""
+        return {
+            'column_names': self.column_names,
+            'row_count': len(self.rows),
+            'truncated': self.truncated,
+            'sample_rows': [list(row) for row in self.rows[:sample_size]],
+        }
 
 
 def retry_on_connection_error(max_retries=3, delay=1, timeout=30):
@@ -56,94 +107,287 @@ def retry_on_connection_error(max_retries=3, delay=1, timeout=30):
     return decorator
 
 
+class RedshiftConnectionPool:
+    """
+    Bounded pool of Redshift connections shared between threads.
+
+    Connections are opened on demand up to ``pool_size`` and reused afterwards,
+    so the SSL handshake and the read-only session setup happen once per
+    connection instead of once per query. Connections that raised a database
+    error are discarded rather than returned to the pool.
+
+    Threads wait for a free slot in ``acquire``; coroutines wait in
+    ``wait_for_slot`` without holding a thread and then call ``checkout``.
+    """
+
+    def __init__(self, config: RedshiftConfig):
+        self.config = config
+        self._idle: 'queue.LifoQueue[redshift_connector.Connection]' = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(config.pool_size)
+        self._closed = False
+        # Coroutines waiting for a slot, woken on every release
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._waiters_lock = threading.Lock()
+
+    def _connect(self, timeout: int) -> redshift_connector.Connection:
+        connection: redshift_connector.Connection = redshift_connector.connect(
+            host=self.config.host,
+            port=int(self.config.port),
+            database=self.config.db_name,
+            user=self.config.username,
+            password=self.config.password,
+            timeout=timeout,
+            ssl=True,
+            tcp_keepalive=True,
+        )
+
+        if self.config.read_only:
+            logger.debug('Making read only connection to redshfit')
+            cursor = connection.cursor()
+            cursor.execute('SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY')
+            cursor.close()
+
+        return connection
+
+    def _no_slot(self, timeout: float) -> TimeoutError:
+        return TimeoutError(
+            f'No Redshift connection available within {timeout}s '
+            f'(pool_size={self.config.pool_size})'
+        )
+
+    def acquire(self, timeout: int = 300) -> redshift_connector.Connection:
+        """Borrow a connection, waiting up to ``timeout`` seconds for a free slot"""
+        if self._closed:
+            raise RuntimeError('Connection pool is closed')
+        if not self._slots.acquire(timeout=timeout):
+            raise self._no_slot(timeout)
+        return self.checkout(timeout)
+
+    async def wait_for_slot(self, timeout: float = 300) -> None:
+        """Reserve a slot without blocking a thread; follow with ``checkout``"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            if self._closed:
+                raise RuntimeError('Connection pool is closed')
+            waiter = loop.create_future()
+            # Registered before trying, so a release in between wakes the waiter
+            with self._waiters_lock:
+                self._waiters.append((loop, waiter))
+            try:
+                if self._slots.acquire(blocking=False):
+                    return
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise self._no_slot(timeout)
+                try:
+                    await asyncio.wait_for(waiter, remaining)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                with self._waiters_lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+
+    def checkout(self, timeout: int = 300) -> redshift_connector.Connection:
+        """Take an idle connection or open one, for a slot already reserved"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._connect(timeout)
+        except BaseException:
+            self._release_slot()
+            raise
+
+    def _release_slot(self):
+        self._slots.release()
+        with self._waiters_lock:
+            waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The waiter's loop is closed
+                pass
+
+    def release(self, connection: redshift_connector.Connection, discard=False):
+        """Return a borrowed connection, closing it if ``discard`` or the pool is closed"""
+        try:
+            if not discard and not self._closed:
+                try:
+                    # End the open transaction, as closing the connection used to
+                    connection.rollback()
+                    self._idle.put(connection)
+                    return
+                except Exception as e:
+                    logger.warning(f'Discarding connection after rollback error: {e}')
+            _close_quietly(connection)
+        finally:
+            self._release_slot()
+
+    def close(self):
+        """Close idle connections; borrowed ones are closed when released"""
+        self._closed = True
+        while True:
+            try:
+                _close_quietly(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _close_quietly(connection: redshift_connector.Connection):
+    try:
+        connection.close()
+    except Exception as e:
+        logger.error(f'Connection closing error: {str(e)}')
+
+
 class RedshiftConnector:
+    """
+    Redshift client with pooled connections, usable from sync and async code.
+
+    The synchronous ``execute_query`` keeps its original return values. The
+    ``aexecute_query`` and ``astream_query`` coroutines run the blocking driver
+    calls on a dedicated thread pool sized like the connection pool, so agent
+    tools never block the event loop and concurrency is bounded by the pool.
+    They wait for a free connection on the event loop, not on a worker thread,
+    and a connection still in use by a cancelled call is released once the
+    call returns.
+    """
+
     def __init__(self, redshift_config: RedshiftConfig):
         self.config = redshift_config
+        redshift_connector.paramstyle = 'named'
+        self.pool = RedshiftConnectionPool(redshift_config)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.pool_size,
+                thread_name_prefix='redshift',
+            )
+        return self._executor
 
     @contextmanager
     def get_connection(self, timeout=300):
         connection = None
+        discard = False
         try:
-            connection: redshift_connector.Connection = redshift_connector.connect(
-                host=self.config.host,
-                port=int(self.config.port),
-                database=self.config.db_name,
-                user=self.config.username,
-                password=self.config.password,
-                timeout=timeout,
-                ssl=True,
-                tcp_keepalive=True,
-            )
-            redshift_connector.paramstyle = 'named'
-
-            if self.config.read_only:
-                logger.debug('Making read only connection to redshfit')
-                cursor = connection.cursor()
-                cursor.execute('SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY')
-                cursor.close()
-
+            connection = self.pool.acquire(timeout)
             yield connection
         except Exception as e:
+            # After a driver error the connection may be unusable, don't reuse it
+            discard = isinstance(e, redshift_connector.Error)
             logger.error(f'Connection error: {str(e)}')
             raise e
         finally:
-            self.__close_connection(connection=connection)
+            if connection is not None:
+                self.pool.release(connection, discard=discard)
 
-    def __close_connection(self, connection: redshift_connector.Connection):
-        try:
-            if connection:
-                connection.close()
-        except Exception as e:
-            logger.error(f'Connection closing error: {str(e)}')
-            raise e
+    def close(self):
+        """Close pooled connections and stop the worker threads"""
+        self.pool.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
-    @retry_on_connection_error()
-    def execute_query(
+    def _check_query(self, query: str):
+        if self.config.read_only:
+            query_upper = query.strip().upper()
+            if any(query_upper.startswith(op) for op in _WRITE_OPERATIONS):
+                raise ValueError('Write operations are not allowed in read-only mode')
+
+    def _start(
+        self, cursor, query: str, parameters: Optional[dict]
+    ) -> Callable[[int], List[Sequence[Any]]]:
+        """
+        Execute ``query`` and return a function reading its next rows.
+
+        The driver buffers a whole result set inside ``execute``, so SELECT
+        queries are declared as a server-side cursor and read with ``FETCH
+        FORWARD``: only the rows asked for cross the network or are held in
+        memory. Other statements run directly. The cursor lives in the
+        connection's open transaction and is closed by the rollback that
+        returns the connection to the pool.
+        """
+        if not query.lstrip().upper().startswith(_ROW_QUERIES):
+            _execute(cursor, query, parameters)
+            return cursor.fetchmany
+
+        statement = query.strip().rstrip(';')
+        _execute(cursor, f'DECLARE {_CURSOR_NAME} CURSOR FOR {statement}', parameters)
+
+        def read(size: int) -> List[Sequence[Any]]:
+            cursor.execute(f'FETCH FORWARD {size} FROM {_CURSOR_NAME}')
+            return cursor.fetchall()
+
+        return read
+
+    def _fetch(
+        self,
+        cursor,
+        read: Callable[[int], List[Sequence[Any]]],
+        max_rows: Optional[int],
+    ) -> QueryResult:
+        """Read at most ``max_rows`` rows (plus one, to detect truncation) in batches"""
+        rows: List[Sequence[Any]] = []
+        batch_size = self.config.fetch_batch_size
+        while max_rows is None or len(rows) <= max_rows:
+            size = (
+                batch_size
+                if max_rows is None
+                else min(batch_size, max_rows + 1 - len(rows))
+            )
+            batch = read(size)
+            rows.extend(batch)
+            if len(batch) < size:
+                break
+
+        column_names = [desc[0] for desc in cursor.description]
+        truncated = max_rows is not None and len(rows) > max_rows
+        if truncated:
+            del rows[max_rows:]
+            logger.warning(f'Query result truncated to {max_rows} rows')
+        return QueryResult(rows=rows, column_names=column_names, truncated=truncated)
+
+    def _run_query(
         self,
         query: str,
-        parameters: dict = None,
-        connection: redshift_connector.Connection = None,
+        parameters: Optional[dict],
+        connection: redshift_connector.Connection,
+        max_rows: Optional[int],
     ):
+        """Execute on a borrowed connection; returns a rowcount or a QueryResult"""
         try:
-            if self.config.read_only:
-                query_upper = query.strip().upper()
-                write_operations = (
-                    'INSERT',
-                    'UPDATE',
-                    'DELETE',
-                    'CREATE',
-                    'DROP',
-                    'ALTER',
-                    'TRUNCATE',
-                )
-                if any(query_upper.startswith(op) for op in write_operations):
-                    raise ValueError(
-                        'Write operations are not allowed in read-only mode'
-                    )
+            self._check_query(query)
 
             logger.debug(f'Executing query: {query}')
             logger.debug(f'Parameters: {parameters}')
 
             cursor = connection.cursor()
+            try:
+                redshift_connector.paramstyle = 'named'
+                read = self._start(cursor, query, parameters)
 
-            redshift_connector.paramstyle = 'named'
-            if parameters:
-                cursor.execute(query, parameters)
-            else:
-                cursor.execute(query)
-
-            if query.strip().upper().startswith('INSERT'):
-                logger.info(f'Insert completed. Rowcount: {cursor.rowcount}')
-                return cursor.rowcount
+                if query.strip().upper().startswith('INSERT'):
+                    logger.info(f'Insert completed. Rowcount: {cursor.rowcount}')
+                    return cursor.rowcount
 
-            try:
-                results = cursor.fetchall()
-                column_names = [desc[0] for desc in cursor.description]
-                return results, column_names
-            except redshift_connector.ProgrammingError:
-                return cursor.rowcount
+                try:
+                    return self._fetch(cursor, read, max_rows)
+                except redshift_connector.ProgrammingError:
+                    return cursor.rowcount
             finally:
-                cursor.close()
+                _close_cursor(cursor)
 
         except Exception as e:
             logger.error(
@@ -152,3 +396,200 @@ class RedshiftConnector:
                 f'Parameters: {parameters}'
             )
             raise e
+
+    @retry_on_connection_error()
+    def execute_query(
+        self,
+        query: str,
+        parameters: dict = None,
+        connection: redshift_connector.Connection = None,
+    ):
+        result = self._run_query(query, parameters, connection, self.config.max_rows)
+        if isinstance(result, QueryResult):
+            return result.rows, result.column_names
+        return result
+
+    async def _aacquire(self, timeout: float) -> redshift_connector.Connection:
+        """Borrow a connection; only opening a new one uses a worker thread"""
+        await self.pool.wait_for_slot(timeout)
+        loop = asyncio.get_running_loop()
+        checkout = loop.run_in_executor(self.executor, self.pool.checkout, timeout)
+        try:
+            return await asyncio.shield(checkout)
+        except asyncio.CancelledError:
+            # The worker still gets a connection; give it back when it does
+            checkout.add_done_callback(self._release_checked_out)
+            raise
+
+    def _release_checked_out(self, checkout: asyncio.Future):
+        if not checkout.cancelled() and checkout.exception() is None:
+            self._release_later(checkout.result(), discard=False)
+
+    def _finish(self, connection, discard: bool, cursor=None):
+        if cursor is not None:
+            _close_cursor(cursor)
+        self.pool.release(connection, discard=discard)
+
+    async def _arelease(self, connection, discard: bool, cursor=None):
+        """Close the cursor and release the connection on a worker thread"""
+        loop = asyncio.get_running_loop()
+        await asyncio.shield(
+            loop.run_in_executor(
+                self.executor, partial(self._finish, connection, discard, cursor)
+            )
+        )
+
+    def _release_later(self, connection, discard: bool, cursor=None):
+        """Release from a done callback, without waiting for it"""
+        executor = self._executor
+        if executor is None:
+            self._finish(connection, discard, cursor)
+            return
+        try:
+            executor.submit(self._finish, connection, discard, cursor)
+        except RuntimeError:
+            # The executor was shut down
+            self._finish(connection, discard, cursor)
+
+    async def _execute_pooled(
+        self,
+        query: str,
+        parameters: Optional[dict],
+        max_rows: Optional[int],
+        timeout: float,
+    ):
+        connection = await self._aacquire(timeout)
+        loop = asyncio.get_running_loop()
+        call = loop.run_in_executor(
+            self.executor,
+            partial(self._run_query, query, parameters, connection, max_rows),
+        )
+        discard = True
+        try:
+            result = await asyncio.shield(call)
+            discard = False
+            return result
+        except asyncio.CancelledError:
+            # The query keeps using the connection until it returns
+            busy, connection = connection, None
+            call.add_done_callback(lambda _: self._release_later(busy, discard=True))
+            raise
+        except Exception as e:
+            # After a driver error the connection may be unusable, don't reuse it
+            discard = isinstance(e, redshift_connector.Error)
+            raise
+        finally:
+            if connection is not None:
+                await self._arelease(connection, discard)
+
+    async def aexecute_query(
+        self,
+        query: str,
+        parameters: dict = None,
+        max_rows: Optional[int] = None,
+        max_retries: int = 3,
+        delay: float = 1,
+        timeout: int = 30,
+    ):
+        """
+        Execute a query without blocking the event loop.
+
+        Args:
+            query: SQL query, using named parameters
+            parameters: Query parameters
+            max_rows: Row cap for this query (defaults to ``config.max_rows``)
+            max_retries: Attempts on connection errors, with linear backoff
+            delay: Base backoff delay in seconds
+            timeout: Connection timeout in seconds
+
+        Returns:
+            QueryResult for queries returning rows, otherwise the rowcount
+        """
+        max_rows = self.config.max_rows if max_rows is None else max_rows
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                return await self._execute_pooled(query, parameters, max_rows, timeout)
+            except (
+                redshift_connector.Error,
+                redshift_connector.OperationalError,
+            ) as e:
+                logger.warning(
+                    f'Database connection error: {str(e)}. '
+                    f'Attempt {attempt} of {max_retries}'
+                )
+                if attempt == max_retries:
+                    logger.error(f'Max retries reached. Last error: {str(e)}')
+                    raise
+                await asyncio.sleep(delay * attempt)
+
+    async def astream_query(
+        self,
+        query: str,
+        parameters: dict = None,
+        max_rows: Optional[int] = None,
+        timeout: int = 30,
+    ) -> AsyncIterator[List[Sequence[Any]]]:
+        """
+        Yield result rows in ``fetch_batch_size`` batches as they are read.
+
+        A pooled connection is held until the generator finishes or is closed.
+        SELECT queries are read through a server-side cursor, one batch per
+        round trip, and at most ``max_rows`` rows (defaults to
+        ``config.max_rows``) are fetched.
+        """
+        self._check_query(query)
+        max_rows = self.config.max_rows if max_rows is None else max_rows
+        loop = asyncio.get_running_loop()
+        # Driver call that may still be using the connection
+        pending: Optional[asyncio.Future] = None
+
+        def run(func, *args):
+            nonlocal pending
+            pending = loop.run_in_executor(self.executor, partial(func, *args))
+            # Cancelling the caller must not hide that the call is still running
+            return asyncio.shield(pending)
+
+        connection = await self._aacquire(timeout)
+        discard = False
+        cursor = None
+        try:
+            cursor = connection.cursor()
+            read = await run(self._start, cursor, query, parameters)
+            remaining = max_rows
+            while remaining is None or remaining > 0:
+                size = self.config.fetch_batch_size
+                if remaining is not None:
+                    size = min(size, remaining)
+                batch = await run(read, size)
+                if batch:
+                    yield batch
+                if len(batch) < size:
+                    break
+                if remaining is not None:
+                    remaining -= len(batch)
+        except BaseException:
+            # Includes early aclose()/cancellation: unread rows may remain
+            discard = True
+            raise
+        finally:
+            if pending is not None and not pending.done():
+                pending.add_done_callback(
+                    lambda _: self._release_later(connection, discard, cursor)
+                )
+            else:
+                await self._arelease(connection, discard, cursor)
+
+
+def _execute(cursor, query: str, parameters: Optional[dict]):
+    if parameters:
+        cursor.execute(query, parameters)
+    else:
+        cursor.execute(query)
+
+
+def _close_cursor(cursor):
+    try:
+        cursor.close()
+    except Exception as e:
+        logger.error(f'Cursor closing error: {str(e)}')
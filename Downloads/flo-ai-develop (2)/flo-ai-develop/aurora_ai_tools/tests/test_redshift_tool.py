@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for the pooled Redshift connector.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+import pytest
+
+# Add the aurora_ai_tools directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import redshift_connector
+
+from aurora_ai_tools.redshift_tool import RedshiftConfig, RedshiftConnector
+
+ROWS = [(i, f'name-{i}') for i in range(10)]
+
+
+class FakeCursor:
+    """
+    Cursor over ROWS, recording whether it was closed.
+
+    Like the driver, ``execute`` receives a whole result set; server-side
+    cursors are declared with DECLARE and read with FETCH FORWARD.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self.closed = False
+        self._rows = []
+
+    def execute(self, query, parameters=None):
+        time.sleep(self.connection.delay)
+        self.connection.statements.append(query)
+        if query.startswith('INSERT'):
+            self.rowcount = 1
+            return
+        if query.startswith('DECLARE'):
+            self.connection.declared = list(ROWS)
+            return
+        if query.startswith('FETCH FORWARD'):
+            size = int(query.split()[2])
+            rows = self.connection.declared[:size]
+            del self.connection.declared[:size]
+        else:
+            rows = list(ROWS)
+        self.description = [('id',), ('name',)]
+        self._rows = rows
+        self.connection.rows_received += len(rows)
+
+    def fetchmany(self, size):
+        time.sleep(self.connection.delay)
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def fetchall(self):
+        return self.fetchmany(len(self._rows))
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """Connection recording cursors and the threads doing network calls."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.cursors = []
+        self.network_threads = []
+        self.closed = False
+        self.statements = []
+        self.declared = []
+        self.rows_received = 0
+
+    def cursor(self):
+        cursor = FakeCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+    def rollback(self):
+        self.network_threads.append(threading.get_ident())
+
+    def close(self):
+        self.closed = True
+
+
+class Connections(list):
+    """Connections opened so far, and the latency of the next ones."""
+
+    def __init__(self):
+        super().__init__()
+        self.settings = {'connect_delay': 0.0, 'delay': 0.0}
+
+    def connect(self, **kwargs):
+        time.sleep(self.settings['connect_delay'])
+        connection = FakeConnection(self.settings['delay'])
+        self.append(connection)
+        return connection
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Connections opened through redshift_connector.connect"""
+    opened = Connections()
+    monkeypatch.setattr(redshift_connector, 'connect', opened.connect)
+    return opened
+
+
+def make_connector(**overrides):
+    config = RedshiftConfig(
+        username='user',
+        password='secret',
+        host='localhost',
+        port='5439',
+        db_name='dev',
+        **overrides,
+    )
+    return RedshiftConnector(config)
+
+
+class TestQueries:
+    """Test cases for pooled sync and async queries."""
+
+    def test_connection_reused(self, connections):
+        """Test that sequential queries share one pooled connection."""
+        connector = make_connector()
+
+        rows, columns = connector.execute_query('SELECT id, name FROM t')
+        connector.execute_query('SELECT id, name FROM t')
+
+        assert (rows, columns) == (ROWS, ['id', 'name'])
+        assert len(connections) == 1
+        assert all(cursor.closed for cursor in connections[0].cursors)
+
+    def test_insert_closes_cursor(self, connections):
+        """Test that the INSERT path closes its cursor."""
+        connector = make_connector()
+
+        assert connector.execute_query('INSERT INTO t VALUES (1)') == 1
+        assert connections[0].cursors[0].closed
+
+    @pytest.mark.asyncio
+    async def test_row_cap(self, connections):
+        """Test that results are capped at max_rows and flagged as truncated."""
+        connector = make_connector(fetch_batch_size=3, max_rows=4)
+
+        capped = await connector.aexecute_query('SELECT id, name FROM t')
+        full = await connector.aexecute_query('SELECT id, name FROM t', max_rows=100)
+
+        assert (capped.rows, capped.truncated) == (ROWS[:4], True)
+        assert (len(full.rows), full.truncated) == (10, False)
+        connector.close()
+
+    @pytest.mark.asyncio
+    async def test_row_cap_bounds_rows_received(self, connections):
+        """Test that a capped SELECT only receives the rows it keeps, plus one."""
+        connector = make_connector(fetch_batch_size=3, max_rows=4)
+
+        await connector.aexecute_query('SELECT id, name FROM t;')
+
+        statements = connections[0].statements
+        assert statements[0] == 'DECLARE aurora_rows CURSOR FOR SELECT id, name FROM t'
+        assert statements[1:] == [
+            'FETCH FORWARD 3 FROM aurora_rows',
+            'FETCH FORWARD 2 FROM aurora_rows',
+        ]
+        assert connections[0].rows_received == 5
+        connector.close()
+
+    @pytest.mark.asyncio
+    async def test_release_off_the_event_loop(self, connections):
+        """Test that rolling back a released connection runs on a worker thread."""
+        connector = make_connector()
+
+        await connector.aexecute_query('SELECT id, name FROM t')
+
+        assert connections[0].network_threads
+        assert threading.get_ident() not in connections[0].network_threads
+        connector.close()
+
+
+class TestStreaming:
+    """Test cases for astream_query."""
+
+    @pytest.mark.asyncio
+    async def test_batches(self, connections):
+        """Test that rows arrive in fetch_batch_size batches up to max_rows."""
+        connector = make_connector(fetch_batch_size=4)
+
+        batches = [
+            batch
+            async for batch in connector.astream_query(
+                'SELECT id, name FROM t', max_rows=9
+            )
+        ]
+
+        assert [len(batch) for batch in batches] == [4, 4, 1]
+        assert connections[0].rows_received == 9
+        assert connections[0].cursors[0].closed
+        assert threading.get_ident() not in connections[0].network_threads
+        connector.close()
+
+    @pytest.mark.asyncio
+    async def test_early_close_discards_connection(self, connections):
+        """Test that a stream closed early does not return a busy connection."""
+        connector = make_connector(fetch_batch_size=2)
+        stream = connector.astream_query('SELECT id, name FROM t')
+
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert connections[0].closed
+        assert connections[0].cursors[0].closed
+        connector.close()
+
+    @pytest.mark.asyncio
+    async def test_open_stream_does_not_starve_queries(self, connections):
+        """Test that a query waiting for a connection holds no worker thread."""
+        connector = make_connector(pool_size=1, fetch_batch_size=2)
+        stream = connector.astream_query('SELECT id, name FROM t')
+        await stream.__anext__()
+
+        query = asyncio.create_task(connector.aexecute_query('SELECT id, name FROM t'))
+        await asyncio.sleep(0.05)
+        assert not query.done()
+
+        # The stream still gets the single worker thread while the query waits
+        rest = await asyncio.wait_for(_drain(stream), 2)
+        result = await asyncio.wait_for(query, 2)
+
+        assert len(rest) == 4
+        assert result.rows == ROWS
+        connector.close()
+
+
+async def _drain(stream):
+    return [batch async for batch in stream]
+
+
+class TestCancellation:
+    """Test cases for cancelled calls."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_connecting(self, connections):
+        """Test that cancelling while a connection opens does not leak its slot."""
+        connections.settings['connect_delay'] = 0.1
+        connector = make_connector(pool_size=1)
+
+        stream = connector.astream_query('SELECT id, name FROM t')
+        task = asyncio.create_task(stream.__anext__())
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        result = await asyncio.wait_for(
+            connector.aexecute_query('SELECT id, name FROM t'), 2
+        )
+        assert result.rows == ROWS
+        assert len(connections) == 1
+        connector.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_query(self, connections):
+        """Test that a connection is only released once the driver call returns."""
+        connections.settings['delay'] = 0.1
+        connector = make_connector(pool_size=1)
+
+        task = asyncio.create_task(connector.aexecute_query('SELECT id, name FROM t'))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not connections[0].closed
+
+        connections.settings['delay'] = 0.0
+        result = await asyncio.wait_for(
+            connector.aexecute_query('SELECT id, name FROM t', max_rows=2), 2
+        )
+        assert result.rows == ROWS[:2]
+        assert connections[0].closed
+        connector.close()